@@ -1,3 +1,4 @@
+import threading
 from flask import Flask
 from shared.settings import settings
 from shared.db import db
@@ -36,6 +37,12 @@ def create_app():
         register_jobs(scheduler, app)
         scheduler.start()
 
+        # 모델 warm-up (첫 분석 작업이 로딩을 기다리지 않도록, 앱 기동은 막지 않음)
+        if settings.MODEL_WARMUP:
+            from services.analyzer.registry import warm_up_models
+            names = None if "all" in settings.MODEL_WARMUP else settings.MODEL_WARMUP
+            threading.Thread(target=warm_up_models, args=(names,), name="model-warmup", daemon=True).start()
+
     @app.get("/")
     def index():
         return "News Pipeline API"
@@ -1,2 +1,3 @@
 from .article import Article
 from .feed import Feed
+from .keyword_df import KeywordDF
@@ -8,6 +8,7 @@ class Article(db.Model):
     source = db.Column(db.String(200))
     title = db.Column(db.String(1000))
     url = db.Column(db.String(1000), unique=True, index=True)
+    url_canonical = db.Column(db.String(1000), index=True)  # 추적 파라미터/AMP 등 제거한 정규화 URL
     summary_raw = db.Column(db.Text)
     content_raw = db.Column(db.Text)      # 본문(추후 크롤러로 보강)
     published_at = db.Column(db.DateTime)
@@ -16,7 +17,8 @@ class Article(db.Model):
 
     # ↓↓↓ 전처리/중복 관련 필드 추가
     content_clean = db.Column(db.Text)              # HTML/광고 제거 후 텍스트
-    simhash64 = db.Column(db.String(20), index=True)  # 간단한 중복 검사용 64-bit 해시(문자열 저장)
+    content_hash = db.Column(db.String(32), index=True)  # 원문 완전 일치 판별용 blake2b-128 hex
+    simhash64 = db.Column(db.BigInteger, index=True)  # 중복 검사용 64-bit simhash (signed BIGINT로 저장)
     is_duplicate = db.Column(db.Boolean, default=False)
     duplicate_of_id = db.Column(
         db.Integer,
@@ -26,6 +28,12 @@ class Article(db.Model):
     
     keywords_json = db.Column(db.JSON, nullable=True)  # ["키워드1","키워드2",...]
     topic_id = db.Column(db.Integer, index=True, nullable=True)
+    topic_dist = db.Column(db.JSON, nullable=True)  # {"토픽 id": 확률, ...} (topic_id는 argmax)
     summary_gen = db.Column(db.Text)    # 생성 요약(원문 언어)
     summary_ko = db.Column(db.Text)
+
+    # 감성 분석 (분석 파이프라인에서 1회 계산, 메일러는 읽기만)
+    sentiment_label = db.Column(db.String(8))        # pos | neu | neg
+    sentiment_polarity = db.Column(db.Float)         # pos - neg (-1~1)
+    sentiment_dist = db.Column(db.JSON, nullable=True)  # {"pos":..,"neu":..,"neg":..}
     
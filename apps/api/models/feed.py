@@ -7,3 +7,18 @@ class Feed(db.Model):
     url = db.Column(db.String(500), unique=True, nullable=False)
     title = db.Column(db.String(300))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 조건부 GET(ETag / Last-Modified) 상태
+    etag = db.Column(db.String(255))
+    last_modified = db.Column(db.String(64))
+    last_fetched_at = db.Column(db.DateTime)
+
+    # 적응형 폴링 상태 (발행 빈도로 학습한 간격 / 다음 예정 시각)
+    poll_interval_sec = db.Column(db.Integer)
+    next_poll_at = db.Column(db.DateTime, index=True)
+
+    # 수집 상태 / circuit breaker (연속 실패 시 backoff_until까지 건너뜀)
+    fail_count = db.Column(db.Integer, default=0)
+    last_error = db.Column(db.String(500))
+    backoff_until = db.Column(db.DateTime)
+    last_latency_ms = db.Column(db.Integer)
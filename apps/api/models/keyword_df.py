@@ -0,0 +1,12 @@
+from shared.db import db
+from datetime import datetime
+
+# 문서 수(N)를 담는 예약 행 — 키워드 토큰 패턴엔 '_'가 없어서 실제 단어와 겹치지 않음
+DOC_COUNT_TERM = "__docs__"
+
+class KeywordDF(db.Model):
+    """키워드 IDF용 단어별 문서 빈도 (분석 배치마다 누적)"""
+    __tablename__ = "keyword_df"
+    term = db.Column(db.String(100), primary_key=True)   # 소문자 토큰
+    df = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,10 +1,13 @@
 # apps/api/routes/health.py
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, jsonify, current_app, request
 from services.collector.rss import collect_rss_batch
-from services.preprocess.pipeline import preprocess_new_articles
+from services.collector.crawler import crawl_missing_content
+from services.preprocess.pipeline import preprocess_new_articles, preprocess_backlog
 from services.mailer.smtp_gmail import send_daily_newsletter_gmail
 import os, threading
+from datetime import datetime
 from shared.db import db
+from apps.api.models import Feed
 
 bp = Blueprint("health", __name__)
 
@@ -12,13 +15,53 @@ bp = Blueprint("health", __name__)
 def health():
     return jsonify(ok=True)
 
+@bp.get("/feeds/health")
+def feeds_health():
+    """피드별 수집 상태: 연속 실패/차단(circuit open) 여부, 최근 지연, 폴링 일정"""
+    now = datetime.utcnow()
+    rows = []
+    for f in Feed.query.order_by(Feed.id).all():
+        if f.backoff_until and f.backoff_until > now:
+            status = "open"
+        elif f.fail_count:
+            status = "failing"
+        else:
+            status = "ok"
+        rows.append({
+            "url": f.url,
+            "title": f.title,
+            "status": status,
+            "fail_count": f.fail_count or 0,
+            "last_error": f.last_error,
+            "last_latency_ms": f.last_latency_ms,
+            "last_fetched_at": f.last_fetched_at.isoformat() if f.last_fetched_at else None,
+            "backoff_until": f.backoff_until.isoformat() if f.backoff_until else None,
+            "poll_interval_sec": f.poll_interval_sec,
+            "next_poll_at": f.next_poll_at.isoformat() if f.next_poll_at else None,
+        })
+    counts = {s: sum(1 for r in rows if r["status"] == s) for s in ("ok", "failing", "open")}
+    return jsonify(feeds=rows, **counts)
+
+@bp.get("/models/health")
+def models_health():
+    """공용 레지스트리의 모델별 상태/로드 시간/메모리 (로드 안 된 모델은 idle)"""
+    from services.analyzer.registry import registry
+    return jsonify(models=registry.stats())
+
 @bp.post("/collect-now")
 def collect_now():
     n = collect_rss_batch()
     return {"inserted": n}
 
+@bp.post("/crawl-now")
+def crawl_now():
+    return crawl_missing_content()
+
 @bp.post("/preprocess-now")
 def preprocess_now():
+    # ?backlog=1 → 적체분 전체 처리(체크포인트부터), ?resume=0 → 처음부터
+    if request.args.get("backlog") == "1":
+        return preprocess_backlog(resume=request.args.get("resume", "1") != "0")
     result = preprocess_new_articles()
     return result
 
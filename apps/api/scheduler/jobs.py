@@ -1,24 +1,57 @@
+import threading
+
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from flask import current_app
+from shared.settings import settings
 from services.collector.rss import collect_rss_batch
-from services.preprocess.pipeline import preprocess_new_articles
+from services.collector.polling import poll_due_feeds
+from services.collector.crawler import crawl_missing_content
+from services.preprocess.pipeline import preprocess_new_articles, preprocess_backlog
 from services.analyzer.pipeline import analyze_articles
 from services.mailer.smtp_gmail import send_daily_newsletter_gmail
 
+# 일일 파이프라인과 폴링 틱이 겹치지 않게 (둘 다 크롤링/전처리/인덱스·체크포인트를 씀)
+_pipeline_lock = threading.Lock()
+
 def _run_daily_pipeline(app):
-    with app.app_context():
-        current_app.logger.info("[pipeline] start daily collect")
-        n = collect_rss_batch()
-        current_app.logger.info(f"[pipeline] collected {n} items")
+    # 폴링 틱이 돌고 있으면 끝날 때까지 기다렸다가 실행
+    with _pipeline_lock, app.app_context():
+        if settings.POLL_MODE != "adaptive":
+            current_app.logger.info("[pipeline] start daily collect")
+            n = collect_rss_batch()
+            current_app.logger.info(f"[pipeline] collected {n} items")
+
+        if settings.CRAWL_ENABLED:
+            current_app.logger.info("[pipeline] crawl article bodies")
+            r0 = crawl_missing_content()
+            current_app.logger.info(f"[pipeline] crawled: {r0}")
 
-        current_app.logger.info("[pipeline] preprocess")
-        r1 = preprocess_new_articles()
+        # 최신 N건만이 아니라 적체분 전체를 id 순으로 (체크포인트부터 이어서)
+        current_app.logger.info("[pipeline] preprocess backlog")
+        r1 = preprocess_backlog()
         current_app.logger.info(f"[pipeline] preprocessed: {r1}")
 
         current_app.logger.info("[pipeline] analyze")
         r2 = analyze_articles()
         current_app.logger.info(f"[pipeline] analyzed: {r2}")
-        
+
+def _run_poll_tick(app):
+    # 예정 시각이 된 피드만 수집 → 새 글이 있으면 본문 크롤링 + 전처리
+    # 일일 파이프라인이 도는 중이면 이번 틱은 건너뜀 (due 피드는 다음 틱에 그대로 남아 있음)
+    if not _pipeline_lock.acquire(blocking=False):
+        return
+    try:
+        with app.app_context():
+            r = poll_due_feeds()
+            if r["inserted"]:
+                if settings.CRAWL_ENABLED:
+                    crawl_missing_content()
+                r1 = preprocess_new_articles()
+                current_app.logger.info(f"[poller] preprocessed: {r1}")
+    finally:
+        _pipeline_lock.release()
+
 def register_jobs(scheduler, app):
     # 매일 07:30 KST에 실행
     scheduler.add_job(
@@ -29,3 +62,15 @@ def register_jobs(scheduler, app):
         id="daily_pipeline",
         replace_existing=True,
     )
+
+    # 적응형 폴링: 피드별 간격은 poller가 관리, 여기선 주기적으로 due 피드만 확인
+    if settings.POLL_MODE == "adaptive":
+        scheduler.add_job(
+            _run_poll_tick,
+            trigger=IntervalTrigger(seconds=settings.POLL_TICK_SEC),
+            args=[app],
+            id="feed_poll_tick",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
@@ -0,0 +1,42 @@
+# 분석 워커 스케일링 벤치마크(CPU): 프로세스 워커 수별 요약(+기자 추출) 처리량
+# 사용: python bench_analyzer.py [기사 수] [워커 수 목록 (예: 1,2,4)]
+# - 번역 API 호출은 측정에서 제외 (TRANSLATE_PROVIDER=none)
+# - 워커마다 initializer에서 모델을 로드하므로 풀마다 한 번 warm-up 후 측정
+import os, random, sys, time
+
+os.environ.setdefault("TRANSLATE_PROVIDER", "none")
+os.environ.setdefault("SUMMARY_TIME_BUDGET_SEC", "0")  # 예산 없이 전부 정상 티어로
+
+from services.analyzer.pipeline import _get_pool, shutdown_pool
+from services.analyzer.worker import analyze_chunk
+
+
+def article(i: int) -> dict:
+    words = ("the central bank kept rates unchanged on tuesday and said inflation was easing but remained "
+             "above target while officials warned that growth could slow in the second half of the year").split()
+    sents = [" ".join(random.choice(words) for _ in range(random.randint(12, 25))).capitalize() + "."
+             for _ in range(random.randint(10, 60))]
+    text = " ".join(sents)
+    return {"id": i, "text": text, "title": "", "source": "bench",
+            "content_raw": None, "summary_raw": None, "content_clean": text}
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    counts = [int(x) for x in (sys.argv[2] if len(sys.argv) > 2 else "1,2,4").split(",")]
+    random.seed(0)
+    payloads = [article(i) for i in range(n)]
+    print(f"articles={n} words={sum(len(p['text'].split()) for p in payloads)} cpus={os.cpu_count()}")
+
+    base = None
+    for w in counts:
+        pool = _get_pool(w)
+        list(pool.map(analyze_chunk, [payloads[:1]] * w, [None] * w))  # 워커별 모델 로딩은 측정에서 제외
+        size = -(-n // w)
+        chunks = [payloads[i:i + size] for i in range(0, n, size)]
+        t = time.perf_counter()
+        list(pool.map(analyze_chunk, chunks, [None] * len(chunks)))
+        rate = n / (time.perf_counter() - t)
+        base = base or rate
+        print(f"workers={w}: {rate:.2f} articles/s  (x{rate / base:.2f})")
+        shutdown_pool()
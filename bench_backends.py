@@ -0,0 +1,25 @@
+# 추론 백엔드 품질/속도 비교: fp32 vs int8/onnx (고정 코퍼스)
+# 사용: python bench_backends.py <int8|onnx> [sentiment,summary] [corpus.json]
+#   corpus.json: 기사 본문 문자열 리스트 (JSON), 기본은 저장소의 bench_data/backend_corpus.json
+#   (예전 형식 python bench_backends.py corpus.json int8 [tasks] 도 그대로 동작)
+import json, os, sys
+
+from services.analyzer.quality import compare_backends
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_data", "backend_corpus.json")
+
+args = sys.argv[1:]
+corpus = DEFAULT_CORPUS
+if args and args[0].endswith(".json"):
+    corpus = args.pop(0)
+elif len(args) > 2:
+    corpus = args.pop(2)
+if not args:
+    sys.exit("usage: python bench_backends.py <int8|onnx> [sentiment,summary] [corpus.json]")
+
+with open(corpus, encoding="utf-8") as f:
+    texts = [t for t in json.load(f) if isinstance(t, str) and t.strip()]
+tasks = args[1].split(",") if len(args) > 1 else None
+
+print(f"corpus={corpus} ({len(texts)} texts)", file=sys.stderr)
+print(json.dumps(compare_backends(texts, args[0], tasks), ensure_ascii=False, indent=2))
@@ -0,0 +1,35 @@
+# 보일러플레이트 매처 벤치마크: 규칙별 개별 정규식 루프 vs BoilerplateMatcher 단일 스캔
+# 사용: python bench_boilerplate.py [문서 수]
+import random, re, sys, time
+
+from services.preprocess.boilerplate import _RULES, matcher
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+random.seed(0)
+words = ("the market rallied after officials said growth would slow while analysts "
+         "expected rates to remain higher for longer 정부는 이날 발표에서 경제 성장률 전망을 "
+         "하향 조정했다고 밝혔다").split()
+phrases = ["Read more", "Here's what to know", "subscribe now", "자세히 보기", "Opinion", "watch the video"]
+
+def doc():
+    body = " ".join(random.choice(words) for _ in range(random.randint(150, 600)))
+    if random.random() < 0.2:
+        i = random.randint(0, len(body))
+        body = body[:i] + " " + random.choice(phrases) + " " + body[i:]
+    return body
+
+docs = [doc() for _ in range(n)]
+legacy = [re.compile(p, re.I) for _, kind, p, _ in _RULES if kind == "flag"]
+
+t = time.perf_counter()
+old = [any(rx.search(d) for rx in legacy) for d in docs]
+t_old = time.perf_counter() - t
+
+t = time.perf_counter()
+new = [matcher.search(d, kinds=("flag",)) is not None for d in docs]
+t_new = time.perf_counter() - t
+
+assert old == new, "결과 불일치"
+print(f"docs={n} hits={sum(new)}")
+print(f"per-pattern loop : {n / t_old:,.0f} docs/s")
+print(f"single-pass      : {n / t_new:,.0f} docs/s  (x{t_old / t_new:.1f})")
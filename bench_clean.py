@@ -0,0 +1,50 @@
+# HTML 정제 벤치마크: bs4(html.parser) 백엔드 vs lxml 백엔드 (같은 입력, 같은 출력이어야 함)
+# 사용: python bench_clean.py [문서 수]
+import random, sys, time
+
+from services.preprocess.clean import clean_html_to_text, lxml
+
+if lxml is None:
+    sys.exit("lxml not installed")
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+random.seed(0)
+words = ("the market rallied after officials said growth would slow while analysts "
+         "expected rates to remain higher for longer 정부는 이날 발표에서 경제 성장률 전망을 "
+         "하향 조정했다고 밝혔다").split()
+
+def para():
+    return " ".join(random.choice(words) for _ in range(random.randint(5, 40)))
+
+def page():
+    # 실제 기사 페이지처럼: 헤더/내비/광고/스크립트/캡션/관련기사/푸터 사이에 본문 문단
+    parts = [f"<html><head><title>{para()}</title><style>.x{{}}</style></head><body>",
+             '<nav class="gnb"><a href="/">Home</a><a href="/x">Sports</a></nav>',
+             f'<div id="header" role="banner">{para()}</div><article>']
+    for _ in range(random.randint(3, 30)):
+        r = random.random()
+        if r < .1: parts.append(f'<div class="ad  banner">{para()}</div>')
+        elif r < .2: parts.append(f'<p>{para()} <a href="#">{random.choice(["a", "ab", "link text"])}</a> {para()}</p>')
+        elif r < .25: parts.append(f'<div aria-hidden="true">{para()}</div>')
+        elif r < .3: parts.append(f"<script>var x=1;</script>{para()}")
+        elif r < .35: parts.append(f'<figure class="photo"><img src=x><figcaption>{para()}</figcaption></figure>')
+        elif r < .4: parts.append(f'<ul class="related-news"><li>{para()}</li></ul>')
+        else: parts.append(f"<p>{para()}<br>{para()}</p>")
+    parts.append(f'</article><footer>{para()}</footer><div role="contentinfo">c</div></body></html>')
+    return "".join(parts)
+
+docs = [page() for _ in range(n)]
+
+t = time.perf_counter()
+old = [clean_html_to_text(d, "bs4") for d in docs]
+t_old = time.perf_counter() - t
+
+t = time.perf_counter()
+new = [clean_html_to_text(d, "lxml") for d in docs]
+t_new = time.perf_counter() - t
+
+assert old == new, f"결과 불일치 {sum(a != b for a, b in zip(old, new))}/{n}"
+kb = sum(map(len, docs)) / n / 1024
+print(f"docs={n} avg={kb:.1f} KB")
+print(f"bs4  : {n / t_old:,.0f} docs/s")
+print(f"lxml : {n / t_new:,.0f} docs/s  (x{t_old / t_new:.1f})")
@@ -0,0 +1,71 @@
+# 피드 수집 벤치마크: 기존 순차 feedparser.parse vs fetch_feeds(스레드 풀 + 호스트별 동시성 제한)
+# 로컬 픽스처 피드 서버(응답마다 지연)로 네트워크 대기를 흉내 → 외부 접속 없이 재현 가능
+# 사용: python bench_fetch.py [피드 수] [응답 지연(초)]
+import sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import feedparser
+
+from services.collector.fetch import fetch_feeds
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+ITEMS = 20
+ETAG = '"v1"'
+
+
+def rss(feed: str) -> bytes:
+    items = "".join(
+        f"<item><title>{feed} story {i}</title><link>http://example.com/{feed}/{i}?utm_source=rss</link>"
+        f"<description>Body {i}</description><pubDate>Mon, 0{1 + i % 9} Sep 2025 10:00:00 GMT</pubDate></item>"
+        for i in range(ITEMS))
+    return (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed}</title>'
+            f"{items}</channel></rss>").encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(delay)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = rss(self.path.strip("/"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+urls = [f"http://127.0.0.1:{server.server_address[1]}/f{i}" for i in range(n)]
+print(f"feeds={n} latency={delay}s (모든 피드가 같은 호스트 → per_host가 동시성 상한)")
+
+t = time.perf_counter()
+seq = [feedparser.parse(u) for u in urls]
+t_seq = time.perf_counter() - t
+assert sum(len(p.entries) for p in seq) == n * ITEMS
+print(f"sequential         : {t_seq:6.2f}s")
+
+for per_host in (2, 8, 16):
+    t = time.perf_counter()
+    res = fetch_feeds(urls, per_host=per_host)
+    sec = time.perf_counter() - t
+    errors = [r.error for r in res if r.error]
+    assert not errors, errors[:3]
+    assert sum(len(r.parsed.entries) for r in res) == n * ITEMS, "엔트리 수 불일치"
+    print(f"concurrent host={per_host:<3d}: {sec:6.2f}s  (x{t_seq / sec:.1f})")
+
+# 조건부 GET: 두 번째 수집은 ETag로 304 → 본문 다운로드/파싱 없음
+validators = {r.url: (r.etag, r.last_modified) for r in res}
+t = time.perf_counter()
+res = fetch_feeds(urls, validators=validators, per_host=16)
+sec = time.perf_counter() - t
+print(f"conditional (304)  : {sec:6.2f}s  not_modified={sum(r.not_modified for r in res)}/{n}")
+server.shutdown()
@@ -0,0 +1,28 @@
+# 감성 분석 벤치마크(CPU): 기사별 단건 호출 vs analyze_texts_sentiment 배치(길이 버킷)
+# 사용: python bench_sentiment.py [텍스트 수] [배치 크기]
+import random, sys, time
+
+from services.analyzer.sentiment import analyze_text_sentiment, analyze_texts_sentiment, get_pipe
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+bs = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+random.seed(0)
+words = ("stocks rallied after the central bank signalled a pause while investors worried about "
+         "slowing growth and weak earnings 정부는 경기 부양책을 발표했지만 시장 반응은 엇갈렸다").split()
+texts = [" ".join(random.choice(words) for _ in range(random.randint(10, 250))) for _ in range(n)]
+
+get_pipe()  # 모델 로딩은 측정에서 제외
+analyze_text_sentiment(texts[0])
+
+t = time.perf_counter()
+single = [analyze_text_sentiment(x) for x in texts]
+t_single = time.perf_counter() - t
+
+t = time.perf_counter()
+batch = analyze_texts_sentiment(texts, batch_size=bs)
+t_batch = time.perf_counter() - t
+
+same = sum(a["label"] == b["label"] for a, b in zip(single, batch))
+print(f"texts={n} batch_size={bs} label agreement={same}/{n}")
+print(f"single : {n / t_single:.1f} texts/s")
+print(f"batched: {n / t_batch:.1f} texts/s  (x{t_single / t_batch:.1f})")
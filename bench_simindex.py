@@ -0,0 +1,66 @@
+# simhash 근접 중복 조회 벤치마크: 기존 선형 탐색(최근 1500건 / 전체) vs 밴드(LSH) SimHashIndex
+# 질의 = 저장된 해시 하나에서 0~8비트를 뒤집은 값 → 정답은 그 원본 기사 (recall = 원본을 찾은 비율)
+# 사용: python bench_simindex.py [저장 해시 수] [질의 수]
+import random, sys, time
+
+from services.preprocess.dedup import is_near_duplicate
+from services.preprocess.simindex import SimHashIndex
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
+WINDOW = 1500  # 기존 구현: 최근 1500건만 선형 비교
+random.seed(1)
+
+hashes = [random.getrandbits(64) for _ in range(n)]   # id = 위치 + 1
+queries = []
+for _ in range(n_queries):
+    j = random.randrange(n)
+    d = random.randint(0, 8)
+    h = hashes[j]
+    for b in random.sample(range(64), d):
+        h ^= 1 << b
+    queries.append((h, j + 1, d))
+
+def linear_find(h, pool):
+    # 기존 방식: 최신(id 큰) 순으로 훑다가 처음 걸리는 기사 (소스는 하나라 같은 소스 우선 단계는 생략)
+    for aid in range(pool, 0, -1):
+        if is_near_duplicate(h, hashes[aid - 1], char_len=0):
+            return aid
+    return None
+
+def report(name, found, qs, sec):
+    hit = [f == j for f, (_, j, _) in zip(found, qs)]
+    d8 = [x for x, (_, _, d) in zip(hit, qs) if d == 8]
+    print(f"{name:28s} {len(qs) / sec:8,.0f} lookups/s  recall {sum(hit) / len(hit):.3f}"
+          f"  (d=8: {sum(d8) / max(len(d8), 1):.3f})")
+
+print(f"stored={n} queries={n_queries} (distance 0-8)")
+
+# 기존 선형 탐색: 최근 WINDOW건 (오래된 원본은 놓침)
+window_ids = range(n - WINDOW + 1, n + 1)
+qs = queries[:500]
+t = time.perf_counter()
+found = []
+for h, _, _ in qs:
+    found.append(next((aid for aid in reversed(window_ids)
+                       if is_near_duplicate(h, hashes[aid - 1], char_len=0)), None))
+report(f"linear, last {WINDOW}", found, qs, time.perf_counter() - t)
+
+# 기존 선형 탐색을 전체 이력으로 (정확하지만 느림 → 질의 수 줄여서)
+qs = queries[:20]
+t = time.perf_counter()
+found = [linear_find(h, n) for h, _, _ in qs]
+report(f"linear, full {n}", found, qs, time.perf_counter() - t)
+
+for bands, radius in ((4, 2), (4, 1), (8, 0)):  # 첫 번째가 기본값
+    idx = SimHashIndex(bands=bands, probe_radius=radius)
+    t = time.perf_counter()
+    for i, h in enumerate(hashes, 1):
+        idx.add(i, h, "s")
+    t_build = time.perf_counter() - t
+    t = time.perf_counter()
+    found = [idx.find_duplicate(h, "s", char_len=0) for h, _, _ in queries]
+    sec = time.perf_counter() - t
+    cand = sum(len(idx.candidates(h)) for h, _, _ in queries[:500]) / 500
+    report(f"LSH b={bands} r={radius}", found, queries, sec)
+    print(f"{'':28s} build {n / t_build:,.0f} docs/s, ~{cand:.0f} candidates/lookup")
@@ -0,0 +1,32 @@
+# 요약 벤치마크(CPU): 기사별 summarize() 루프 vs summarize_many() 배치(토큰 길이 버킷)
+# 사용: python bench_summarize.py [기사 수] [배치 크기]
+import random, sys, time
+
+from services.analyzer.summarize import get_summarizer, summarize, summarize_many
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+bs = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+random.seed(0)
+words = ("the central bank kept rates unchanged on tuesday and said inflation was easing but remained "
+         "above target while officials warned that growth could slow in the second half of the year").split()
+
+def article():
+    sents = [" ".join(random.choice(words) for _ in range(random.randint(12, 25))).capitalize() + "."
+             for _ in range(random.randint(4, 60))]
+    return " ".join(sents)
+
+texts = [article() for _ in range(n)]
+get_summarizer()  # 모델 로딩은 측정에서 제외
+
+t = time.perf_counter()
+for x in texts:
+    summarize(x)
+t_loop = time.perf_counter() - t
+
+t = time.perf_counter()
+summarize_many(texts, batch_size=bs)
+t_batch = time.perf_counter() - t
+
+print(f"articles={n} words={sum(len(x.split()) for x in texts)} batch_size={bs}")
+print(f"per-article loop: {n / t_loop:.2f} articles/s")
+print(f"summarize_many  : {n / t_batch:.2f} articles/s  (x{t_loop / t_batch:.1f})")
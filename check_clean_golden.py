@@ -0,0 +1,55 @@
+# HTML 정제 골든 코퍼스 동등성 검사: bench_data/clean_golden/*.html → 기대 출력 *.txt
+# 기대 출력은 기준 백엔드(bs4)로 만든 것 → lxml 백엔드가 전부 같아야 HTML_CLEAN_BACKEND 기본값을 바꿀 수 있음
+# 사용: python check_clean_golden.py [백엔드 ...]       (기본: bs4 lxml, 불일치가 있으면 exit 1)
+#       python check_clean_golden.py --update          (bs4 출력으로 *.txt 재생성, 규칙을 바꿨을 때만)
+import difflib, glob, os, sys
+
+from services.preprocess.clean import clean_html_to_text, lxml
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_data", "clean_golden")
+REFERENCE = "bs4"
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _expected_path(html_path):
+    return html_path[:-len(".html")] + ".txt"
+
+
+def _run(html, backend):
+    return (clean_html_to_text(html, backend) or "") + "\n"  # None → 빈 줄 (파일로 비교)
+
+
+cases = sorted(glob.glob(os.path.join(GOLDEN_DIR, "*.html")))
+args = sys.argv[1:]
+
+if "--update" in args:
+    for path in cases:
+        with open(_expected_path(path), "w", encoding="utf-8") as f:
+            f.write(_run(_read(path), REFERENCE))
+    print(f"updated {len(cases)} golden outputs from {REFERENCE}")
+    sys.exit(0)
+
+backends = args or ["bs4", "lxml"]
+if "lxml" in backends and lxml is None:
+    print("lxml not installed → skipping lxml backend")
+    backends = [b for b in backends if b != "lxml"]
+
+failed = 0
+for backend in backends:
+    bad = []
+    for path in cases:
+        want = _read(_expected_path(path))
+        got = _run(_read(path), backend)
+        if got != want:
+            bad.append(os.path.basename(path))
+            diff = difflib.unified_diff(want.split(" "), got.split(" "), "golden", backend, lineterm="", n=2)
+            print(f"--- {os.path.basename(path)} [{backend}]")
+            print("\n".join(list(diff)[2:40]))
+    failed += len(bad)
+    print(f"{backend:5s}: {len(cases) - len(bad)}/{len(cases)} match" + (f"  (mismatch: {', '.join(bad)})" if bad else ""))
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,90 @@
+"""convert articles.simhash64 from String(20) to signed BIGINT
+
+Revision ID: a7d3e95b2c41
+Revises: f2b6d84e0c17
+Create Date: 2026-10-18 14:05:22.831904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e95b2c41'
+down_revision = 'f2b6d84e0c17'
+branch_labels = None
+depends_on = None
+
+_articles = sa.table(
+    'articles',
+    sa.column('id', sa.Integer),
+    sa.column('simhash64', sa.String),
+    sa.column('simhash64_tmp', sa.String),
+)
+
+
+def _copy(conn, convert):
+    # simhash64 → simhash64_tmp (값 변환하며 복사)
+    rows = conn.execute(
+        sa.select(_articles.c.id, _articles.c.simhash64).where(_articles.c.simhash64.isnot(None))
+    ).fetchall()
+    params = []
+    for i, v in rows:
+        try:
+            params.append({"_id": i, "_v": convert(v)})
+        except (TypeError, ValueError):
+            continue
+    if params:
+        conn.execute(
+            _articles.update()
+            .where(_articles.c.id == sa.bindparam("_id"))
+            .values(simhash64_tmp=sa.bindparam("_v")),
+            params,
+        )
+
+
+def _to_signed(v):
+    v = int(v)
+    return v - (1 << 64) if v >= (1 << 63) else v
+
+
+def _to_unsigned_str(v):
+    v = int(v)
+    return str(v + (1 << 64) if v < 0 else v)
+
+
+def upgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('simhash64_tmp', sa.BigInteger(), nullable=True))
+
+    # 부호 없는 64비트 문자열 → signed BIGINT (비트 패턴 유지)
+    _copy(op.get_bind(), _to_signed)
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_index('ix_articles_simhash64')
+        batch_op.drop_column('simhash64')
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.alter_column('simhash64_tmp', new_column_name='simhash64',
+                              existing_type=sa.BigInteger(), existing_nullable=True)
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_articles_simhash64'), ['simhash64'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('simhash64_tmp', sa.String(length=20), nullable=True))
+
+    _copy(op.get_bind(), _to_unsigned_str)
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_index('ix_articles_simhash64')
+        batch_op.drop_column('simhash64')
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.alter_column('simhash64_tmp', new_column_name='simhash64',
+                              existing_type=sa.String(length=20), existing_nullable=True)
+
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_articles_simhash64'), ['simhash64'], unique=False)
@@ -0,0 +1,131 @@
+"""add articles.url_canonical
+
+Revision ID: d9a3f1c6e2b4
+Revises: b41e8c2d7a90
+Create Date: 2026-10-18 10:03:57.118240
+
+"""
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a3f1c6e2b4'
+down_revision = 'b41e8c2d7a90'
+branch_labels = None
+depends_on = None
+
+
+# ---------------------------------------------------------------
+# 이 리비전 시점의 services.collector.canonical.canonicalize_url 고정 사본
+# (앱 코드가 바뀌어도 과거 마이그레이션 결과가 달라지지 않도록 — 수정 금지)
+# ---------------------------------------------------------------
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "ref", "ref_src", "referrer", "cmpid", "cmp",
+    "ocid", "smid", "smtyp", "rss", "taid", "xtor", "at_medium",
+    "at_campaign", "at_custom1", "at_custom2", "ito", "ns_source", "ns_mchannel",
+    "ns_campaign", "ns_linkname", "ns_fee", "sr_share",
+}
+_TRACKING_PREFIXES = ("utm_", "__twitter", "_hs", "pk_", "mtm_")
+_AMP_QUERY = {"amp", "outputtype", "amp_js_v", "usqp"}
+_AMP_SUFFIX_RX = re.compile(r"/amp(?:\.html?)?/?$", re.I)
+_AMP_EXT_RX = re.compile(r"\.amp(\.html?)?$", re.I)
+_AMP_CACHE_RX = re.compile(r"^[^/]+\.cdn\.ampproject\.org$", re.I)
+_HOST_PREFIXES = ("www.", "amp.", "m.", "mobile.")
+_DEFAULT_PORTS = {":80", ":443"}
+
+
+def _is_tracking(key):
+    k = key.lower()
+    return k in _TRACKING_PARAMS or k.startswith(_TRACKING_PREFIXES)
+
+
+def _unwrap_amp_cache(host, path):
+    if not _AMP_CACHE_RX.match(host):
+        return None
+    m = re.match(r"^/(?:[a-z]/)+(?:s/)?([^/]+)(/.*)?$", path, re.I)
+    if not m:
+        return None
+    return m.group(1).lower(), m.group(2) or "/"
+
+
+def _canonicalize_url(url):
+    if not url:
+        return None
+    u = url.strip()
+    if not u:
+        return None
+    if "://" not in u:
+        u = "https://" + u.lstrip("/")
+
+    try:
+        parts = urlsplit(u)
+        port = parts.port
+    except ValueError:
+        return u
+
+    host = (parts.hostname or "").lower()
+    path = parts.path or "/"
+
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        host, path = unwrapped
+
+    for p in _HOST_PREFIXES:
+        if host.startswith(p) and host.count(".") >= 2:
+            host = host[len(p):]
+            break
+
+    netloc = host
+    if port and f":{port}" not in _DEFAULT_PORTS:
+        netloc = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", path)
+    path = _AMP_SUFFIX_RX.sub("", path) or "/"
+    path = _AMP_EXT_RX.sub(r"\1", path)
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(k) and k.lower() not in _AMP_QUERY
+    ]
+    query.sort()
+
+    return urlunsplit(("https", netloc, path, urlencode(query, doseq=True), ""))
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('url_canonical', sa.String(length=1000), nullable=True))
+        batch_op.create_index(batch_op.f('ix_articles_url_canonical'), ['url_canonical'], unique=False)
+
+    # ### end Alembic commands ###
+
+    # 기존 기사 backfill
+    conn = op.get_bind()
+    articles = sa.table('articles', sa.column('id', sa.Integer), sa.column('url', sa.String),
+                        sa.column('url_canonical', sa.String))
+    rows = conn.execute(sa.select(articles.c.id, articles.c.url)).fetchall()
+    params = [{"_id": i, "_canon": _canonicalize_url(u)} for i, u in rows if u]
+    if params:
+        conn.execute(
+            articles.update()
+            .where(articles.c.id == sa.bindparam("_id"))
+            .values(url_canonical=sa.bindparam("_canon")),
+            params,
+        )
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_articles_url_canonical'))
+        batch_op.drop_column('url_canonical')
+
+    # ### end Alembic commands ###
@@ -0,0 +1,84 @@
+import os
+
+from transformers import (AutoTokenizer, AutoModelForSeq2SeqLM, AutoModelForSequenceClassification,
+                          TextClassificationPipeline, pipeline)
+
+from shared.settings import settings
+
+try:
+    import torch
+except ImportError:  # torch 없는 ONNX 전용 설치
+    torch = None
+
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTModelForSequenceClassification
+except ImportError:  # optimum[onnxruntime] 미설치 → onnx 백엔드 사용 불가
+    ORTModelForSeq2SeqLM = ORTModelForSequenceClassification = None
+
+# CPU 추론 백엔드
+# - fp32: 기존 PyTorch 모델 그대로
+# - int8: Linear 레이어 동적 int8 양자화(torch.quantization.quantize_dynamic)
+# - onnx: optimum으로 ONNX 변환 후 ONNX Runtime 실행 (변환 결과는 ONNX_CACHE_DIR에 캐시)
+BACKENDS = ("fp32", "int8", "onnx")
+
+
+def resolve_backend(name: str | None) -> str:
+    """요청 백엔드 → 실제 사용 가능한 백엔드 (의존성이 없으면 fp32)"""
+    b = (name or settings.INFERENCE_BACKEND or "fp32").lower()
+    if b not in BACKENDS:
+        print(f"[inference] ⚠️ unknown backend '{b}' → fp32")
+        return "fp32"
+    if b == "int8" and torch is None:
+        print("[inference] ⚠️ torch not installed → fp32")
+        return "fp32"
+    if b == "onnx" and ORTModelForSeq2SeqLM is None:
+        print("[inference] ⚠️ optimum[onnxruntime] not installed → fp32")
+        return "fp32"
+    return b
+
+
+def _onnx_dir(model_name: str) -> str:
+    return os.path.join(settings.ONNX_CACHE_DIR, model_name.replace("/", "__"))
+
+
+def _load_model(auto_cls, ort_cls, model_name: str, backend: str):
+    if backend == "onnx":
+        path = _onnx_dir(model_name)
+        if os.path.isdir(path):
+            return ort_cls.from_pretrained(path)
+        mdl = ort_cls.from_pretrained(model_name, export=True)
+        mdl.save_pretrained(path)
+        return mdl
+
+    mdl = auto_cls.from_pretrained(model_name)
+    if backend == "int8":
+        mdl = torch.quantization.quantize_dynamic(mdl, {torch.nn.Linear}, dtype=torch.qint8)
+    return mdl
+
+
+def summarization_pipeline(model_name: str, backend: str | None = None):
+    backend = resolve_backend(backend)
+    tok = AutoTokenizer.from_pretrained(model_name)
+    mdl = _load_model(AutoModelForSeq2SeqLM, ORTModelForSeq2SeqLM, model_name, backend)
+    print(f"[inference] summarizer {model_name} (backend={backend})")
+    return pipeline(
+        "summarization",
+        model=mdl,
+        tokenizer=tok,
+        device=-1,  # CPU 환경
+    )
+
+
+def sentiment_pipeline(model_name: str, backend: str | None = None) -> TextClassificationPipeline:
+    backend = resolve_backend(backend)
+    tok = AutoTokenizer.from_pretrained(model_name)
+    mdl = _load_model(AutoModelForSequenceClassification, ORTModelForSequenceClassification, model_name, backend)
+    print(f"[inference] sentiment {model_name} (backend={backend})")
+    return TextClassificationPipeline(
+        task="sentiment-analysis",
+        model=mdl,
+        tokenizer=tok,
+        device=-1,               # CPU
+        return_all_scores=True,
+        truncation=True,
+    )
@@ -0,0 +1,96 @@
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from shared.db import db
+from apps.api.models.keyword_df import KeywordDF, DOC_COUNT_TERM
+
+_IN_CHUNK = 500     # IN (...) 한 번에 넣을 term 수 (sqlite 변수 제한 대비)
+_MAX_TERM_LEN = 100
+
+
+class DocFreqTable:
+    """
+    keyword_df 테이블 기반 문서 빈도
+    - lookup(terms): 저장된 df + 누적 문서 수 N
+    - stage(doc_terms): 배치 기사별 단어 집합을 기억만 (DB 변경 없음)
+    - add_docs(indices): 저장에 성공한 기사만 df/N에 더함 → 실패한 기사는 다음 실행에서 다시 세도 중복 없음
+    - 증가는 DB에서 원자적으로 (행 보장 INSERT ... ON CONFLICT DO NOTHING + UPDATE df = df + :c)
+      → /analyze-now와 일일 잡이 동시에 돌아도 카운트가 사라지지 않음 (커밋은 호출 쪽에서)
+    """
+
+    def __init__(self):
+        self._staged: List[Set[str]] = []
+
+    def lookup(self, terms: Iterable[str]) -> Tuple[Dict[str, int], int]:
+        terms = [t for t in set(terms) if len(t) <= _MAX_TERM_LEN]
+        out: Dict[str, int] = {}
+        for i in range(0, len(terms), _IN_CHUNK):
+            rows = (db.session.query(KeywordDF.term, KeywordDF.df)
+                    .filter(KeywordDF.term.in_(terms[i:i + _IN_CHUNK]))
+                    .all())
+            out.update({t: df for t, df in rows})
+        n = db.session.get(KeywordDF, DOC_COUNT_TERM)
+        return out, (n.df if n else 0)
+
+    def stage(self, doc_terms: Sequence[Set[str]]):
+        """입력 순서대로 기사별 단어 집합 (빈 집합 = df에 안 세는 기사)"""
+        self._staged = list(doc_terms)
+
+    def add_docs(self, indices: Iterable[int]):
+        """stage()에 넘긴 기사 중 indices 위치의 기사만 df/N에 반영"""
+        counts: Counter = Counter()
+        n_docs = 0
+        for i in indices:
+            terms = self._staged[i] if 0 <= i < len(self._staged) else None
+            if terms:
+                counts.update(terms)
+                n_docs += 1
+        self.add(counts, n_docs)
+
+    def add(self, counts: Counter, n_docs: int):
+        if not n_docs:
+            return
+        counts = Counter({t: c for t, c in counts.items() if len(t) <= _MAX_TERM_LEN})
+        counts[DOC_COUNT_TERM] = n_docs
+        terms = sorted(counts)  # 항상 같은 순서로 잠금 → 동시 실행끼리 교착 방지 (Postgres)
+        now = datetime.utcnow()
+
+        # 1) 없는 행만 df=0으로 만들기 (이미 있거나 다른 트랜잭션이 먼저 넣으면 무시)
+        self._ensure_rows(terms, now)
+
+        # 2) 증가는 읽지 않고 DB에서 바로: df = df + :c
+        table = KeywordDF.__table__
+        stmt = (update(table)
+                .where(table.c.term == bindparam("t"))
+                .values(df=table.c.df + bindparam("c"), updated_at=now))
+        db.session.execute(stmt, [{"t": t, "c": counts[t]} for t in terms])
+
+    def _ensure_rows(self, terms: List[str], now: datetime):
+        table = KeywordDF.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            ins = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            stmt = ins(table).on_conflict_do_nothing(index_elements=["term"])
+            for i in range(0, len(terms), _IN_CHUNK):
+                db.session.execute(stmt, [{"term": t, "df": 0, "updated_at": now}
+                                          for t in terms[i:i + _IN_CHUNK]])
+            return
+
+        # 그 밖의 DB: 없는 term만 INSERT, 동시에 먼저 들어간 행은 savepoint 롤백으로 무시
+        existing = set()
+        for i in range(0, len(terms), _IN_CHUNK):
+            existing.update(t for (t,) in db.session.query(KeywordDF.term)
+                            .filter(KeywordDF.term.in_(terms[i:i + _IN_CHUNK])))
+        for t in terms:
+            if t in existing:
+                continue
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(table), [{"term": t, "df": 0, "updated_at": now}])
+            except IntegrityError:
+                pass
@@ -1,7 +1,11 @@
 import re
 import math
 from collections import Counter, defaultdict
-from typing import List, Tuple
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from services.analyzer.registry import registry
 
 # ---- 불용어 (필요 시 계속 보강) ----
 STOPWORDS_EN = {
@@ -117,7 +121,7 @@ def _boost_capitalized(phrase_score: dict, text: str, boost: float = 1.1):
         if any(tok in caps for tok in ph.split()):
             phrase_score[ph] *= boost
 
-def _dedup_phrases(cands: List[Tuple[str, float]], topk: int) -> List[str]:
+def _dedup_phrases(cands: Iterable[Tuple[str, float]], topk: int) -> List[str]:
     def jaccard(a: str, b: str) -> float:
         sa, sb = set(a.split()), set(b.split())
         if not sa or not sb: return 0.0
@@ -142,6 +146,18 @@ def _dedup_phrases(cands: List[Tuple[str, float]], topk: int) -> List[str]:
             break
     return selected
 
+def _load_spacy():
+    import spacy
+    # 가벼운 en_core_web_sm가 없으면 OSError → 레지스트리가 unavailable로 기억
+    return spacy.load("en_core_web_sm")
+
+def _load_keybert():
+    from keybert import KeyBERT
+    return KeyBERT()
+
+registry.register("spacy_en", _load_spacy)
+registry.register("keybert", _load_keybert)
+
 def extract_keywords(text: str, topk: int = 8, title: str = "") -> List[str]:
     t = _normalize(text)
     ti = _normalize(title)
@@ -150,41 +166,56 @@ def extract_keywords(text: str, topk: int = 8, title: str = "") -> List[str]:
     if not corpus:
         return []
 
-    # --- KeyBERT가 있으면 먼저 시도 ---
-    try:
-        from keybert import KeyBERT  # noqa
-        import spacy  # noqa
-        # 가벼운 en_core_web_sm가 없으면 자동 실패 -> except에서 RAKE로
-        nlp = spacy.load("en_core_web_sm")
-        kw_model = KeyBERT()
-        doc = nlp(corpus)
-        # 명사/고유명사만
-        tokens = [tok.text for tok in doc if tok.pos_ in ["NOUN","PROPN"] and not tok.is_stop]
-        if tokens:
-            joined = " ".join(tokens)
-        else:
-            joined = corpus
-        kws = kw_model.extract_keywords(
-            joined,
-            keyphrase_ngram_range=(1,2),
-            stop_words="english",
-            top_n=topk*2,  # 넉넉히 뽑아서 이후 정제
-        )
-        # 스코어로 정렬 → 중복 제거
-        cand = [(k.strip(), float(s)) for k, s in kws if k.strip()]
-        cand.sort(key=lambda x: x[1], reverse=True)
-        out = _dedup_phrases(cand, topk)
-        if out:
-            return out
-    except Exception:
-        pass  # KeyBERT 미설치/로딩 실패 → RAKE fallback
+    # --- KeyBERT가 있으면 먼저 시도 (모델은 프로세스당 한 번 로드, 미설치면 한 번만 확인) ---
+    nlp = registry.try_get("spacy_en")
+    kw_model = registry.try_get("keybert") if nlp is not None else None
+    if kw_model is not None:
+        try:
+            doc = nlp(corpus)
+            # 명사/고유명사만
+            tokens = [tok.text for tok in doc if tok.pos_ in ["NOUN","PROPN"] and not tok.is_stop]
+            if tokens:
+                joined = " ".join(tokens)
+            else:
+                joined = corpus
+            kws = kw_model.extract_keywords(
+                joined,
+                keyphrase_ngram_range=(1,2),
+                stop_words="english",
+                top_n=topk*2,  # 넉넉히 뽑아서 이후 정제
+            )
+            # 스코어로 정렬 → 중복 제거
+            cand = [(k.strip(), float(s)) for k, s in kws if k.strip()]
+            cand.sort(key=lambda x: x[1], reverse=True)
+            out = _dedup_phrases(cand, topk)
+            if out:
+                return out
+        except Exception:
+            pass  # KeyBERT 추론 실패 → RAKE fallback
 
     # --- RAKE Fallback ---
     phrases = _candidate_phrases(corpus)
     if not phrases:
         return []
     ps, freq = _rake_score(phrases)
-    _boost_title(ps, ti)
+    return _rank_phrases(ps, corpus, ti, topk)
+
+GENERIC_POOL = {"government","president","minister","people","country","policy","issue","news","update"}
+
+# 너무 일반적인 단어만으로 구성된 후보 제거 (예: government, people)
+def _is_generic(p: str) -> bool:
+    toks = [w.lower() for w in p.split()]
+    # 고유명사/지명/인명일 가능성(대문자 시작 등)은 살려둠
+    if any(w[:1].isupper() for w in p.split()):
+        return False
+    return all(w in GENERIC_POOL or w in STOPWORDS for w in toks)
+
+# 제목(1.25) × 대문자(1.1) × 길이(최대 4단어 → 1.15) 가중의 상한
+_MAX_BOOST = 1.25 * 1.1 * 1.15
+_SHORTLIST = 8  # 후보가 많으면 topk × 8개만 먼저 가중/정제
+
+def _rank_all(ps: dict, corpus: str, title: str, topk: int) -> Tuple[List[str], float]:
+    _boost_title(ps, title)
     _boost_capitalized(ps, corpus)
 
     # 길이/빈도 기반 약한 정규화 (긴 구에 약간 가산점)
@@ -194,14 +225,104 @@ def extract_keywords(text: str, topk: int = 8, title: str = "") -> List[str]:
         scored.append((ph, sc * length_bonus))
     scored.sort(key=lambda x: x[1], reverse=True)
 
-    # 너무 일반적인 단어만으로 구성된 후보 제거 (예: government, people)
-    def is_generic(p: str) -> bool:
-        toks = [w.lower() for w in p.split()]
-        # 고유명사/지명/인명일 가능성(대문자 시작 등)은 살려둠
-        if any(w[:1].isupper() for w in p.split()): 
-            return False
-        generic_pool = {"government","president","minister","people","country","policy","issue","news","update"}
-        return all(w in generic_pool or w in STOPWORDS for w in toks)
-
-    cleaned = [(ph, sc) for ph, sc in scored if not is_generic(ph)]
-    return _dedup_phrases(cleaned, topk)
+    # 상위 topk개가 채워질 때까지만 검사 (제너레이터)
+    cleaned = ((ph, sc) for ph, sc in scored if not _is_generic(ph))
+    out = _dedup_phrases(cleaned, topk)
+    final = dict(scored)
+    return out, (final[out[-1]] if out else 0.0)
+
+def _rank_phrases(ps: dict, corpus: str, title: str, topk: int) -> List[str]:
+    """
+    구 스코어 → 제목/대문자 가중, 길이 보정, 일반어 제거, 중복 제거
+    - 후보가 많으면 기본 스코어 상위만 먼저 처리하고, 뽑힌 마지막 구가 나머지의 가중 상한보다
+      확실히 높을 때만 그 결과를 씀 (아니면 전체로 다시) → 결과는 전체 처리와 동일
+    """
+    m = topk * _SHORTLIST
+    if len(ps) > m:
+        ranked = sorted(ps.values(), reverse=True)
+        cut = ranked[m]
+        head = {ph: sc for ph, sc in ps.items() if sc > cut}  # 원래 순서 유지(동점 순서 보존)
+        out, last = _rank_all(head, corpus, title, topk)
+        if len(out) == topk and last > cut * _MAX_BOOST:
+            return out
+    return _rank_all(dict(ps), corpus, title, topk)[0]
+
+
+# ---------------------------------------------------------
+# 배치 키워드 (RAKE × IDF)
+# ---------------------------------------------------------
+def extract_keywords_batch(docs: Sequence[Tuple[str, str]], topk: int = 8, df_table=None) -> List[List[str]]:
+    """
+    여러 기사 (본문, 제목) 키워드를 한 번에 (입력 순서대로)
+    - 정규화/토큰화/후보 구 추출은 기사당 한 번
+    - 구 스코어 = RAKE(degree+freq 합) × 구 토큰 IDF 평균 → 그날 모든 기사에 나오는 구는 밀려남
+    - IDF: log((1+N)/(1+df)) + 1, df/N = df_table 누적값 + 이번 배치
+    - df_table: lookup(terms) -> (df dict, N), stage(기사별 단어 집합) (services.analyzer.keyword_df.DocFreqTable)
+      → 누적 df 반영은 호출 쪽에서 저장에 성공한 기사만 (df_table.add_docs)
+    - KeyBERT/spaCy가 있으면 기존처럼 기사별 extract_keywords()
+    """
+    if registry.try_get("spacy_en") is not None and registry.try_get("keybert") is not None:
+        return [extract_keywords(text, topk=topk, title=title) for text, title in docs]
+
+    prepared, lowered = [], []
+    for text, title in docs:
+        ti = _normalize(title)
+        corpus = f"{ti}. {_normalize(text)}".strip()
+        phrases = _candidate_phrases(corpus) if corpus else []
+        prepared.append((corpus, ti, phrases))
+        lowered.append([[w.lower() for w in p] for p in phrases])
+
+    # 문서 빈도 (이번 배치)
+    doc_terms = [{w for lp in lows for w in lp} for lows in lowered]
+    batch_df: Counter = Counter()
+    n_batch = 0
+    for terms in doc_terms:
+        if terms:
+            batch_df.update(terms)
+            n_batch += 1
+    if not batch_df:
+        return [[] for _ in docs]
+
+    vocab = list(batch_df)
+    index = {w: i for i, w in enumerate(vocab)}
+    stored, n_stored = df_table.lookup(vocab) if df_table is not None else ({}, 0)
+    df = np.array([stored.get(w, 0) + batch_df[w] for w in vocab], dtype=np.float64)
+    idf = np.log((1.0 + n_stored + n_batch) / (1.0 + df)) + 1.0
+
+    # 배치 전체 토큰 출현을 평탄화: (기사, 구, 토큰, 구 길이)
+    occ_doc, occ_phrase, occ_tok, occ_len = [], [], [], []
+    phrase_keys: List[Tuple[int, str]] = []
+    for d, ((_, _, phrases), lows) in enumerate(zip(prepared, lowered)):
+        for p, lp in zip(phrases, lows):
+            pid, n = len(phrase_keys), len(lp)
+            phrase_keys.append((d, " ".join(p)))
+            occ_doc.extend([d] * n)
+            occ_phrase.extend([pid] * n)
+            occ_tok.extend(map(index.__getitem__, lp))
+            occ_len.extend([n] * n)
+    occ_doc = np.asarray(occ_doc, dtype=np.int64)
+    occ_phrase = np.asarray(occ_phrase, dtype=np.int64)
+    occ_tok = np.asarray(occ_tok, dtype=np.int64)
+    occ_len = np.asarray(occ_len, dtype=np.float64)
+
+    # 기사별 토큰 freq/degree (기사×토큰 쌍 단위로 집계) → 출현마다 토큰 스코어
+    _, inv = np.unique(occ_doc * len(vocab) + occ_tok, return_inverse=True)
+    freq = np.bincount(inv)
+    degree = np.bincount(inv, weights=occ_len - 1)
+    tok_score = (freq + degree)[inv]
+
+    n_phrases = len(phrase_keys)
+    rake = np.bincount(occ_phrase, weights=tok_score, minlength=n_phrases)
+    plen = np.bincount(occ_phrase, minlength=n_phrases)
+    pidf = np.bincount(occ_phrase, weights=idf[occ_tok], minlength=n_phrases) / np.maximum(plen, 1)
+    scores = rake * pidf
+
+    per_doc: List[dict] = [{} for _ in docs]
+    for (d, ph), sc in zip(phrase_keys, scores.tolist()):
+        per_doc[d][ph] = sc
+
+    if df_table is not None:
+        df_table.stage(doc_terms)
+
+    return [_rank_phrases(ps, corpus, ti, topk) if ps else []
+            for ps, (corpus, ti, _) in zip(per_doc, prepared)]
@@ -1,42 +1,97 @@
 import concurrent.futures
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from shared.db import db
+from shared.settings import settings
 from apps.api.models import Article
-from services.analyzer.keywords import extract_keywords
+from services.analyzer.keywords import extract_keywords, extract_keywords_batch
+from services.analyzer.keyword_df import DocFreqTable
 from services.translate.translate import translate_to_ko
 from services.analyzer.byline import pick_author
+from services.analyzer.worker import analyze_chunk, init_worker, to_payload
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+_WORKER_MODELS = ("summarizer",)  # 워커 프로세스에서 미리 로드할 모델 (감성은 부모에서 배치)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """분석 워커 풀 (프로세스 공용, 워커마다 initializer에서 모델 1회 로드, 워커 수가 바뀌면 재생성)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            threads = settings.ANALYZER_TORCH_THREADS or max(1, (os.cpu_count() or 1) // workers)
+            # 스케줄러 스레드가 도는 프로세스에서 fork하면 잠금 상태가 복제될 수 있어 spawn 사용
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=init_worker, initargs=(threads, _WORKER_MODELS))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+def _base_text(a) -> str:
+    return (a.content_clean or a.summary_raw or a.title or "")
+
 
+def _apply_keywords_topic(a, lda, base_text: str, keywords=None, topic=None):
+    # 1) 키워드 — 배치 키워드 결과가 없으면 단건 추출
+    if keywords is None:
+        keywords = extract_keywords(base_text, topk=8, title=(a.title or ""))
+    a.keywords_json = keywords
 
-def _analyze_single_article(a, lda):
+    # 2) 토픽 — 배치 추론 결과 (topic_id, 분포)가 없으면 단건 추론
+    if topic is None:
+        topic = (lda.infer_topic(base_text), None)
+    a.topic_id, a.topic_dist = topic
+
+
+def _apply_author(a, author):
+    if hasattr(a, "author") and (author and not a.author):
+        a.author = author
+    elif hasattr(a, "meta_json"):
+        try:
+            meta = a.meta_json or {}
+            if author:
+                meta["author_extracted"] = author
+            a.meta_json = meta
+        except Exception:
+            pass
+
+
+def _analyze_single_article(a, lda, long_sum=None, keywords=None, topic=None):
     from services.analyzer.summarize import summarize
 
-    base_text = (a.content_clean or a.summary_raw or a.title or "")
+    base_text = _base_text(a)
     if not base_text.strip():
         return None
 
     try:
-        # 1) 키워드
-        a.keywords_json = extract_keywords(base_text, topk=8, title=(a.title or ""))
+        # 1) 키워드 / 2) 토픽
+        _apply_keywords_topic(a, lda, base_text, keywords, topic)
 
-        # 2) 토픽
-        a.topic_id = lda.infer_topic(base_text)
-
-        # 3) 요약 (길게)
-        long_sum = summarize(base_text, base_min_sentences=4, length_factor=3.0)
+        # 3) 요약 (길게) — 티어 요약 결과가 없으면 단건 요약
+        if long_sum is None:
+            long_sum = summarize(base_text, base_min_sentences=4, length_factor=3.0)
         a.summary_gen = long_sum
         a.summary_ko = translate_to_ko(long_sum or base_text, source_lang=None)
 
         # 4) 기자 이름 추출
-        author = pick_author(a)
-        if hasattr(a, "author") and (author and not a.author):
-            a.author = author
-        elif hasattr(a, "meta_json"):
-            try:
-                meta = a.meta_json or {}
-                if author:
-                    meta["author_extracted"] = author
-                a.meta_json = meta
-            except Exception:
-                pass
+        _apply_author(a, pick_author(a))
 
         return a
     except Exception as e:
@@ -44,8 +99,166 @@ def _analyze_single_article(a, lda):
         return None
 
 
+def _sentiment_text(a) -> str:
+    # 메일에 표시되는 요약 기준(없으면 본문), 너무 길면 오래 걸리니 1200자 정도 컷
+    base = (a.summary_gen or a.summary_ko or a.content_clean or a.summary_raw or a.title or "")
+    return base[:1200] if base.strip() else ""
+
+
+def _attach_sentiment(articles) -> int:
+    """감성 라벨/극성/분포를 Article 컬럼에 기록 (배치 추론 1회)"""
+    from services.analyzer.sentiment import analyze_texts_sentiment
+
+    if not articles:
+        return 0
+    try:
+        results = analyze_texts_sentiment([_sentiment_text(a) for a in articles])
+    except Exception as e:
+        print(f"[analyzer] ⚠️ sentiment failed: {e}")
+        return 0
+
+    n = 0
+    for a, s in zip(articles, results):
+        if not s:
+            continue
+        a.sentiment_label = s["label"]
+        a.sentiment_polarity = s["polarity"]
+        a.sentiment_dist = s["dist"]
+        n += 1
+    return n
+
+
+def _backfill_sentiment(limit: int) -> int:
+    # 감성 컬럼 도입 전에 분석된 기사 보충
+    items = (Article.query
+             .filter(Article.is_duplicate.is_(False))
+             .filter(Article.summary_gen.isnot(None))
+             .filter(Article.sentiment_label.is_(None))
+             .order_by(Article.id.desc())
+             .limit(limit)
+             .all())
+    n = _attach_sentiment(items)
+    if n:
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[analyzer] ⚠️ sentiment backfill commit failed: {e}")
+            return 0
+    return n
+
+
+def _count_tiers(tiers) -> dict:
+    counts: dict = {}
+    for t in tiers:
+        if t:
+            counts[t] = counts.get(t, 0) + 1
+    return counts
+
+
+def _summarize_items(items) -> tuple[list, dict]:
+    from services.analyzer.summarize import summarize_tiered
+
+    # 길이/소스로 티어 선택, 생성 요약은 시간 예산 안에서만 (넘치면 추출 요약)
+    summaries, tiers = summarize_tiered([_base_text(a) for a in items], [a.source for a in items])
+    return summaries, _count_tiers(tiers)
+
+
+def _keywords_items(items, df_table: DocFreqTable) -> list:
+    # 배치 전체를 한 번에 토큰화, keyword_df 누적 문서 빈도로 IDF 가중 (df 갱신은 기사 저장 성공 후)
+    try:
+        return extract_keywords_batch([(_base_text(a), a.title or "") for a in items], topk=8,
+                                      df_table=df_table)
+    except Exception as e:
+        db.session.rollback()  # df 조회 중 DB 오류면 세션 정리 (기사 변경 전이라 잃는 것 없음)
+        print(f"[analyzer] ⚠️ batch keywords failed, falling back to per-article: {e}")
+        return [None] * len(items)
+
+
+def _topics_items(lda, items) -> list:
+    # 배치 전체를 행렬 하나로 추론, argmax와 분포를 함께 저장 (랭킹/메일 묶음에서 재추론 없이 사용)
+    try:
+        topics, dists = lda.infer_topics([_base_text(a) for a in items])
+        return list(zip(topics, dists))
+    except Exception as e:
+        print(f"[analyzer] ⚠️ batch topic inference failed, falling back to per-article: {e}")
+        return [None] * len(items)
+
+
+def _analyze_in_threads(items, lda, keywords, topics, workers: int) -> tuple[list, dict]:
+    # 요약: 기사들의 청크를 모아 토큰 길이별 배치 생성 (스레드마다 모델을 따로 부르지 않음)
+    summaries, tiers = _summarize_items(items)
+
+    analyzed = []
+    # 스레드 워커 (번역/기자) — 번역 API 대기가 대부분이라 스레드로 충분
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_analyze_single_article, a, lda, sm, kw, tp)
+                   for a, sm, kw, tp in zip(items, summaries, keywords, topics)]
+        for f in concurrent.futures.as_completed(futures):
+            result = f.result()
+            if result:
+                analyzed.append(result)
+    return analyzed, tiers
+
+
+def _analyze_in_processes(items, lda, keywords, topics, workers: int) -> tuple[list, dict]:
+    """
+    프로세스 워커 모드: 요약/번역/기자 추출은 워커에서 (id+텍스트 payload → 결과 dict),
+    ORM 객체 기록은 부모에서. 워커에서 예외가 나면(풀이 깨진 경우 포함) 그 청크만 현재 프로세스에서 다시 분석
+    """
+    work = {a.id: (a, kw, tp) for a, kw, tp in zip(items, keywords, topics) if _base_text(a).strip()}
+    payloads = [to_payload(a, _base_text(a)) for a, _, _ in work.values()]
+    if not payloads:
+        return [], {}
+
+    budget = settings.SUMMARY_TIME_BUDGET_SEC
+    deadline = time.time() + budget if budget > 0 else None  # 워커 프로세스와 공유하는 벽시계 마감
+    size = -(-len(payloads) // workers)  # 워커당 한 청크 → 워커 안에서 요약 배치가 커지도록
+    chunks = [payloads[i:i + size] for i in range(0, len(payloads), size)]
+    try:
+        futures = [_get_pool(workers).submit(analyze_chunk, c, deadline) for c in chunks]
+        broken = False
+    except BrokenProcessPool:
+        shutdown_pool()
+        futures, broken = [None] * len(chunks), True
+
+    results = []
+    for chunk, fut in zip(chunks, futures):
+        if not broken:
+            try:
+                results.append(fut.result())
+                continue
+            except BrokenProcessPool:
+                # 남은 future도 같은 풀이라 실패 → 이후 청크는 바로 현재 프로세스에서
+                print("[analyzer] ⚠️ worker pool broken, analyzing remaining chunks in-process")
+                shutdown_pool()  # 다음 호출에서 새 풀 생성
+                broken = True
+            except Exception as e:
+                print(f"[analyzer] ⚠️ worker chunk failed ({type(e).__name__}: {e}), analyzing it in-process")
+        try:
+            results.append(analyze_chunk(chunk, deadline))
+        except Exception as e:
+            print(f"[analyzer] ⚠️ chunk of {len(chunk)} articles failed in-process: {e}")  # 다음 실행에서 재시도
+
+    analyzed, tiers = [], []
+    for r in (r for chunk in results for r in chunk):
+        a, kw, tp = work[r["id"]]
+        tiers.append(r["tier"])
+        if r.get("failed"):
+            continue
+        try:
+            _apply_keywords_topic(a, lda, _base_text(a), kw, tp)
+            a.summary_gen = r["summary_gen"]
+            a.summary_ko = r["summary_ko"]
+            _apply_author(a, r["author"])
+            analyzed.append(a)
+        except Exception as e:
+            print(f"[analyzer] ⚠️ article {a.id} failed: {e}")
+    return analyzed, _count_tiers(tiers)
+
+
 def analyze_articles(batch_size: int = 50) -> dict:
-    from services.analyzer.topics import TinyLDAModel
+    from services.analyzer.topics import get_topic_model
 
     q = (Article.query
          .filter(Article.is_duplicate.is_(False))
@@ -54,25 +267,37 @@ def analyze_articles(batch_size: int = 50) -> dict:
          .limit(batch_size))
     items = q.all()
     if not items:
-        return {"analyzed": 0}
+        return {"analyzed": 0, "sentiment_backfilled": _backfill_sentiment(batch_size)}
 
-    # LDA 학습
-    recent = (Article.query
-              .filter(Article.content_clean.isnot(None))
-              .order_by(Article.id.desc())
-              .limit(300)
-              .all())
-    lda = TinyLDAModel(num_topics=5)
-    lda.fit([a.content_clean or "" for a in recent])
+    # LDA: 처음 한 번은 이번 배치를 뺀 최근 300건으로 부트스트랩 (새 기사 학습은 커밋 성공 후)
+    lda = get_topic_model()
+    if not lda.is_fitted:
+        try:
+            recent = (Article.query
+                      .filter(Article.content_clean.isnot(None))
+                      .filter(Article.id.notin_([a.id for a in items]))
+                      .order_by(Article.id.desc())
+                      .limit(300)
+                      .all())
+            lda.update([a.content_clean or "" for a in recent])
+        except Exception as e:
+            print(f"[analyzer] ⚠️ topic model bootstrap failed: {e}")
 
-    analyzed = []
-    # CPU 4코어 기준: 4개 병렬 워커
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        futures = [executor.submit(_analyze_single_article, a, lda) for a in items]
-        for f in concurrent.futures.as_completed(futures):
-            result = f.result()
-            if result:
-                analyzed.append(result)
+    # 키워드/토픽: DB·디스크 상태를 쓰는 배치 단계라 항상 부모에서
+    df_table = DocFreqTable()
+    keywords = _keywords_items(items, df_table)
+    topics = _topics_items(lda, items)
+
+    workers = max(1, settings.ANALYZER_WORKERS)
+    executor = settings.ANALYZER_EXECUTOR
+    if executor == "process":
+        analyzed, tiers = _analyze_in_processes(items, lda, keywords, topics, workers)
+    else:
+        executor = "thread"
+        analyzed, tiers = _analyze_in_threads(items, lda, keywords, topics, workers)
+
+    # 감성: 요약이 나온 기사 전체를 한 번에 (발송 시점엔 읽기만)
+    sentiment = _attach_sentiment(analyzed)
 
     # DB에 저장
     try:
@@ -81,5 +306,22 @@ def analyze_articles(batch_size: int = 50) -> dict:
     except Exception as e:
         db.session.rollback()
         print(f"[analyzer] ⚠️ commit failed: {e}")
+        analyzed = []
+
+    # keyword_df: 저장된 기사만 문서 빈도에 반영 (실패한 기사는 다음 실행에서 한 번만 세어짐)
+    saved = {a.id for a in analyzed}
+    try:
+        df_table.add_docs(i for i, a in enumerate(items) if a.id in saved)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[analyzer] ⚠️ keyword df update failed: {e}")
+
+    # LDA: 저장까지 끝난 기사로만 온라인 갱신(+디스크 저장) → 실패/롤백된 기사를 다음 실행에서 두 번 학습하지 않음
+    try:
+        lda.update([a.content_clean or "" for a in analyzed])
+    except Exception as e:
+        print(f"[analyzer] ⚠️ topic model update failed: {e}")
 
-    return {"analyzed": len(analyzed)}
+    return {"analyzed": len(analyzed), "executor": executor, "summary_tiers": tiers, "sentiment": sentiment,
+            "sentiment_backfilled": _backfill_sentiment(batch_size)}
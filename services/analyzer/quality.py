@@ -0,0 +1,81 @@
+import time
+from typing import Dict, List, Optional, Sequence
+
+_TOKEN_SPLIT = str.split
+
+
+def rouge_l_f1(ref: str, hyp: str) -> float:
+    """토큰 단위 ROUGE-L F1 (LCS 기반)"""
+    a, b = _TOKEN_SPLIT(ref or ""), _TOKEN_SPLIT(hyp or "")
+    if not a or not b:
+        return 1.0 if not a and not b else 0.0
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b, 1):
+            cur.append(prev[j - 1] + 1 if x == y else max(prev[j], cur[j - 1]))
+        prev = cur
+    lcs = prev[-1]
+    if not lcs:
+        return 0.0
+    p, r = lcs / len(b), lcs / len(a)
+    return 2 * p * r / (p + r)
+
+
+def _compare_sentiment(texts: Sequence[str], ref_pipe, cand_pipe) -> Dict:
+    from services.analyzer.sentiment import analyze_texts_sentiment
+
+    t0 = time.perf_counter()
+    ref = analyze_texts_sentiment(texts, pipe=ref_pipe)
+    t1 = time.perf_counter()
+    cand = analyze_texts_sentiment(texts, pipe=cand_pipe)
+    t2 = time.perf_counter()
+
+    pairs = [(r, c) for r, c in zip(ref, cand) if r and c]
+    n = max(1, len(pairs))
+    return {
+        "label_agreement": sum(r["label"] == c["label"] for r, c in pairs) / n,
+        "polarity_mae": sum(abs(r["polarity"] - c["polarity"]) for r, c in pairs) / n,
+        "fp32_sec": round(t1 - t0, 2),
+        "backend_sec": round(t2 - t1, 2),
+    }
+
+
+def _compare_summary(texts: Sequence[str], ref_pipe, cand_pipe) -> Dict:
+    from services.analyzer.summarize import summarize_many
+
+    t0 = time.perf_counter()
+    ref = summarize_many(texts, pipe=ref_pipe)
+    t1 = time.perf_counter()
+    cand = summarize_many(texts, pipe=cand_pipe)
+    t2 = time.perf_counter()
+
+    scores = [rouge_l_f1(r, c) for r, c in zip(ref, cand) if r is not None and c is not None]
+    return {
+        "rougeL_f1_mean": sum(scores) / len(scores) if scores else 0.0,
+        "rougeL_f1_min": min(scores) if scores else 0.0,
+        "fp32_sec": round(t1 - t0, 2),
+        "backend_sec": round(t2 - t1, 2),
+    }
+
+
+def compare_backends(texts: Sequence[str], backend: str, tasks: Optional[List[str]] = None) -> Dict:
+    """
+    고정 코퍼스에서 fp32 결과와 지정 백엔드(int8/onnx) 결과 비교
+    - 감성: 라벨 일치율, 극성 평균 절대 오차
+    - 요약: fp32 요약 대비 ROUGE-L F1 (평균/최소)
+    - 각 작업의 소요 시간(모델 로딩 제외)
+    """
+    from services.analyzer.backends import resolve_backend, sentiment_pipeline, summarization_pipeline
+    from services.analyzer.sentiment import _MODEL_NAME as SENTIMENT_MODEL
+    from services.analyzer.summarize import MODEL_NAME as SUMMARY_MODEL
+
+    tasks = tasks or ["sentiment", "summary"]
+    report = {"backend": resolve_backend(backend), "n": len(texts)}
+    if "sentiment" in tasks:
+        report["sentiment"] = _compare_sentiment(
+            texts, sentiment_pipeline(SENTIMENT_MODEL, "fp32"), sentiment_pipeline(SENTIMENT_MODEL, backend))
+    if "summary" in tasks:
+        report["summary"] = _compare_summary(
+            texts, summarization_pipeline(SUMMARY_MODEL, "fp32"), summarization_pipeline(SUMMARY_MODEL, backend))
+    return report
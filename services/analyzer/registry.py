@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, Optional
+
+try:
+    import psutil
+except ImportError:  # 없으면 /proc/self/statm (리눅스) 으로 RSS 측정
+    psutil = None
+
+
+class ModelUnavailable(RuntimeError):
+    """모델/라이브러리가 이 프로세스에서 쓸 수 없음 (한 번 실패하면 다시 로드하지 않음)"""
+
+
+@dataclass
+class ModelStats:
+    name: str
+    status: str = "idle"                 # idle | loaded | unavailable | failed
+    load_sec: Optional[float] = None
+    rss_mb: Optional[float] = None       # 로드 전후 프로세스 RSS 차이 (대략적인 모델 메모리)
+    loaded_at: Optional[float] = None    # time.time()
+    error: Optional[str] = None
+
+
+def _rss_mb() -> Optional[float]:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 2**20
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class ModelRegistry:
+    """
+    프로세스 공용 모델 레지스트리
+    - register(name, loader): 로더만 등록, 실제 로드는 처음 get() 할 때 한 번
+    - 로드는 락 하나로 직렬화 → 스레드가 동시에 불러도 한 번만 로드, RSS 차이도 모델별로 분리됨
+    - ImportError/OSError(미설치 패키지, spaCy 모델 없음 등)는 unavailable로 기억 → 이후엔 바로 ModelUnavailable
+    - 그 밖의 예외는 failed로 기록하고 다음 get()에서 재시도
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], object]] = {}
+        self._models: Dict[str, object] = {}
+        self._stats: Dict[str, ModelStats] = {}
+        self._lock = threading.RLock()  # 로더 안에서 다른 모델을 get() 해도 되도록 RLock
+
+    def register(self, name: str, loader: Callable[[], object]):
+        """로더 등록 (같은 이름으로 다시 등록하면 기존 인스턴스/상태는 버림)"""
+        with self._lock:
+            self._loaders[name] = loader
+            self._models.pop(name, None)
+            self._stats[name] = ModelStats(name)
+
+    def get(self, name: str):
+        m = self._models.get(name)
+        if m is not None:
+            return m
+        with self._lock:
+            m = self._models.get(name)
+            if m is not None:
+                return m
+            st = self._stats.get(name)
+            if st is None:
+                raise KeyError(f"model '{name}' is not registered")
+            if st.status == "unavailable":
+                raise ModelUnavailable(f"{name}: {st.error}")
+            return self._load(name, st)
+
+    def try_get(self, name: str):
+        """없거나 로드 실패면 None (fallback 경로용)"""
+        try:
+            return self.get(name)
+        except ModelUnavailable:
+            return None
+        except Exception as e:
+            print(f"[models] ⚠️ {name} load failed: {e}")
+            return None
+
+    def _load(self, name: str, st: ModelStats):
+        rss0 = _rss_mb()
+        t0 = time.perf_counter()
+        try:
+            m = self._loaders[name]()
+        except (ImportError, OSError) as e:
+            st.status, st.error = "unavailable", f"{type(e).__name__}: {e}"
+            print(f"[models] {name} unavailable in this process ({st.error})")
+            raise ModelUnavailable(f"{name}: {st.error}") from e
+        except Exception as e:
+            st.status, st.error = "failed", f"{type(e).__name__}: {e}"
+            raise
+        st.load_sec = round(time.perf_counter() - t0, 3)
+        rss1 = _rss_mb()
+        st.rss_mb = round(rss1 - rss0, 1) if rss0 is not None and rss1 is not None else None
+        st.status, st.error, st.loaded_at = "loaded", None, time.time()
+        self._models[name] = m
+        print(f"[models] {name} loaded in {st.load_sec:.1f}s (+{st.rss_mb} MB)")
+        return m
+
+    def is_available(self, name: str) -> bool:
+        st = self._stats.get(name)
+        return st is not None and st.status != "unavailable"
+
+    def warm_up(self, names: Iterable[str] | None = None) -> Dict[str, dict]:
+        """지정한(기본: 등록된 전체) 모델을 미리 로드, 실패해도 계속 진행"""
+        for name in list(names or self._loaders):
+            if name not in self._loaders:
+                print(f"[models] ⚠️ warm-up: unknown model '{name}'")
+                continue
+            self.try_get(name)
+        return self.stats()
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: asdict(st) for name, st in self._stats.items()}
+
+
+registry = ModelRegistry()
+
+
+def warm_up_models(names: Iterable[str] | None = None) -> Dict[str, dict]:
+    """
+    분석 모듈을 import 해서 로더를 등록시킨 뒤 warm-up (앱 시작 시 백그라운드 스레드에서 호출)
+    - transformers 미설치면 요약/감성 모듈 import 자체가 실패 → 해당 모듈은 건너뜀
+    """
+    for mod in ("keywords", "summarize", "sentiment"):
+        try:
+            __import__(f"services.analyzer.{mod}")
+        except ImportError as e:
+            print(f"[models] ⚠️ warm-up: services.analyzer.{mod} not importable ({e})")
+    return registry.warm_up(names)
@@ -1,28 +1,23 @@
 import os, re
-from typing import Optional, Dict
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, TextClassificationPipeline
+from typing import Optional, Dict, List, Sequence
+from transformers import TextClassificationPipeline
+
+from shared.settings import settings
+from services.analyzer.backends import sentiment_pipeline
+from services.analyzer.registry import registry
 
 _MODEL_NAME = os.getenv("HF_SENTIMENT_MODEL", "cardiffnlp/twitter-xlm-roberta-base-sentiment")
-_pipe: Optional[TextClassificationPipeline] = None
+_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+_MAX_CHARS = 4096
 _RX = re.compile(r"\s+")
 
+registry.register("sentiment", lambda: sentiment_pipeline(_MODEL_NAME, settings.SENTIMENT_BACKEND))
+
 def _clean(s: str) -> str:
     return _RX.sub(" ", (s or "").strip())
 
 def get_pipe() -> TextClassificationPipeline:
-    global _pipe
-    if _pipe is None:
-        tok = AutoTokenizer.from_pretrained(_MODEL_NAME)
-        mdl = AutoModelForSequenceClassification.from_pretrained(_MODEL_NAME)
-        _pipe = TextClassificationPipeline(
-            task="sentiment-analysis",
-            model=mdl,
-            tokenizer=tok,
-            device=-1,               # CPU
-            return_all_scores=True,
-            truncation=True,
-        )
-    return _pipe
+    return registry.get("sentiment")
 
 def _norm_label(lbl: str) -> str:
     l = (lbl or "").strip().lower()
@@ -38,12 +33,7 @@ def _norm_label(lbl: str) -> str:
     if "pos" in l: return "pos"
     return "neu"  # 기본값은 중립
 
-def analyze_text_sentiment(text: str) -> Optional[Dict]:
-    t = _clean(text)
-    if not t:
-        return None
-
-    out = get_pipe()(t[:4096])[0]
+def _to_result(out) -> Dict:
     scores = {"pos": 0.0, "neu": 0.0, "neg": 0.0}
     for x in out:
         k = _norm_label(x.get("label"))
@@ -61,3 +51,28 @@ def analyze_text_sentiment(text: str) -> Optional[Dict]:
         "polarity": polarity,
         "dist": scores,
     }
+
+def analyze_texts_sentiment(texts: Sequence[str], batch_size: Optional[int] = None,
+                            pipe: Optional[TextClassificationPipeline] = None) -> List[Optional[Dict]]:
+    """
+    여러 텍스트 한 번에 감성 분석 (입력 순서대로 결과, 빈 텍스트는 None)
+    - 길이(문자 수) 순으로 정렬해 batch_size씩 묶음 → 배치 안 패딩 길이 최소화
+    - pipe: 백엔드 비교 등 다른 파이프라인으로 돌릴 때 (기본은 공용 get_pipe())
+    """
+    bs = max(1, batch_size or _BATCH_SIZE)
+    cleaned = [_clean(t)[:_MAX_CHARS] for t in texts]
+    results: List[Optional[Dict]] = [None] * len(cleaned)
+    order = sorted((i for i, t in enumerate(cleaned) if t), key=lambda i: len(cleaned[i]))
+    if not order:
+        return results
+
+    pipe = pipe or get_pipe()
+    for start in range(0, len(order), bs):
+        bucket = order[start:start + bs]
+        outs = pipe([cleaned[i] for i in bucket], batch_size=len(bucket))
+        for i, out in zip(bucket, outs):
+            results[i] = _to_result(out)
+    return results
+
+def analyze_text_sentiment(text: str) -> Optional[Dict]:
+    return analyze_texts_sentiment([text])[0]
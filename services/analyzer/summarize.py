@@ -1,25 +1,25 @@
+import math
 import os
 import re
-from typing import List
-from transformers import pipeline
+import time
+from typing import List, Optional, Sequence
+
+from shared.settings import settings
+from services.analyzer.backends import summarization_pipeline
+from services.analyzer.registry import registry
 
 # ---------------------------------------------------------
 # 설정
 # ---------------------------------------------------------
 MODEL_NAME = os.getenv("HF_SUMMARY_MODEL", "facebook/mbart-large-50-many-to-many-mmt")
-_summarizer = None
+BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))   # summarize_many 배치 크기
+
+# SUMMARY_BACKEND(기본 INFERENCE_BACKEND): fp32 | int8 | onnx
+registry.register("summarizer", lambda: summarization_pipeline(MODEL_NAME, settings.SUMMARY_BACKEND))
 
 def get_summarizer():
-    """HuggingFace summarization pipeline lazy load"""
-    global _summarizer
-    if _summarizer is None:
-        _summarizer = pipeline(
-            "summarization",
-            model=MODEL_NAME,
-            tokenizer=MODEL_NAME,
-            device=-1,  # CPU 환경
-        )
-    return _summarizer
+    """HuggingFace summarization pipeline (프로세스 공용 레지스트리에서 한 번만 로드)"""
+    return registry.get("summarizer")
 
 
 # ---------------------------------------------------------
@@ -50,14 +50,11 @@ def _merge_by_limit(sents: List[str], max_words: int) -> List[str]:
 # ---------------------------------------------------------
 # Summarization Core
 # ---------------------------------------------------------
-def _gen(pipe, text: str, max_new_tokens: int, min_length: int) -> str:
-    """모델 호출 유틸 (오류 방지용 동적 길이 보정 포함)"""
+def _gen_kwargs(max_new_tokens: int, min_length: int) -> dict:
     # 안전한 길이 제한 (짧은 입력 대비)
     max_new_tokens = max(80, min(max_new_tokens, 1024))
     min_length = min(min_length, int(max_new_tokens * 0.8))
-
-    out = pipe(
-        text,
+    return dict(
         max_new_tokens=max_new_tokens,
         min_length=min_length,
         num_beams=4,
@@ -67,9 +64,36 @@ def _gen(pipe, text: str, max_new_tokens: int, min_length: int) -> str:
         truncation=True,
         clean_up_tokenization_spaces=True,
     )
+
+
+def _gen(pipe, text: str, max_new_tokens: int, min_length: int) -> str:
+    """모델 호출 유틸 (오류 방지용 동적 길이 보정 포함)"""
+    out = pipe(text, **_gen_kwargs(max_new_tokens, min_length))
     return out[0]["summary_text"].strip()
 
 
+def _single_pass_lengths(total_words: int) -> tuple[int, int]:
+    return min(900, int(total_words * 0.9)), max(80, int(total_words * 0.5))
+
+
+def _chunk_lengths(chunk_words: int) -> tuple[int, int]:
+    return min(500, int(chunk_words * 0.9)), max(120, int(chunk_words * 0.4))
+
+
+def _merge_lengths(total_words: int) -> tuple[int, int]:
+    return min(1200, int(total_words * 0.9)), max(200, int(total_words * 0.6))
+
+
+def _finalize(s: str) -> str:
+    sents_out = [x.strip() for x in _SENT_SPLIT.split(s.replace("\n", " ")) if x.strip()]
+    max_sents = 5
+
+    if len(sents_out) > max_sents:
+        sents_out = sents_out[:max_sents]
+
+    return " ".join(sents_out).strip()
+
+
 def summarize(text: str, base_min_sentences: int = 4, length_factor: float = 3.0) -> str | None:
     if not text:
         return None
@@ -89,29 +113,260 @@ def summarize(text: str, base_min_sentences: int = 4, length_factor: float = 3.0
     # ---------------------------------------------------------
     if total_words <= 700:
         # 단일 패스 (짧은 기사)
-        max_tokens = min(900, int(total_words * 0.9))
-        min_len = max(80, int(total_words * 0.5))
+        max_tokens, min_len = _single_pass_lengths(total_words)
         s = _gen(pipe, t, max_new_tokens=max_tokens, min_length=min_len)
     else:
         # 다중 청크 요약
         chunks = _merge_by_limit(sents, max_words=520)
         partials = []
         for ch in chunks:
-            max_t = min(500, int(len(ch.split()) * 0.9))
-            min_t = max(120, int(len(ch.split()) * 0.4))
+            max_t, min_t = _chunk_lengths(len(ch.split()))
             partials.append(_gen(pipe, ch, max_new_tokens=max_t, min_length=min_t))
         merged = " ".join(partials)
 
         # 최종 통합 재요약
-        total_target = min(1200, int(total_words * 0.9))
-        total_min = max(200, int(total_words * 0.6))
+        total_target, total_min = _merge_lengths(total_words)
         s = _gen(pipe, merged, max_new_tokens=total_target, min_length=total_min)
 
-    sents_out = [x.strip() for x in _SENT_SPLIT.split(s.replace("\n", " ")) if x.strip()]
-    min_sents = max(3, int(base_min_sentences * length_factor))
-    max_sents = 5
+    return _finalize(s)
 
-    if len(sents_out) > max_sents:
-        sents_out = sents_out[:max_sents]
 
-    return " ".join(sents_out).strip()
+# ---------------------------------------------------------
+# 여러 기사 배치 요약
+# ---------------------------------------------------------
+class _Deadline:
+    """배치 생성 시간 예산 (time.monotonic 기준 마감 + 지금까지의 배치 평균 소요)"""
+
+    def __init__(self, deadline: Optional[float]):
+        self.deadline = deadline
+        self.spent = 0.0
+        self.batches = 0
+
+    def allows_batch(self) -> bool:
+        if self.deadline is None:
+            return True
+        left = self.deadline - time.monotonic()
+        # 길이순이라 다음 배치가 평균보다 길 가능성이 높음 → 평균으로도 못 끝내면 중단
+        return left > 0 and not (self.batches and self.spent / self.batches > left)
+
+    def charge(self, sec: float):
+        self.spent += sec
+        self.batches += 1
+
+
+def _run_jobs(pipe, jobs: list[tuple[str, int, int]], batch_size: int,
+              budget: Optional[_Deadline] = None) -> list[Optional[str]]:
+    """
+    (텍스트, max_new_tokens, min_length) 작업들을 생성 인자가 같은 것끼리, 그 안에서 토큰 길이순으로 묶어 배치 생성
+    - 배치 안의 모든 작업이 summarize()와 똑같은 _gen_kwargs로 생성됨 → 기사별 결과가 단건 호출과 같음
+    - 배치는 짧은 것부터 실행 (예산이 모자랄 때 긴 배치가 남도록)
+    - 배치가 실패하면 해당 작업만 단건으로 재시도, 그래도 실패하면 None
+    - budget: 예산이 모자라면 남은 작업은 None으로 남김
+    """
+    out: list[Optional[str]] = [None] * len(jobs)
+    if not jobs:
+        return out
+    budget = budget or _Deadline(None)
+    lens = [len(ids) for ids in pipe.tokenizer([j[0] for j in jobs], add_special_tokens=False)["input_ids"]]
+
+    groups: dict[tuple, list[int]] = {}
+    kwargs_of: dict[tuple, dict] = {}
+    for i, (_, max_t, min_t) in enumerate(jobs):
+        kw = _gen_kwargs(max_t, min_t)
+        key = (kw["max_new_tokens"], kw["min_length"])  # 나머지 인자는 고정값
+        groups.setdefault(key, []).append(i)
+        kwargs_of[key] = kw
+    batches = []
+    for key, idx in groups.items():
+        idx.sort(key=lambda i: lens[i])
+        batches.extend((key, idx[s:s + batch_size]) for s in range(0, len(idx), batch_size))
+    batches.sort(key=lambda b: lens[b[1][0]])
+
+    for n, (key, idx) in enumerate(batches):
+        if not budget.allows_batch():
+            left = sum(len(b) for _, b in batches[n:])
+            print(f"[summarize] ⏱ time budget exhausted, {left} jobs left undone")
+            break
+        t0 = time.monotonic()
+        try:
+            res = pipe([jobs[i][0] for i in idx], batch_size=len(idx), **kwargs_of[key])
+            for i, r in zip(idx, res):
+                out[i] = r["summary_text"].strip()
+        except Exception as e:
+            print(f"[summarize] ⚠️ batch of {len(idx)} failed, retrying one by one: {e}")
+            for i in idx:
+                try:
+                    out[i] = _gen(pipe, jobs[i][0], jobs[i][1], jobs[i][2])
+                except Exception as e2:
+                    print(f"[summarize] ⚠️ job failed: {e2}")
+        budget.charge(time.monotonic() - t0)
+    return out
+
+
+def summarize_many(texts: Sequence[str], base_min_sentences: int = 4, length_factor: float = 3.0,
+                   batch_size: Optional[int] = None, pipe=None,
+                   deadline: Optional[float] = None) -> List[Optional[str]]:
+    """
+    summarize()의 여러 기사 버전 (입력 순서대로 결과)
+    - 1단계: 짧은 기사 단일 패스 + 긴 기사의 청크들을 한꺼번에 배치 생성
+    - 2단계: 긴 기사의 부분 요약을 합친 통합 재요약을 다시 배치 생성
+    - 빈 텍스트는 None, 생성 실패(또는 deadline 초과로 못 돌린) 기사도 None
+    - pipe: 백엔드 비교 등 다른 파이프라인으로 돌릴 때 (기본은 공용 get_summarizer())
+    """
+    bs = max(1, batch_size or BATCH_SIZE)
+    results: List[Optional[str]] = [None] * len(texts)
+    jobs: list[tuple[str, int, int]] = []
+    single: dict[int, int] = {}            # 기사 → 작업 번호
+    multi: dict[int, list[int]] = {}       # 기사 → 청크 작업 번호들
+
+    for k, text in enumerate(texts):
+        t = (text or "").strip()
+        if not t:
+            continue
+        words = t.split()
+        if len(words) < 30:
+            results[k] = t  # 너무 짧은 기사면 그대로 반환
+        elif len(words) <= 700:
+            single[k] = len(jobs)
+            jobs.append((t, *_single_pass_lengths(len(words))))
+        else:
+            ids = []
+            for ch in _merge_by_limit(_split_sentences(t), max_words=520):
+                ids.append(len(jobs))
+                jobs.append((ch, *_chunk_lengths(len(ch.split()))))
+            multi[k] = ids
+
+    if not jobs:
+        return results
+
+    pipe = pipe or get_summarizer()
+    budget = _Deadline(deadline)  # 1·2단계가 같은 예산/평균을 공유
+    outs = _run_jobs(pipe, jobs, bs, budget)
+    for k, j in single.items():
+        if outs[j] is not None:
+            results[k] = _finalize(outs[j])
+
+    # 최종 통합 재요약 (청크가 하나라도 실패한 기사는 제외)
+    merge_jobs, merge_of = [], []
+    for k, ids in multi.items():
+        partials = [outs[j] for j in ids]
+        if any(p is None for p in partials):
+            continue
+        merge_of.append(k)
+        merge_jobs.append((" ".join(partials), *_merge_lengths(len(texts[k].split()))))
+    for k, s in zip(merge_of, _run_jobs(pipe, merge_jobs, bs, budget)):
+        if s is not None:
+            results[k] = _finalize(s)
+    return results
+
+
+# ---------------------------------------------------------
+# 추출 요약 (TextRank) + 티어 선택
+# ---------------------------------------------------------
+_TOKEN_RX = re.compile(r"[A-Za-z0-9가-힣]+", re.UNICODE)
+_MAX_RANK_SENTS = 120   # 아주 긴 기사는 앞부분 문장만 그래프에 올림 (뉴스는 앞쪽에 핵심)
+
+
+def extractive_summary(text: str, max_sents: int = 5) -> str | None:
+    """
+    TextRank 추출 요약 (모델 없음, 기사당 수 ms)
+    - 문장 유사도: 공통 단어 수 / (log|Si| + log|Sj|)
+    - 점수 상위 max_sents 문장을 원래 순서대로 이어 붙임
+    """
+    if not text:
+        return None
+    t = text.strip()
+    if len(t.split()) < 30:
+        return t  # summarize()와 동일하게 너무 짧으면 그대로
+
+    sents = _split_sentences(t)[:_MAX_RANK_SENTS]
+    if len(sents) <= max_sents:
+        return " ".join(sents)
+
+    toks = [set(w.lower() for w in _TOKEN_RX.findall(s)) for s in sents]
+    n = len(sents)
+    nbrs: list[list[tuple[int, float]]] = [[] for _ in range(n)]
+    for i in range(n):
+        if len(toks[i]) < 2:
+            continue
+        for j in range(i + 1, n):
+            if len(toks[j]) < 2:
+                continue
+            common = len(toks[i] & toks[j])
+            if common:
+                w = common / (math.log(len(toks[i])) + math.log(len(toks[j])))
+                nbrs[i].append((j, w))
+                nbrs[j].append((i, w))
+    out_w = [sum(w for _, w in nb) for nb in nbrs]
+
+    score = [1.0] * n
+    for _ in range(30):
+        new = [0.15 + 0.85 * sum(w / out_w[j] * score[j] for j, w in nbrs[i]) for i in range(n)]
+        delta = max(abs(a - b) for a, b in zip(new, score))
+        score = new
+        if delta < 1e-4:
+            break
+
+    top = sorted(range(n), key=lambda i: (-score[i], i))[:max_sents]
+    return " ".join(sents[i] for i in sorted(top))
+
+
+def choose_tier(text: str, source: str | None = None) -> str:
+    """
+    기사 하나의 요약 티어: "extractive" | "abstractive"
+    - SUMMARY_EXTRACTIVE_MAX_WORDS 이하 짧은 기사(단신/통신 기사) → 추출
+    - SUMMARY_EXTRACTIVE_SOURCES에 포함된 소스(부분 일치, 소문자) → 추출
+    - 시간 예산은 summarize_tiered()에서 배치 진행 중에 따로 판단
+    """
+    n_words = len((text or "").split())
+    if n_words <= settings.SUMMARY_EXTRACTIVE_MAX_WORDS:
+        return "extractive"
+    src = (source or "").lower()
+    if src and any(s in src for s in settings.SUMMARY_EXTRACTIVE_SOURCES):
+        return "extractive"
+    return "abstractive"
+
+
+def summarize_tiered(texts: Sequence[str], sources: Sequence[str | None] | None = None,
+                     budget_sec: Optional[float] = None, pipe=None) -> tuple[List[Optional[str]], List[Optional[str]]]:
+    """
+    티어별 요약 (입력 순서대로 (요약들, 티어들))
+    - choose_tier()로 고른 생성 요약 대상만 summarize_many()에 deadline과 함께 넘김
+    - 예산이 떨어져 못 돌린 기사/생성 실패한 기사는 추출 요약으로 채움 → 실행이 예산 안에서 끝남
+    - budget_sec: 기본 SUMMARY_TIME_BUDGET_SEC, 0 이하면 무제한
+    """
+    started = time.monotonic()
+    budget = settings.SUMMARY_TIME_BUDGET_SEC if budget_sec is None else budget_sec
+    deadline = started + budget if budget and budget > 0 else None
+    sources = list(sources) if sources is not None else [None] * len(texts)
+
+    results: List[Optional[str]] = [None] * len(texts)
+    tiers: List[Optional[str]] = [None] * len(texts)
+    abstractive = []
+    for k, text in enumerate(texts):
+        if not (text or "").strip():
+            continue
+        tiers[k] = choose_tier(text, sources[k])
+        if tiers[k] == "abstractive":
+            abstractive.append(k)
+
+    if abstractive:
+        try:
+            outs = summarize_many([texts[k] for k in abstractive], pipe=pipe, deadline=deadline)
+        except Exception as e:
+            # 모델 로드 실패 등 → 전부 추출 요약으로
+            print(f"[summarize] ⚠️ abstractive tier failed, using extractive: {e}")
+            outs = [None] * len(abstractive)
+        for k, s in zip(abstractive, outs):
+            results[k] = s
+
+    for k, text in enumerate(texts):
+        if tiers[k] is not None and results[k] is None:
+            tiers[k] = "extractive"
+            results[k] = extractive_summary(text)
+
+    n_abs = sum(1 for t in tiers if t == "abstractive")
+    n_ext = sum(1 for t in tiers if t == "extractive")
+    print(f"[summarize] tiers: abstractive {n_abs}, extractive {n_ext} "
+          f"({time.monotonic() - started:.1f}s, budget {budget:g}s)")
+    return results, tiers
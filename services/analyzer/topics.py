@@ -1,46 +1,210 @@
-import re
-from typing import List, Optional
-from sklearn.feature_extraction.text import CountVectorizer
+import os
+import pickle
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
 
-def _tokenize(text: str) -> List[str]:
-    return re.findall(r"[0-9A-Za-z가-힣]+", (text or "").lower())
+from shared.settings import settings
 
 _TOKEN_PATTERN = r"[0-9A-Za-z가-힣]+"
+_HISTORY_KEEP = 50   # 저장해 둘 버전 기록 수
+# partial_fit 가중치 = (offset + 누적 배치 수) ** -decay → 배치가 쌓일수록 한 번의 갱신 폭이 줄어듦
+_LEARNING_OFFSET = 64.0
+_LEARNING_DECAY = 0.7
+
+
+class OnlineLDAModel:
+    """
+    디스크에 유지되는 온라인 LDA
+    - HashingVectorizer(어휘 상태 없음) → 새 단어가 들어와도 벡터라이저 재학습 불필요
+    - 처음엔 최근 기사로 부트스트랩 fit, 이후엔 새 기사로 partial_fit
+    - 토픽 id: LDA 컴포넌트 번호가 아닌 안정 id (버전마다 직전 컴포넌트와 코사인 유사도로 매칭,
+      TOPIC_MATCH_MIN_SIM 미만이면 새 id 발급) → Article.topic_id를 시간이 지나도 비교 가능
+    """
 
-class TinyLDAModel:
-    def __init__(self, num_topics: int = 5, max_features: int = 5000):
-        self.num_topics = num_topics
-        self.max_features = max_features
-        self.vectorizer: Optional[CountVectorizer] = None
+    def __init__(self, num_topics: Optional[int] = None, n_features: Optional[int] = None,
+                 path: Optional[str] = None):
+        self.num_topics = num_topics or settings.TOPIC_NUM
+        self.n_features = n_features or settings.TOPIC_HASH_FEATURES
+        self.path = path or settings.TOPIC_STATE_PATH
+        self.vectorizer = HashingVectorizer(
+            token_pattern=_TOKEN_PATTERN,  # 토큰 패턴을 한/영 공용으로
+            n_features=self.n_features,
+            alternate_sign=False,          # LDA 입력은 음수 없는 카운트
+            norm=None,
+        )
         self.lda: Optional[LatentDirichletAllocation] = None
+        self.version = 0
+        self.n_docs = 0
+        self.topic_ids: List[int] = []     # 컴포넌트 번호 → 안정 토픽 id
+        self.next_id = 0
+        self.history: List[dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.lda is not None
 
-    def fit(self, docs: List[str]):
+    # -------------------------------
+    # 저장/로드
+    # -------------------------------
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "OnlineLDAModel":
+        m = cls(path=path)
+        try:
+            with open(m.path, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return m
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            print(f"[topics] ⚠️ state load error, starting fresh: {e}")
+            return m
+
+        if state.get("num_topics") != m.num_topics or state.get("n_features") != m.n_features:
+            print("[topics] TOPIC_NUM/TOPIC_HASH_FEATURES changed → starting fresh")
+            return m
+        m.lda = state["lda"]
+        m.version = state["version"]
+        m.n_docs = state["n_docs"]
+        m.topic_ids = state["topic_ids"]
+        m.next_id = state["next_id"]
+        m.history = state.get("history", [])
+        return m
+
+    def save(self):
+        state = {
+            "num_topics": self.num_topics, "n_features": self.n_features,
+            "lda": self.lda, "version": self.version, "n_docs": self.n_docs,
+            "topic_ids": self.topic_ids, "next_id": self.next_id, "history": self.history,
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[topics] ⚠️ state save error: {e}")
+
+    # -------------------------------
+    # 학습
+    # -------------------------------
+    def update(self, docs: List[str], bootstrap_iter: int = 30) -> bool:
+        """새 문서로 모델 갱신 + 토픽 id 재매칭 + 저장 (학습할 문서가 없으면 False)"""
         corpus = [d for d in docs if d]
         if not corpus:
+            return False
+        X = self.vectorizer.transform(corpus)
+        with self._lock:
+            prev = self.lda.components_.copy() if self.lda is not None else None
+            if self.lda is None:
+                # 부트스트랩은 기존과 같은 batch EM, 이후 partial_fit은 온라인 업데이트
+                self.lda = LatentDirichletAllocation(
+                    n_components=self.num_topics,
+                    learning_method="batch",
+                    max_iter=bootstrap_iter,
+                    learning_offset=_LEARNING_OFFSET,
+                    learning_decay=_LEARNING_DECAY,
+                    random_state=42,
+                    evaluate_every=0,
+                )
+                self.lda.fit(X)
+            else:
+                # total_samples 기본값(1e6)이면 작은 배치 통계가 1e6/배치 크기만큼 부풀려져
+                # 한 번 갱신에 토픽이 배치 내용으로 덮어써짐 → 실제 누적 문서 수로 스케일
+                self.lda.total_samples = self.n_docs + len(corpus)
+                self.lda.learning_offset = _LEARNING_OFFSET
+                self.lda.learning_decay = _LEARNING_DECAY
+                self.lda.partial_fit(X)
+            self._remap(prev)
+            self.version += 1
+            self.n_docs += len(corpus)
+            self.history.append({
+                "version": self.version,
+                "updated_at": datetime.utcnow().isoformat(),
+                "docs": len(corpus),
+                "topic_ids": list(self.topic_ids),
+            })
+            self.history = self.history[-_HISTORY_KEEP:]
+            self.save()
+        return True
+
+    def _remap(self, prev: Optional[np.ndarray]):
+        cur = self.lda.components_
+        if prev is None or not self.topic_ids:
+            self.topic_ids = list(range(cur.shape[0]))
+            self.next_id = cur.shape[0]
             return
-        # 토큰 패턴을 한/영 공용으로
-        self.vectorizer = CountVectorizer(
-            token_pattern=_TOKEN_PATTERN,
-            max_features=self.max_features,
-            min_df=2
-        )
-        X = self.vectorizer.fit_transform(corpus)
-        self.lda = LatentDirichletAllocation(
-            n_components=self.num_topics,
-            learning_method="batch",
-            max_iter=30,
-            random_state=42,
-            evaluate_every=0,
-        )
-        self.lda.fit(X)
+
+        def _unit(m):
+            m = m / m.sum(axis=1, keepdims=True)  # 토픽별 단어 분포
+            return m / np.linalg.norm(m, axis=1, keepdims=True)
+
+        sim = _unit(prev) @ _unit(cur).T              # (이전 컴포넌트, 현재 컴포넌트)
+        min_sim = settings.TOPIC_MATCH_MIN_SIM
+        new_ids: List[Optional[int]] = [None] * cur.shape[0]
+        # partial_fit은 컴포넌트 순서를 유지 → 충분히 비슷하면 같은 자리 그대로
+        for c in range(cur.shape[0]):
+            if sim[c, c] >= min_sim:
+                new_ids[c] = self.topic_ids[c]
+        # 나머지만 유사도 합 최대 1:1 매칭 (토픽끼리 자리가 바뀐 경우)
+        rest = [c for c in range(cur.shape[0]) if new_ids[c] is None]
+        if rest:
+            rows, cols = linear_sum_assignment(-sim[np.ix_(rest, rest)])
+            for r, c in zip(rows, cols):
+                if sim[rest[r], rest[c]] >= min_sim:
+                    new_ids[rest[c]] = self.topic_ids[rest[r]]
+        for c, tid in enumerate(new_ids):
+            if tid is None:
+                print(f"[topics] component {c} drifted → new topic id {self.next_id}")
+                new_ids[c] = self.next_id
+                self.next_id += 1
+        self.topic_ids = new_ids
+
+    # -------------------------------
+    # 추론
+    # -------------------------------
+    def infer_topics(self, docs: List[str]) -> Tuple[List[Optional[int]], List[Optional[Dict[str, float]]]]:
+        """
+        여러 문서 토픽 추론 (입력 순서대로 (토픽 id들, 분포들), 빈 문서/미학습이면 None)
+        - 배치 전체를 sparse 행렬 하나로 벡터화 → lda.transform 한 번
+        - 분포: {"안정 토픽 id": 확률} (JSON 저장용으로 키는 문자열)
+        """
+        topics: List[Optional[int]] = [None] * len(docs)
+        dists: List[Optional[Dict[str, float]]] = [None] * len(docs)
+        idx = [i for i, d in enumerate(docs) if d]
+        if not self.lda or not idx:
+            return topics, dists
+        X = self.vectorizer.transform([docs[i] for i in idx])
+        # transform은 문서별 토픽 분포(확률) 반환, shape: (문서 수, n_topics)
+        dist = self.lda.transform(X)
+        best = dist.argmax(axis=1)
+        for row, i in enumerate(idx):
+            topics[i] = self.topic_ids[int(best[row])]
+            dists[i] = {str(tid): round(float(p), 4) for tid, p in zip(self.topic_ids, dist[row])}
+        return topics, dists
 
     def infer_topic(self, doc: str) -> Optional[int]:
-        if not self.lda or not self.vectorizer or not doc:
-            return None
-        X = self.vectorizer.transform([doc])
-        # transform은 문서의 토픽 분포(확률) 반환
-        dist = self.lda.transform(X)  # shape: (1, n_topics)
-        if dist is None or dist.shape[0] == 0:
-            return None
-        return int(dist[0].argmax())
+        return self.infer_topics([doc])[0][0]
+
+    def info(self) -> dict:
+        return {"version": self.version, "n_docs": self.n_docs, "topic_ids": list(self.topic_ids),
+                "history": self.history[-5:]}
+
+
+_model: Optional[OnlineLDAModel] = None
+_model_lock = threading.Lock()
+
+def get_topic_model() -> OnlineLDAModel:
+    """프로세스 공용 토픽 모델 (처음 한 번 디스크에서 로드)"""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = OnlineLDAModel.load()
+    return _model
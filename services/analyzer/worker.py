@@ -0,0 +1,56 @@
+import time
+from types import SimpleNamespace
+
+from services.analyzer.byline import pick_author
+from services.translate.translate import translate_to_ko
+
+# 분석 워커 프로세스에서 실행되는 구간 (DB/ORM 없이 동작해야 함)
+# 입력/출력은 피클 가능한 dict만 사용: 부모가 Article → payload로 만들고, 결과를 받아 직접 기록
+
+_PAYLOAD_FIELDS = ("content_raw", "summary_raw", "content_clean")  # 기자 이름 추출에 쓰는 원문 필드
+
+
+def init_worker(torch_threads: int, models: tuple[str, ...]):
+    """프로세스당 한 번: torch 스레드 수 제한(워커끼리 코어 나눠 쓰기) + 모델 미리 로드"""
+    try:
+        import torch
+        torch.set_num_threads(max(1, torch_threads))
+    except ImportError:
+        pass
+    from services.analyzer.registry import warm_up_models
+    warm_up_models(models)
+
+
+def to_payload(a, base_text: str) -> dict:
+    p = {"id": a.id, "text": base_text, "title": a.title or "", "source": a.source}
+    for f in _PAYLOAD_FIELDS:
+        p[f] = getattr(a, f, None)
+    return p
+
+
+def analyze_chunk(payloads: list[dict], deadline: float | None) -> list[dict]:
+    """
+    [payload] → [{"id", "summary_gen", "summary_ko", "author", "tier"}]
+    - 요약은 청크 단위 티어 요약(summarize_tiered), deadline(time.time 기준)을 넘기면 추출 요약
+    - 번역/기자 이름은 기사별
+    """
+    from services.analyzer.summarize import summarize_tiered
+
+    budget = 0.0  # 무제한
+    if deadline is not None:
+        # 0 이하는 "무제한"이라 이미 지났으면 아주 작은 양수 → 전부 추출 요약
+        budget = max(deadline - time.time(), 1e-6)
+    summaries, tiers = summarize_tiered([p["text"] for p in payloads], [p["source"] for p in payloads],
+                                        budget_sec=budget)
+
+    out = []
+    for p, s, tier in zip(payloads, summaries, tiers):
+        r = {"id": p["id"], "summary_gen": s, "summary_ko": None, "author": None, "tier": tier}
+        try:
+            r["summary_ko"] = translate_to_ko(s or p["text"], source_lang=None)
+            r["author"] = pick_author(SimpleNamespace(**{f: p[f] for f in _PAYLOAD_FIELDS}))
+        except Exception as e:
+            print(f"[analyzer] ⚠️ article {p['id']} failed: {e}")
+            r["failed"] = True
+        out.append(r)
+    return out
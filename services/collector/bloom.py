@@ -0,0 +1,108 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+
+_MAGIC = b"GNCBLM3\0"
+_HEADER = struct.Struct(">8sQQQQ64s")  # magic, m(bits), k(hashes), count, capacity, tag
+_TAG_MAX = 64
+_MAGIC_V2 = b"GNCBLM2\0"
+_HEADER_V2 = struct.Struct(">8sQQQQ")  # 이전 형식(tag 없음)
+_MAGIC_V1 = b"GNCBLM1\0"
+_HEADER_V1 = struct.Struct(">8sQQQ")  # 이전 형식(capacity/tag 없음)
+
+
+class BloomFilter:
+    """
+    이미 본 URL 집합용 Bloom filter.
+    - False negative 없음, False positive 확률 ≈ error_rate (capacity 이내일 때)
+    - blake2b 128bit → double hashing으로 k개 인덱스 생성
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6,
+                 m: int | None = None, k: int | None = None):
+        capacity = max(1, capacity)
+        if m is None:
+            m = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        if k is None:
+            k = max(1, int(round(m / capacity * math.log(2))))
+        self.capacity = capacity
+        self.m = m
+        self.k = k
+        self.count = 0
+        self.tag = ""   # 호출 쪽이 정하는 식별 문자열 (예: 어느 DB 상태로 만든 필터인지), 파일에 같이 저장
+        self._bits = bytearray((m + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _indexes(self, key: str):
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "big")
+        h2 = int.from_bytes(d[8:], "big") | 1
+        m = self.m
+        for i in range(self.k):
+            yield (h1 + i * h2) % m
+
+    def add(self, key: str) -> bool:
+        """추가. 새로 켜진 비트가 있으면 True(= 처음 본 키)"""
+        added = False
+        with self._lock:
+            for idx in self._indexes(key):
+                byte, bit = idx >> 3, 1 << (idx & 7)
+                if not self._bits[byte] & bit:
+                    self._bits[byte] |= bit
+                    added = True
+            if added:
+                self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(key))
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+    def save(self, path: str):
+        """원자적 저장(tmp 파일 → rename)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with self._lock:
+            with open(tmp, "wb") as f:
+                tag = self.tag.encode("utf-8")[:_TAG_MAX]
+                f.write(_HEADER.pack(_MAGIC, self.m, self.k, self.count, self.capacity, tag))
+                f.write(self._bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter | None":
+        """
+        저장된 필터 로드 (capacity도 파일에서 → 설정값보다 크게 재구성된 필터도 재시작 후 saturated 아님)
+        - 이전 형식: tag는 ""(호출 쪽에서 불일치로 보고 재구성), capacity 없으면 m/k에서 역산: k = m/capacity * ln2
+        """
+        tag = b""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_HEADER.size)
+                if head[:len(_MAGIC)] == _MAGIC:
+                    _, m, k, count, capacity, tag = _HEADER.unpack(head)
+                elif head[:len(_MAGIC_V2)] == _MAGIC_V2:
+                    _, m, k, count, capacity = _HEADER_V2.unpack(head[:_HEADER_V2.size])
+                    f.seek(_HEADER_V2.size)
+                elif head[:len(_MAGIC_V1)] == _MAGIC_V1:
+                    _, m, k, count = _HEADER_V1.unpack(head[:_HEADER_V1.size])
+                    capacity = int(m * math.log(2) / k)
+                    f.seek(_HEADER_V1.size)
+                else:
+                    return None
+                bits = f.read()
+        except (OSError, struct.error):
+            return None
+        if len(bits) != (m + 7) // 8 or not k:
+            return None
+        bf = cls(capacity=capacity, m=m, k=k)
+        bf._bits = bytearray(bits)
+        bf.count = count
+        bf.tag = tag.rstrip(b"\0").decode("utf-8", errors="replace")
+        return bf
@@ -0,0 +1,88 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 추적/캠페인 파라미터 (값과 무관하게 제거)
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "ref", "ref_src", "referrer", "cmpid", "cmp",
+    "ocid", "smid", "smtyp", "rss", "taid", "xtor", "at_medium",
+    "at_campaign", "at_custom1", "at_custom2", "ito", "ns_source", "ns_mchannel",
+    "ns_campaign", "ns_linkname", "ns_fee", "sr_share",
+}
+_TRACKING_PREFIXES = ("utm_", "__twitter", "_hs", "pk_", "mtm_")
+
+# AMP 변형: 쿼리 플래그 / 경로 접미사 / 호스트 접두사
+_AMP_QUERY = {"amp", "outputtype", "amp_js_v", "usqp"}
+_AMP_SUFFIX_RX = re.compile(r"/amp(?:\.html?)?/?$", re.I)      # /story/amp, /story/amp.html
+_AMP_EXT_RX = re.compile(r"\.amp(\.html?)?$", re.I)              # /story.amp.html → /story.html
+_AMP_CACHE_RX = re.compile(r"^[^/]+\.cdn\.ampproject\.org$", re.I)
+
+_HOST_PREFIXES = ("www.", "amp.", "m.", "mobile.")
+_DEFAULT_PORTS = {":80", ":443"}
+
+
+def _is_tracking(key: str) -> bool:
+    k = key.lower()
+    return k in _TRACKING_PARAMS or k.startswith(_TRACKING_PREFIXES)
+
+
+def _unwrap_amp_cache(host: str, path: str) -> tuple[str, str] | None:
+    # https://example-com.cdn.ampproject.org/c/s/example.com/path → example.com/path
+    if not _AMP_CACHE_RX.match(host):
+        return None
+    m = re.match(r"^/(?:[a-z]/)+(?:s/)?([^/]+)(/.*)?$", path, re.I)
+    if not m:
+        return None
+    return m.group(1).lower(), m.group(2) or "/"
+
+
+def canonicalize_url(url: str | None) -> str | None:
+    """
+    같은 기사를 가리키는 URL 변형을 하나의 키로 정규화.
+    - http/https 통일, 호스트 소문자 + www./amp./m. 제거, 기본 포트/fragment 제거
+    - utm_* 등 추적 파라미터 제거, 나머지 쿼리는 정렬
+    - AMP 변형(/amp, ?amp=1, AMP 캐시 호스트)과 끝 슬래시 제거
+    """
+    if not url:
+        return None
+    u = url.strip()
+    if not u:
+        return None
+    if "://" not in u:
+        u = "https://" + u.lstrip("/")
+
+    try:
+        parts = urlsplit(u)
+        port = parts.port
+    except ValueError:
+        return u
+
+    host = (parts.hostname or "").lower()
+    path = parts.path or "/"
+
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        host, path = unwrapped
+
+    for p in _HOST_PREFIXES:
+        if host.startswith(p) and host.count(".") >= 2:
+            host = host[len(p):]
+            break
+
+    netloc = host
+    if port and f":{port}" not in _DEFAULT_PORTS:
+        netloc = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", path)
+    path = _AMP_SUFFIX_RX.sub("", path) or "/"
+    path = _AMP_EXT_RX.sub(r"\1", path)
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(k) and k.lower() not in _AMP_QUERY
+    ]
+    query.sort()
+
+    return urlunsplit(("https", netloc, path, urlencode(query, doseq=True), ""))
@@ -0,0 +1,233 @@
+import re
+import threading
+import time
+import concurrent.futures
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from sqlalchemy import update
+
+from shared.settings import settings
+from shared.db import db
+from apps.api.models import Article
+
+_USER_AGENT = "GlobalNewsCurator/1.0 (+article crawler)"
+_ROBOTS_TTL = 24 * 3600
+_ROBOTS_MAX_BYTES = 512 * 1024
+_HTML_TYPES = ("text/html", "application/xhtml+xml")
+_ARTICLE_RX = re.compile(r"<article\b.*?</article>", re.I | re.S)
+_CHARSET_RX = re.compile(r"charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+_META_CHARSET_RX = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+_META_SNIFF_BYTES = 4096
+
+
+class _DomainThrottle:
+    """도메인별 최소 요청 간격 (같은 언론사에 연속 요청 방지)"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at: dict[str, float] = {}
+
+    def wait(self, domain: str):
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_at.get(domain, 0.0))
+            self._next_at[domain] = at + self.min_interval
+        if at > now:
+            time.sleep(at - now)
+
+
+class _RobotsCache:
+    """robots.txt 도메인별 캐시 (TTL, RFC 9309: 4xx → 전체 허용, 5xx/오류 → 전체 금지)"""
+
+    def __init__(self, session: requests.Session, timeout: float):
+        self.session = session
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[RobotFileParser, float]] = {}
+        self._inflight: dict[str, threading.Lock] = {}
+
+    def _load(self, origin: str) -> RobotFileParser:
+        rp = RobotFileParser()
+        try:
+            r = self.session.get(f"{origin}/robots.txt", timeout=self.timeout, stream=True)
+            with r:
+                if 400 <= r.status_code < 500:
+                    rp.allow_all = True
+                elif r.status_code >= 500:
+                    rp.disallow_all = True
+                else:
+                    body = _read_capped(r, _ROBOTS_MAX_BYTES) or b""
+                    rp.parse(body.decode("utf-8", errors="replace").splitlines())
+        except requests.RequestException:
+            rp.disallow_all = True
+        return rp
+
+    def allowed(self, url: str) -> bool:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        now = time.monotonic()
+        with self._lock:
+            hit = self._cache.get(origin)
+            if hit and now - hit[1] < _ROBOTS_TTL:
+                return hit[0].can_fetch(_USER_AGENT, url)
+            inflight = self._inflight.setdefault(origin, threading.Lock())
+
+        # 같은 도메인 robots.txt는 한 번만 가져오도록
+        with inflight:
+            with self._lock:
+                hit = self._cache.get(origin)
+            if not hit or now - hit[1] >= _ROBOTS_TTL:
+                hit = (self._load(origin), time.monotonic())
+                with self._lock:
+                    self._cache[origin] = hit
+        return hit[0].can_fetch(_USER_AGENT, url)
+
+
+def _read_capped(r: requests.Response, max_bytes: int) -> bytes | None:
+    """응답 크기 제한: Content-Length 또는 실제 누적 바이트가 max_bytes 초과면 None"""
+    length = r.headers.get("Content-Length")
+    if length and length.isdigit() and int(length) > max_bytes:
+        return None
+    buf = bytearray()
+    for chunk in r.iter_content(chunk_size=64 * 1024):
+        buf.extend(chunk)
+        if len(buf) > max_bytes:
+            return None
+    return bytes(buf)
+
+
+def _page_encoding(r: requests.Response, body: bytes) -> str:
+    """
+    본문 인코딩 결정
+    - Content-Type에 charset이 있을 때만 헤더를 믿음 (없으면 requests가 text/*에 ISO-8859-1을 넣음)
+    - 다음은 문서 앞부분의 <meta charset> / http-equiv, 그래도 없으면 바이트 기반 추정 (requests와 같은 감지기)
+    """
+    m = _CHARSET_RX.search(r.headers.get("Content-Type") or "")
+    if m:
+        return m.group(1)
+    m = _META_CHARSET_RX.search(body[:_META_SNIFF_BYTES])
+    if m:
+        return m.group(1).decode("ascii", errors="ignore")
+    # stream=True로 이미 읽은 응답이라 r.apparent_encoding 대신 읽은 바이트로 직접 추정
+    return (chardet.detect(body) or {}).get("encoding") or "utf-8"
+
+
+def _extract_article_html(html: str) -> str:
+    # <article> 블록이 있으면 그 부분만 (내비/푸터 등 페이지 잔여물 축소)
+    m = _ARTICLE_RX.search(html)
+    return m.group(0) if m else html
+
+
+class Crawler:
+    """
+    기사 본문 크롤러
+    - 커넥션 풀 공유 세션, 도메인별 요청 간격, robots.txt 캐시
+    - 응답 크기 제한, 스레드 풀 동시 다운로드
+    """
+
+    def __init__(self, max_workers: int | None = None, domain_delay: float | None = None,
+                 timeout: float | None = None, max_bytes: int | None = None):
+        self.max_workers = max_workers or settings.CRAWL_MAX_WORKERS
+        self.timeout = timeout or settings.CRAWL_TIMEOUT
+        self.max_bytes = max_bytes or settings.CRAWL_MAX_BYTES
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = _USER_AGENT
+        self.throttle = _DomainThrottle(settings.CRAWL_DOMAIN_DELAY if domain_delay is None else domain_delay)
+        self.robots = _RobotsCache(self.session, self.timeout)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def fetch(self, url: str) -> str | None:
+        if not url or not url.startswith(("http://", "https://")):
+            return None
+        try:
+            if not self.robots.allowed(url):
+                return None
+            self.throttle.wait(urlsplit(url).netloc.lower())
+            r = self.session.get(url, timeout=self.timeout, stream=True)
+            with r:
+                if r.status_code != 200:
+                    return None
+                ctype = (r.headers.get("Content-Type") or "").lower()
+                if ctype and not ctype.startswith(_HTML_TYPES):
+                    return None
+                body = _read_capped(r, self.max_bytes)
+                if body is None:
+                    return None
+                try:
+                    html = body.decode(_page_encoding(r, body), errors="replace")
+                except LookupError:  # 알 수 없는 charset 이름
+                    html = body.decode("utf-8", errors="replace")
+            return _extract_article_html(html)
+        except (requests.RequestException, LookupError) as e:
+            print(f"[crawler] ⚠️ {url}: {e}")
+            return None
+
+    def fetch_many(self, urls: list[str]) -> list[str | None]:
+        if not urls:
+            return []
+        workers = max(1, min(self.max_workers, len(urls)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler") as ex:
+            return list(ex.map(self.fetch, urls))
+
+
+def _iter_uncrawled(batch_size: int):
+    """크롤링 대상 (id, url)을 id 오름차순 페이지로 (OFFSET 없이 WHERE id > 마지막 id, 전처리 적체 순회와 같은 방식)"""
+    last_id = 0
+    while True:
+        rows = (db.session.query(Article.id, Article.url)
+                .filter(Article.content_raw.is_(None))
+                .filter(Article.content_clean.is_(None))
+                .filter(Article.id > last_id)
+                .order_by(Article.id)
+                .limit(batch_size)
+                .all())
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def crawl_missing_content(batch_size: int | None = None) -> dict:
+    """
+    전처리 전 기사 중 content_raw가 비어있는 것 전체 → 본문 크롤링
+    - preprocess_backlog가 적체분 전체를 처리하므로 크롤링도 최신 N건이 아니라 전체를 페이지 단위로
+    - 페이지(CRAWL_BATCH_SIZE)마다 커밋 → 중간에 멈춰도 크롤링한 만큼은 보존
+    - 실패/차단은 ""로 기록해서 재시도하지 않음 (전처리는 summary_raw로 fallback)
+    """
+    batch_size = batch_size or settings.CRAWL_BATCH_SIZE
+    crawled = total = 0
+    t0 = time.perf_counter()
+    with Crawler() as c:
+        for rows in _iter_uncrawled(batch_size):
+            pages = c.fetch_many([u for _, u in rows])
+            params = []
+            for (aid, _), html in zip(rows, pages):
+                params.append({"id": aid, "content_raw": html or ""})
+                if html:
+                    crawled += 1
+            db.session.execute(update(Article), params)
+            db.session.commit()
+            total += len(rows)
+            print(f"[crawler] {crawled}/{total} pages (last id {rows[-1][0]})")
+    if not total:
+        return {"crawled": 0, "failed": 0}
+
+    elapsed = time.perf_counter() - t0
+    print(f"[crawler] ✅ {crawled}/{total} pages in {elapsed:.1f}s")
+    return {"crawled": crawled, "failed": total - crawled}
@@ -0,0 +1,133 @@
+import threading
+import time
+import concurrent.futures
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+from shared.settings import settings
+
+_USER_AGENT = "GlobalNewsCurator/1.0 (+rss collector)"
+
+
+@dataclass
+class FetchResult:
+    url: str
+    parsed: object = None        # feedparser.FeedParserDict (성공 시)
+    status: int | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class _HostLimiter:
+    """호스트별 동시 요청 수 제한 (같은 언론사 서버에 몰리지 않도록)"""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._sems: dict[str, threading.BoundedSemaphore] = {}
+
+    def get(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._sems[host] = sem
+            return sem
+
+
+def _make_session(pool_size: int) -> requests.Session:
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s.headers["User-Agent"] = _USER_AGENT
+    return s
+
+
+def _conditional_headers(validators: tuple | None) -> dict:
+    headers = {}
+    if validators:
+        etag, last_modified = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+_READ_CHUNK = 64 * 1024
+
+
+def _read_body(r: requests.Response, deadline: float) -> bytes:
+    # timeout은 소켓 read 단위라, 조금씩 흘려보내는 서버는 전체 시간 상한으로 끊음
+    # read1: 도착한 만큼만 바로 반환 (read(n)/iter_content는 n바이트가 찰 때까지 막혀서 마감 검사가 늦어짐)
+    buf = bytearray()
+    while True:
+        if time.perf_counter() > deadline:
+            raise TimeoutError("feed download exceeded deadline")
+        chunk = r.raw.read1(_READ_CHUNK, decode_content=True)
+        if not chunk:
+            return bytes(buf)
+        buf.extend(chunk)
+
+
+def _fetch_one(session: requests.Session, limiter: _HostLimiter, url: str, timeout: float,
+               validators: tuple | None = None) -> FetchResult:
+    host = urlparse(url).netloc.lower()
+    t0 = time.perf_counter()
+    with limiter.get(host):
+        try:
+            r = session.get(url, timeout=timeout, headers=_conditional_headers(validators), stream=True)
+            with r:
+                if r.status_code != 304:
+                    r.raise_for_status()
+                    body = _read_body(r, t0 + settings.FETCH_DEADLINE)
+            if r.status_code == 304:
+                # 변경 없음 → 파싱 생략, 기존 검증자 유지
+                etag, last_modified = validators or (None, None)
+                return FetchResult(url=url, status=304, elapsed=time.perf_counter() - t0,
+                                   etag=r.headers.get("ETag") or etag,
+                                   last_modified=r.headers.get("Last-Modified") or last_modified)
+            # 네트워크는 requests가 담당, feedparser는 받은 바이트만 파싱
+            parsed = feedparser.parse(body, response_headers=dict(r.headers))
+            return FetchResult(url=url, parsed=parsed, status=r.status_code,
+                               elapsed=time.perf_counter() - t0,
+                               etag=r.headers.get("ETag"),
+                               last_modified=r.headers.get("Last-Modified"))
+        except Exception as e:
+            return FetchResult(url=url, error=str(e), elapsed=time.perf_counter() - t0)
+
+
+def fetch_feeds(urls: list[str],
+                validators: dict[str, tuple] | None = None,
+                max_workers: int | None = None,
+                per_host: int | None = None,
+                timeout: float | None = None) -> list[FetchResult]:
+    """
+    여러 피드를 스레드 풀로 동시에 다운로드/파싱한다.
+    - validators: {url: (etag, last_modified)} → 조건부 GET (304면 parsed=None)
+    - DB는 건드리지 않음 (저장은 호출 측 단일 스레드에서)
+    - 결과 순서는 입력 urls 순서와 동일
+    """
+    validators = validators or {}
+    if not urls:
+        return []
+    max_workers = max_workers or settings.FETCH_MAX_WORKERS
+    per_host = per_host or settings.FETCH_PER_HOST
+    timeout = timeout or settings.FETCH_TIMEOUT
+
+    limiter = _HostLimiter(per_host)
+    workers = max(1, min(max_workers, len(urls)))
+    with _make_session(workers) as session:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed-fetch") as ex:
+            return list(ex.map(lambda u: _fetch_one(session, limiter, u, timeout, validators.get(u)), urls))
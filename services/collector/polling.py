@@ -0,0 +1,178 @@
+import heapq
+import random
+import statistics
+import threading
+from datetime import datetime, timedelta, timezone
+
+from shared.settings import settings
+from shared.db import db
+from apps.api.models import Feed
+from services.collector.rss import collect_feeds
+
+# 발행 간격 추정에 쓰는 최근 엔트리 수
+_RATE_WINDOW = 20
+# 새 글이 없을 때(304/빈 피드) 간격 증가 배수
+_IDLE_BACKOFF = 1.5
+_EWMA_ALPHA = 0.5
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _clamp(sec: float) -> int:
+    return int(min(settings.POLL_MAX_SEC, max(settings.POLL_MIN_SEC, sec)))
+
+
+def _entry_times(parsed) -> list[datetime]:
+    out = []
+    for e in getattr(parsed, "entries", []) or []:
+        tp = e.get("published_parsed") or e.get("updated_parsed")
+        if tp:
+            out.append(datetime(*tp[:6]))
+    return out
+
+
+def estimate_interval(times: list[datetime], prev: int | None = None, now: datetime | None = None,
+                      added: int = 0) -> int:
+    """
+    엔트리 발행 시각 → 다음 폴링 간격(초)
+    - 최근 발행 간격의 중앙값의 절반(평균적으로 새 글 1개당 2번 확인)
+    - 마지막 발행이 오래됐으면(휴면 피드) 그만큼 느리게
+    - 이전 간격과 EWMA로 섞어 급변 방지, [POLL_MIN_SEC, POLL_MAX_SEC]로 제한
+    - 발행 시각이 부족한 피드: 이번에 새 기사(added)가 있었으면 간격 유지, 없으면 천천히
+    """
+    now = now or _utcnow()
+    ts = sorted({t for t in times if t and t <= now}, reverse=True)[:_RATE_WINDOW]
+    if len(ts) < 2:
+        base = prev or settings.POLL_DEFAULT_SEC
+        return _clamp(base if added > 0 else base * _IDLE_BACKOFF)
+
+    gaps = [(a - b).total_seconds() for a, b in zip(ts, ts[1:]) if a > b]
+    if not gaps:
+        return _clamp(prev or settings.POLL_DEFAULT_SEC)
+
+    target = statistics.median(gaps) / 2.0
+    target = max(target, (now - ts[0]).total_seconds() / 4.0)
+    if prev:
+        target = _EWMA_ALPHA * target + (1 - _EWMA_ALPHA) * prev
+    return _clamp(target)
+
+
+def _with_jitter(interval: int) -> float:
+    j = settings.POLL_JITTER
+    return interval * random.uniform(1 - j, 1 + j)
+
+
+class PollQueue:
+    """다음 폴링 예정 시각 기준 우선순위 큐 (heapq, 프로세스 공용)"""
+
+    def __init__(self):
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._due)
+
+    def push(self, url: str, due: datetime):
+        ts = due.replace(tzinfo=timezone.utc).timestamp()
+        with self._lock:
+            self._due[url] = ts
+            heapq.heappush(self._heap, (ts, url))
+
+    def discard(self, url: str):
+        with self._lock:
+            self._due.pop(url, None)
+
+    def pop_due(self, now: datetime, limit: int) -> list[str]:
+        now_ts = now.replace(tzinfo=timezone.utc).timestamp()
+        out = []
+        with self._lock:
+            while self._heap and len(out) < limit:
+                ts, url = self._heap[0]
+                if ts > now_ts:
+                    break
+                heapq.heappop(self._heap)
+                # push로 갱신된 항목의 옛 엔트리(lazy deletion)는 버림
+                if self._due.get(url) != ts:
+                    continue
+                del self._due[url]
+                out.append(url)
+        return out
+
+    def next_due(self) -> datetime | None:
+        with self._lock:
+            while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            return datetime.utcfromtimestamp(self._heap[0][0])
+
+
+_queue: PollQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_queue() -> PollQueue:
+    """settings.FEEDS + Feed.next_poll_at으로 큐 초기화 (앱 컨텍스트 필요)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            q = PollQueue()
+            now = _utcnow()
+            rows = dict(db.session.query(Feed.url, Feed.next_poll_at)
+                        .filter(Feed.url.in_(settings.FEEDS))
+                        .all()) if settings.FEEDS else {}
+            for u in settings.FEEDS:
+                due = rows.get(u)
+                # 처음 보는 피드는 한 번에 몰리지 않게 첫 간격 안에서 분산
+                q.push(u, due or now + timedelta(seconds=random.uniform(0, settings.POLL_MIN_SEC)))
+            _queue = q
+        return _queue
+
+
+def poll_due_feeds(now: datetime | None = None) -> dict:
+    """
+    예정 시각이 지난 피드만 수집 → 피드별 간격 재계산 → 큐에 다시 넣기
+    """
+    now = now or _utcnow()
+    q = get_queue()
+    urls = q.pop_due(now, settings.POLL_MAX_FEEDS_PER_TICK)
+    if not urls:
+        return {"polled": 0, "inserted": 0}
+
+    outcomes = {res.url: (res, added) for res, added in collect_feeds(urls)}
+    feeds = {f.url: f for f in Feed.query.filter(Feed.url.in_(urls)).all()}
+
+    inserted = 0
+    for u in urls:
+        feed = feeds.get(u)
+        prev = (feed.poll_interval_sec if feed else None) or settings.POLL_DEFAULT_SEC
+        res, added = outcomes.get(u, (None, None))
+        if res is None or added is None:
+            interval = prev                       # 오류/차단: 간격 유지
+        elif res.not_modified:
+            interval = _clamp(prev * _IDLE_BACKOFF)  # 변경 없음: 천천히
+        else:
+            interval = estimate_interval(_entry_times(res.parsed), prev=prev, now=now, added=added)
+            inserted += added
+
+        due = now + timedelta(seconds=_with_jitter(interval))
+        # circuit breaker가 열려 있으면 해제 시각 이후로
+        if feed and feed.backoff_until and feed.backoff_until > due:
+            due = feed.backoff_until
+        if feed:
+            feed.poll_interval_sec = interval
+            feed.next_poll_at = due
+        q.push(u, due)
+
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[poller] ⚠️ feed schedule update error: {e}")
+
+    nxt = q.next_due()
+    print(f"[poller] polled {len(urls)} feeds → {inserted} new (next due {nxt})")
+    return {"polled": len(urls), "inserted": inserted}
@@ -1,10 +1,19 @@
-import feedparser
-from datetime import datetime, timezone
+import hashlib
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, insert, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from shared.settings import settings
 from shared.db import db
 from apps.api.models import Article, Feed
+from services.collector.fetch import fetch_feeds
+from services.collector.canonical import canonicalize_url
+from services.collector.bloom import BloomFilter
 from urllib.parse import urlparse
 
+# 이미 본 정규화 URL (프로세스 공용, 파일로 영속화)
+_seen: BloomFilter | None = None
+_seen_dirty = False
+
 def _ensure_feed(url, title=None):
     """중복 Feed 삽입 방지 + 세션 rollback 안전 처리"""
     feed = Feed.query.filter_by(url=url).first()
@@ -32,66 +41,271 @@ def _to_datetime(entry):
         return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
     return None
 
-def collect_rss_once(feed_url: str) -> int:
-    parsed = feedparser.parse(feed_url)
+def _feed_states(urls: list[str]) -> dict[str, Feed]:
+    """피드 상태(조건부 GET 검증자, 실패/차단 상태)를 한 번에 조회"""
+    if not urls:
+        return {}
+    return {f.url: f for f in Feed.query.filter(Feed.url.in_(urls)).all()}
+
+def _backoff_seconds(fail_count: int) -> int:
+    """연속 실패가 FEED_FAILURE_THRESHOLD 이상이면 지수 backoff (상한 FEED_BACKOFF_MAX_SEC)"""
+    over = fail_count - settings.FEED_FAILURE_THRESHOLD
+    if over < 0:
+        return 0
+    return int(min(settings.FEED_BACKOFF_MAX_SEC, settings.FEED_BACKOFF_BASE_SEC * (2 ** over)))
+
+def _record_fetch_state(outcomes: list[tuple], snapshot: dict[str, tuple]):
+    """
+    피드별 수집 결과(지연, 연속 실패 수, 차단 해제 시각)를 executemany UPDATE 한 번으로 기록.
+    snapshot: {url: (feed_id, fail_count, last_fetched_at)} (수집 전 상태)
+    """
+    now = datetime.utcnow()
+    params = []
+    for res, added in outcomes:
+        if res.url in snapshot:
+            feed_id, fails, fetched_at = snapshot[res.url]
+        else:
+            feed = _ensure_feed(res.url)  # 한 번도 성공 못한 피드도 상태는 남김
+            if not feed:
+                continue
+            feed_id, fails, fetched_at = feed.id, 0, None
+
+        if added is None:
+            fails += 1
+            wait = _backoff_seconds(fails)
+            params.append({
+                "id": feed_id,
+                "last_latency_ms": int(res.elapsed * 1000),
+                "last_fetched_at": fetched_at,
+                "fail_count": fails,
+                "last_error": (res.error or "unknown error")[:500],
+                "backoff_until": now + timedelta(seconds=wait) if wait else None,
+            })
+        else:
+            params.append({
+                "id": feed_id,
+                "last_latency_ms": int(res.elapsed * 1000),
+                "last_fetched_at": now,
+                "fail_count": 0,
+                "last_error": None,
+                "backoff_until": None,
+            })
+    if params:
+        db.session.execute(update(Feed), params)
+    db.session.commit()
+
+def _db_fingerprint() -> str:
+    """
+    필터 파일이 지금 DB 상태로 만든 것인지 확인하는 값: DB URI 해시 + articles 행 수 + 최대 id
+    (DB 초기화/교체/정리 뒤에 남은 필터를 쓰면 모든 URL이 '이미 봄'이 되어 수집이 멈춤)
+    """
+    uri = db.session.get_bind().url.render_as_string(hide_password=True)
+    n, max_id = db.session.query(func.count(Article.id), func.max(Article.id)).one()
+    return f"{hashlib.blake2b(uri.encode('utf-8'), digest_size=8).hexdigest()}:{n}:{max_id or 0}"
+
+def _seen_urls() -> BloomFilter:
+    """Bloom filter lazy load → 없거나, 포화됐거나, 다른 DB 상태로 만든 필터면 DB에서 재구성"""
+    global _seen, _seen_dirty
+    if _seen is not None:
+        return _seen
+
+    path = settings.SEEN_URL_BLOOM_PATH
+    bf = BloomFilter.load(path)  # capacity는 파일 헤더에서 (재구성 때 늘린 크기 유지)
+    fingerprint = _db_fingerprint()
+    if bf is not None and bf.tag != fingerprint:
+        print("[collector] seen-url filter does not match the database → rebuilding")
+        bf = None
+    if bf is None or bf.saturated:
+        n = db.session.query(Article.id).count()
+        bf = BloomFilter(capacity=max(settings.SEEN_URL_BLOOM_CAPACITY, n * 2),
+                         error_rate=settings.SEEN_URL_BLOOM_ERROR)
+        q = db.session.query(Article.url, Article.url_canonical).yield_per(5000)
+        for url, canon in q:
+            key = canon or canonicalize_url(url)
+            if key:
+                bf.add(key)
+        print(f"[collector] seen-url filter rebuilt from DB ({n} rows)")
+        _seen_dirty = True
+    _seen = bf
+    return _seen
+
+def _mark_seen(keys):
+    global _seen_dirty
+    bf = _seen_urls()
+    for k in keys:
+        if k and bf.add(k):
+            _seen_dirty = True
+
+def _persist_seen():
+    global _seen_dirty
+    if _seen is None or not _seen_dirty:
+        return
+    try:
+        _seen.tag = _db_fingerprint()  # 저장 시점(기사 커밋 후) DB 상태
+        _seen.save(settings.SEEN_URL_BLOOM_PATH)
+        _seen_dirty = False
+    except OSError as e:
+        print(f"[collector] ⚠️ seen-url filter save error: {e}")
+
+def _existing_keys(urls: list[str], canons: list[str]) -> set[str]:
+    """피드 단위 URL/정규화 URL을 IN 쿼리 한 번으로 조회"""
+    if not urls and not canons:
+        return set()
+    rows = (db.session.query(Article.url, Article.url_canonical)
+            .filter(or_(Article.url.in_(urls), Article.url_canonical.in_(canons)))
+            .all())
+    found = set()
+    for u, c in rows:
+        found.add(u)
+        if c:
+            found.add(c)
+    return found
+
+def _insert_articles(rows: list[dict]) -> int:
+    """
+    기사 행 일괄 INSERT (한 statement), 실제로 들어간 행 수 반환.
+    SQLite/Postgres는 ON CONFLICT DO NOTHING으로 동시 수집 경합에도 안전,
+    건너뛴 행은 RETURNING에 안 나오므로 반환값에서 빠짐.
+    """
+    if not rows:
+        return 0
+    table = Article.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        ins = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = ins(table).on_conflict_do_nothing(index_elements=["url"]).returning(table.c.id)
+        return len(db.session.execute(stmt, rows).all())
+    return db.session.execute(insert(table), rows).rowcount
+
+def _store_result(res) -> int:
+    """파싱된 피드 → Feed/Article 저장 (DB 작업은 이 함수에서만)"""
+    feed_url, parsed = res.url, res.parsed
     title = parsed.feed.get("title", urlparse(feed_url).netloc)
-    _ensure_feed(feed_url, title)
+    feed = _ensure_feed(feed_url, title)
 
-    inserted = 0
+    seen_urls = _seen_urls()
+    rows, batch_keys = [], set()
     for e in parsed.entries:
         url = e.get("link")
         if not url:
             continue
-        if Article.query.filter_by(url=url).first():
+        canon = canonicalize_url(url)
+        if canon in batch_keys:
             continue
-        art = Article(
-            source=title,
-            title=e.get("title"),
-            url=url,
-            summary_raw=e.get("summary"),
-            published_at=_to_datetime(e),
-            lang="auto",
-        )
-        db.session.add(art)
-        inserted += 1
-
-    if inserted:
-        db.session.commit()
+        batch_keys.add(canon)
+        if canon in seen_urls:
+            continue  # 이미 본 기사(변형 URL 포함) → DB 조회 없이 스킵
+        rows.append({
+            "source": title,
+            "title": e.get("title"),
+            "url": url,
+            "url_canonical": canon,
+            "summary_raw": e.get("summary"),
+            "published_at": _to_datetime(e),
+            "lang": "auto",
+        })
+
+    existing = _existing_keys([r["url"] for r in rows], [r["url_canonical"] for r in rows])
+    new_rows = [r for r in rows if r["url"] not in existing and r["url_canonical"] not in existing]
+    inserted = _insert_articles(new_rows)
+
+    if feed:
+        feed.etag = res.etag
+        feed.last_modified = res.last_modified
+    db.session.commit()
+
+    # 커밋 이후에만 seen 집합에 반영 (DB에 있던 것도 함께 → 다음엔 조회 생략)
+    _mark_seen(r["url_canonical"] for r in rows)
     return inserted
 
-def collect_rss_batch() -> int:
-    total = 0
-    for u in settings.FEEDS:
+def collect_rss_once(feed_url: str) -> int:
+    out = collect_feeds([feed_url])
+    if not out:
+        return 0  # backoff 중인 피드
+    res, added = out[0]
+    if added is None:
+        raise RuntimeError(res.error)
+    return added
+
+def collect_feeds(urls: list[str]) -> list[tuple]:
+    """
+    피드 목록 수집 → [(FetchResult, added)] (입력 순서 유지)
+    - added: 새로 저장된 기사 수 (오류면 None, 304면 0)
+    - 연속 실패로 backoff 중인 피드는 요청하지 않고 결과에서도 빠짐
+    """
+    feeds = _feed_states(urls)
+    snapshot = {u: (f.id, f.fail_count or 0, f.last_fetched_at) for u, f in feeds.items()}
+    validators = {u: (f.etag, f.last_modified) for u, f in feeds.items() if f.etag or f.last_modified}
+
+    now = datetime.utcnow()
+    blocked = {u for u, f in feeds.items() if f.backoff_until and f.backoff_until > now}
+    if blocked:
+        print(f"[collector] {len(blocked)} feeds skipped (circuit open)")
+    active = [u for u in urls if u not in blocked]
+
+    # 1) 네트워크: 전체 피드를 동시에(조건부 GET) 다운로드/파싱
+    results = fetch_feeds(active, validators=validators)
+
+    # 2) DB: 현재 스레드(단일 writer)에서 순차 저장
+    out = []
+    not_modified = 0
+    for res in results:
+        u = res.url
+        if res.error:
+            print(f"[collector] ⚠️ error {u}: {res.error}")
+            out.append((res, None))
+            continue
+        if res.not_modified:
+            not_modified += 1
+            out.append((res, 0))
+            continue
         try:
-            added = collect_rss_once(u)
-            total += added
-            print(f"[collector] {u} → {added} new articles")
+            added = _store_result(res)
+            print(f"[collector] {u} → {added} new articles ({res.elapsed:.2f}s)")
+            out.append((res, added))
         except Exception as ex:
             db.session.rollback()
             print(f"[collector] ⚠️ error {u}: {ex}")
-            continue
+            res.error = str(ex)
+            out.append((res, None))
+
+    # 3) 피드 상태(304 포함) 일괄 기록
+    try:
+        _record_fetch_state(out, snapshot)
+    except Exception as ex:
+        db.session.rollback()
+        print(f"[collector] ⚠️ feed state update error: {ex}")
+    _persist_seen()
+    if not_modified:
+        print(f"[collector] {not_modified} feeds not modified (304)")
+    return out
+
+def collect_rss_batch() -> int:
+    total = sum(added or 0 for _, added in collect_feeds(settings.FEEDS))
     print(f"[collector] ✅ total collected: {total}")
     return total
 
 
 def save_item(item):
     # item.url 은 필수
-    if Article.query.filter_by(url=item.url).first():
+    canon = canonicalize_url(item.url)
+    if canon in _seen_urls() or _existing_keys([item.url], [canon]):
         return False  # 이미 존재
 
-    a = Article(
-        source=item.source,
-        title=item.title,
-        url=item.url,
-        summary_raw=item.summary,   # RSS 요약
-        content_raw=None,
-        published_at=item.published_at,
-        lang="auto"
-    )
-    db.session.add(a)
     try:
+        inserted = _insert_articles([{
+            "source": item.source,
+            "title": item.title,
+            "url": item.url,
+            "url_canonical": canon,
+            "summary_raw": item.summary,   # RSS 요약
+            "content_raw": None,
+            "published_at": item.published_at,
+            "lang": "auto",
+        }])
         db.session.commit()
-        return True
+        _mark_seen([canon])
+        return inserted > 0  # 동시 수집이 먼저 넣었으면 충돌로 건너뜀
     except Exception:
         db.session.rollback()
-        return False
\ No newline at end of file
+        return False
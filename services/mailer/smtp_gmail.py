@@ -10,7 +10,6 @@ from apps.api.models import Article
 from shared.db import db
 from shared.settings import settings
 from services.recommend.ranker import rank_articles
-from services.analyzer.sentiment import analyze_text_sentiment
 
 GMAIL_ADDR = os.getenv("GMAIL_ADDR")
 GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD")
@@ -31,12 +30,12 @@ def _compute_bias_metrics(articles):
     """
     bucket = {}
     for a in articles:
-        s = getattr(a, "_sentiment", None)
-        if not s:
+        label = getattr(a, "sentiment_label", None)  # 분석 파이프라인에서 저장된 값
+        if not label:
             continue
         tid = a.topic_id if getattr(a, "topic_id", None) is not None else -1
         b = bucket.setdefault(tid, {"pos": 0, "neu": 0, "neg": 0})
-        b[s["label"]] = b.get(s["label"], 0) + 1
+        b[label] = b.get(label, 0) + 1
 
     rows = []
     for tid, c in bucket.items():
@@ -106,12 +105,10 @@ def send_daily_newsletter_gmail(to_email: str, preview_count: int = 10, prefs_ov
     topic_metrics = []
     if INCLUDE_SENTIMENT and articles:
         for a in articles:
-            base = a.content_clean or a.summary_gen or a.summary_raw or a.title
-            s = analyze_text_sentiment(base or "")
-            a._sentiment = s
-            if s:
-                a._sent_icon  = "🟢" if s["label"] == "pos" else ("🟡" if s["label"] == "neu" else "🔴")
-                a._sent_label = {"pos":"긍정","neu":"중립","neg":"부정"}[s["label"]]
+            label = a.sentiment_label
+            if label in ("pos", "neu", "neg"):
+                a._sent_icon  = "🟢" if label == "pos" else ("🟡" if label == "neu" else "🔴")
+                a._sent_label = {"pos":"긍정","neu":"중립","neg":"부정"}[label]
             else:
                 a._sent_icon, a._sent_label = "⚪", "N/A"
         topic_metrics = _compute_bias_metrics(articles)
@@ -133,26 +130,20 @@ def send_daily_newsletter_gmail(to_email: str, preview_count: int = 10, prefs_ov
 
 
 def _attach_per_article_sentiment(articles: list[Article]) -> list[Article]:
+    # 저장된 감성 컬럼 → 템플릿용 뱃지/분포 (발송 시 모델 추론 없음)
     for a in articles:
-        base = (a.summary_gen or a.summary_ko or a.content_clean or a.summary_raw or a.title or "") or ""
-        if not base.strip():
+        if not a.sentiment_label:
             continue
-        try:
-            s = analyze_text_sentiment(base[:1200])  # 너무 길면 오래 걸리니 1200자 정도 컷
-            if s:
-                dist = s.get("dist", {})
-                pos = float(dist.get("pos", 0.0))
-                neu = float(dist.get("neu", 0.0))
-                neg = float(dist.get("neg", 0.0))
-                tot = max(1e-9, pos + neu + neg)
-                a._sent = {
-                    "label": s.get("label"),
-                    "polarity": round(s.get("polarity", 0.0), 3),
-                    "pos_pct": round(pos / tot * 100.0, 1),
-                    "neu_pct": round(neu / tot * 100.0, 1),
-                    "neg_pct": round(neg / tot * 100.0, 1),
-                }
-        except Exception as e:
-            # 조용히 스킵 (메일 전체 실패 방지)
-            print(f"[mailer] sentiment fail article_id={getattr(a,'id',None)}: {e}")
-    return articles
\ No newline at end of file
+        dist = a.sentiment_dist or {}
+        pos = float(dist.get("pos", 0.0))
+        neu = float(dist.get("neu", 0.0))
+        neg = float(dist.get("neg", 0.0))
+        tot = max(1e-9, pos + neu + neg)
+        a._sent = {
+            "label": a.sentiment_label,
+            "polarity": round(a.sentiment_polarity or 0.0, 3),
+            "pos_pct": round(pos / tot * 100.0, 1),
+            "neu_pct": round(neu / tot * 100.0, 1),
+            "neg_pct": round(neg / tot * 100.0, 1),
+        }
+    return articles
@@ -1,32 +1,134 @@
 import re
-from typing import Tuple
-
-# 기존 패턴 보강(영/한 혼합 + 뉴스레터/티저/요지형)
-_BOILERPLATE_PATTERNS = [
-    r"\bhere'?s what (you|to) know\b",
-    r"\bwhat (we|to) know( so far)?\b",
-    r"\bread more\b",
-    r"\bclick here\b",
-    r"\bsubscribe( now| to)?\b",
-    r"\bwatch( the)? video\b",
-    r"\b(opinion|editorial)\b",
-    r"\bnewsletter sign[- ]?up\b",
-    r"\b(as|this) (reported|reported earlier)\b",
-    r"\b(continue|continued) (reading|to read)\b",
-    r"\btop stories\b", r"\bmost read\b", r"\brecommended\b", r"\btrending\b",
-    r"여기서\s*알아야\s*할\s*것", r"자세히\s*보기", r"더\s*읽어보기",
-    r"구독하고\s*읽기", r"회원\s*가입", r"로그인하고\s*계속",
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+# 보일러플레이트 규칙 표: (이름, 종류, 정규식, 필수 리터럴)
+# - 종류: strip(본문에서 직접 삭제) | flag(저품질 판정) | tail(꼬리 CTA) | lead(머리 티저)
+# - 필수 리터럴: 매칭되려면 반드시 (소문자로) 포함돼야 하는 문자열 → 하나도 없으면 정규식 생략
+_RULES = [
+    # 하드 보일러/페이월 문구 (clean.py에서 본문 텍스트 삭제)
+    ("strip_cta", "strip", r"\b(read more|click here|continue reading|subscribe( now| to)?)\b",
+     ("read more", "click here", "continue reading", "subscribe")),
+    ("strip_paywall", "strip", r"\b(you’ve reached your limit|sign in to continue|access denied)\b",
+     ("reached your limit", "sign in to continue", "access denied")),
+    ("strip_ko", "strip", r"(자세히\s*보기|더\s*읽어보기|구독하고\s*읽기|회원\s*가입|로그인하고\s*계속)",
+     ("자세히", "읽어보기", "구독하고", "회원", "로그인하고")),
+
+    # 저품질 판정 (영/한 혼합 + 뉴스레터/티저/요지형)
+    ("heres_what_to_know", "flag", r"\bhere'?s what (you|to) know\b", ("know",)),
+    ("what_we_know", "flag", r"\bwhat (we|to) know( so far)?\b", ("know",)),
+    ("read_more", "flag", r"\bread more\b", ("read more",)),
+    ("click_here", "flag", r"\bclick here\b", ("click here",)),
+    ("subscribe", "flag", r"\bsubscribe( now| to)?\b", ("subscribe",)),
+    ("watch_video", "flag", r"\bwatch( the)? video\b", ("video",)),
+    ("opinion", "flag", r"\b(opinion|editorial)\b", ("opinion", "editorial")),
+    ("newsletter_signup", "flag", r"\bnewsletter sign[- ]?up\b", ("newsletter",)),
+    ("as_reported", "flag", r"\b(as|this) (reported|reported earlier)\b", ("reported",)),
+    ("continue_reading", "flag", r"\b(continue|continued) (reading|to read)\b", ("continue",)),
+    ("top_stories", "flag", r"\btop stories\b", ("top stories",)),
+    ("most_read", "flag", r"\bmost read\b", ("most read",)),
+    ("recommended", "flag", r"\brecommended\b", ("recommended",)),
+    ("trending", "flag", r"\btrending\b", ("trending",)),
+    ("what_to_know_ko", "flag", r"여기서\s*알아야\s*할\s*것", ("알아야",)),
+    ("see_more_ko", "flag", r"자세히\s*보기", ("자세히",)),
+    ("read_more_ko", "flag", r"더\s*읽어보기", ("읽어보기",)),
+    ("subscribe_ko", "flag", r"구독하고\s*읽기", ("구독하고",)),
+    ("signup_ko", "flag", r"회원\s*가입", ("회원",)),
+    ("login_ko", "flag", r"로그인하고\s*계속", ("로그인하고",)),
+
+    # 꼬리(CTA/구독/더보기), 머리(“Here’s what to know” 등) 후보
+    ("tail_cta", "tail", r"(read more|click here|subscribe|자세히\s*보기|구독하고\s*읽기|회원\s*가입|로그인하고\s*계속)",
+     ("read more", "click here", "subscribe", "자세히", "구독하고", "회원", "로그인하고")),
+    ("lead_teaser", "lead", r"^(here'?s what (you|to) know|what (we|to) know( so far)?|top stories|most read|recommended)\W+",
+     ("know", "top stories", "most read", "recommended")),
 ]
 
+
+@dataclass(frozen=True)
+class BoilerHit:
+    rule: str
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+_PATTERN_CACHE = 256  # 후보 규칙 조합별 컴파일 결과 최대 개수 (조합 수가 많아도 메모리 상한)
+
+
+class BoilerplateMatcher:
+    """
+    보일러플레이트 규칙을 한 번에 검사하는 매처
+    - 1) 소문자 텍스트에서 필수 리터럴 포함 여부로 후보 규칙만 추림(대부분의 기사는 여기서 끝)
+    - 2) search/sub: 후보 규칙만 이름 있는 그룹 alternation 하나로 컴파일해서 텍스트를 한 번만 스캔
+      (같은 위치에서 겹치면 규칙 표 앞쪽이 우선), 조합별 컴파일은 LRU로 상한
+    - 3) scan: 후보 규칙마다 따로 훑어 규칙끼리 겹치는 히트까지 전부 반환
+    """
+
+    def __init__(self, rules: Iterable[tuple[str, str, str, tuple[str, ...]]] = _RULES):
+        self.rules = list(rules)
+        self._rule_rx = [re.compile(rx, re.I) for _, _, rx, _ in self.rules]
+        self._pattern = lru_cache(maxsize=_PATTERN_CACHE)(self._compile)
+
+    def _candidates(self, text: str, kinds: Iterable[str] | None) -> tuple[int, ...]:
+        low = text.lower()
+        kinds = set(kinds) if kinds else None
+        return tuple(i for i, (_, kind, _, needles) in enumerate(self.rules)
+                     if (kinds is None or kind in kinds) and any(n in low for n in needles))
+
+    def _compile(self, idx: tuple[int, ...]) -> re.Pattern:
+        return re.compile("|".join(f"(?P<r{i}>{self.rules[i][2]})" for i in idx), re.I)
+
+    def _hit(self, m: re.Match) -> BoilerHit:
+        name, kind, _, _ = self.rules[int(m.lastgroup[1:])]
+        return BoilerHit(name, kind, m.start(), m.end(), m.group(0))
+
+    def scan(self, text: str, kinds: Iterable[str] | None = None) -> list[BoilerHit]:
+        """모든 히트(규칙 이름/종류/위치), 위치순 — 여러 규칙이 같은 구간에 걸리면 규칙마다 하나씩"""
+        if not text:
+            return []
+        hits = []
+        for i in self._candidates(text, kinds):
+            name, kind, _, _ = self.rules[i]
+            hits.extend((m.start(), i, BoilerHit(name, kind, m.start(), m.end(), m.group(0)))
+                        for m in self._rule_rx[i].finditer(text))
+        hits.sort(key=lambda h: h[:2])
+        return [h for _, _, h in hits]
+
+    def search(self, text: str, kinds: Iterable[str] | None = None) -> BoilerHit | None:
+        """첫 히트만 (판정용)"""
+        if not text:
+            return None
+        idx = self._candidates(text, kinds)
+        if not idx:
+            return None
+        m = self._pattern(idx).search(text)
+        return self._hit(m) if m else None
+
+    def sub(self, text: str, kinds: Iterable[str], repl: str = "") -> str:
+        if not text:
+            return text
+        idx = self._candidates(text, kinds)
+        if not idx:
+            return text
+        return self._pattern(idx).sub(repl, text)
+
+
+matcher = BoilerplateMatcher()
+
 # 최소 요건 + 문장/고유어 비율 가드레일
 _MIN_CHARS = 280
 _MIN_WORDS = 45
 _MIN_SENTENCES = 3
 _MIN_UNIQUE_RATIO = 0.35  # 고유 단어 비율
 
-_RXES = [re.compile(pat, re.I) for pat in _BOILERPLATE_PATTERNS]
 _WORD_RX = re.compile(r"[A-Za-z0-9가-힣']+", re.UNICODE)
 _SENT_RX = re.compile(r"[.!?…]+[\s\"]+")
+_TAIL_RX = re.compile(r"(?:\n|\r|\s)+(read more|click here|subscribe.*|자세히\s*보기|구독하고\s*읽기|회원\s*가입|로그인하고\s*계속).*$",
+                      re.I)
+_LEAD_RX = re.compile(r"^(here'?s what (you|to) know|what (we|to) know( so far)?|top stories|most read|recommended)\W+",
+                      re.I)
 
 def _unique_ratio(words: list[str]) -> float:
     if not words:
@@ -49,24 +151,25 @@ def looks_like_boilerplate(text: str) -> bool:
     if _unique_ratio([w.lower() for w in words]) < _MIN_UNIQUE_RATIO:
         return True
 
-    # 패턴 매칭
-    for rx in _RXES:
-        if rx.search(t):
-            return True
-    return False
+    # 패턴 매칭 (규칙 전체를 한 번에)
+    return matcher.search(t, kinds=("flag",)) is not None
 
 def strip_boiler_leading_trailing(text: str) -> Tuple[str, bool]:
     if not text:
         return text, False
     orig = text
+    t = text
+
+    # 후보 리터럴이 있을 때만 앵커 정규식 실행
+    hits = {h.kind for h in matcher.scan(text, kinds=("tail", "lead"))}
 
     # 꼬리(CTA/구독/더보기) 제거
-    t = re.sub(r"(?:\n|\r|\s)+(read more|click here|subscribe.*|자세히\s*보기|구독하고\s*읽기|회원\s*가입|로그인하고\s*계속).*$",
-               "", text, flags=re.I)
+    if "tail" in hits:
+        t = _TAIL_RX.sub("", t)
 
     # 머리(“Here’s what to know” 등) 제거
-    t = re.sub(r"^(here'?s what (you|to) know|what (we|to) know( so far)?|top stories|most read|recommended)\W+",
-               "", t, flags=re.I)
+    if "lead" in hits:
+        t = _LEAD_RX.sub("", t)
 
     t = t.strip()
     return (t, t != orig)
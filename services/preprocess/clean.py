@@ -1,5 +1,13 @@
 import re
 from bs4 import BeautifulSoup
+from shared.settings import settings
+from services.preprocess.boilerplate import matcher
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml 미설치 → bs4 백엔드만 사용
+    lxml = None
 
 # 광고/공유/푸터 등에 자주 등장하는 패턴(클래스/아이디/role/aria 등)
 NOISE_PATTERNS = [
@@ -11,26 +19,64 @@ NOISE_PATTERNS = [
 ]
 _noise_re = re.compile("|".join(NOISE_PATTERNS), re.I)
 
-# 하드 보일러/페이월 문구(본문 텍스트에서 직접 삭제)
-HARD_STRIP_PATTERNS = [
-    r"\b(read more|click here|continue reading|subscribe( now| to)?)\b",
-    r"\b(you’ve reached your limit|sign in to continue|access denied)\b",
-    r"(자세히\s*보기|더\s*읽어보기|구독하고\s*읽기|회원\s*가입|로그인하고\s*계속)",
-]
-_hard_strip_re = re.compile("|".join(HARD_STRIP_PATTERNS), re.I)
-
 
 def _strip_inline_boiler(text: str) -> str:
-    t = _hard_strip_re.sub("", text or "")
+    # 하드 보일러/페이월 문구(본문 텍스트에서 직접 삭제) — boilerplate 규칙 표의 strip 규칙
+    t = matcher.sub(text or "", kinds=("strip",))
     # 중복 구두점/여백 정리
     t = re.sub(r"\s+", " ", t)
     t = re.sub(r"\.{3,}", "...", t)
     t = re.sub(r"[!?]{3,}", "!!", t)
     return t.strip()
 
-def clean_html_to_text(html_or_summary: str | None) -> str | None:
-    if not html_or_summary:
-        return None
+_DROP_TAGS = {"script", "style", "noscript", "template"}
+_NOISE_ROLES = {"banner", "navigation", "complementary", "contentinfo"}
+
+
+def _finish(text: str) -> str | None:
+    text = _strip_inline_boiler(text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text if text else None
+
+
+def _clean_lxml(html: str) -> str | None:
+    """
+    lxml 백엔드: bs4(html.parser) 경로와 같은 규칙/순서로 노이즈 제거 후 텍스트 추출.
+    (C 파서 + 속성 문자열 조합 최소화로 긴 페이지에서 훨씬 빠름)
+    """
+    root = lxml.html.document_fromstring(html)
+
+    # 제거는 clear(keep_tail=True): 뒤따르는 텍스트를 앞 텍스트에 붙이지 않고 별도 조각으로 유지
+    # (drop_tree는 tail을 이전 텍스트에 이어붙여 bs4와 단어 경계가 달라짐)
+
+    # 1) 스크립트/스타일 제거
+    for el in list(root.iter(*_DROP_TAGS)):
+        el.clear(keep_tail=True)
+
+    # 2) role/aria/클래스/아이디 기반 노이즈 제거 (문서 순서, 부모 먼저)
+    for el in list(root.iter(etree.Element)):
+        attrib = el.attrib
+        role = (attrib.get("role") or "").lower()
+        aria = (attrib.get("aria-label") or "").lower()
+        cls = " ".join((attrib.get("class") or "").split())
+        attrs = " ".join([attrib.get("id", ""), cls, role, aria]).lower()
+        if (role in _NOISE_ROLES or
+            "aria-hidden" in attrib or
+            (attrs and _noise_re.search(attrs))):
+            el.clear(keep_tail=True)
+            continue
+
+        if el.tag == "a" and len("".join(t.strip() for t in el.itertext())) <= 2:
+            el.clear(keep_tail=True)
+
+    # 3) 텍스트 추출 (strip 후 빈 조각 제외, 공백으로 연결)
+    parts = [t.strip() for t in root.itertext()]
+    if root.tail:
+        parts.append(root.tail.strip())
+    return _finish(" ".join(t for t in parts if t))
+
+
+def _clean_bs4(html_or_summary: str) -> str | None:
     soup = BeautifulSoup(html_or_summary, "html.parser")
 
     # 1) 스크립트/스타일 제거
@@ -39,6 +85,8 @@ def clean_html_to_text(html_or_summary: str | None) -> str | None:
 
     # 2) role/aria/클래스/아이디 기반 노이즈 제거
     for tag in soup.find_all(True):
+        if tag.decomposed:  # 이미 제거된 부모 안의 태그
+            continue
         # semantic role/aria-label 우선
         role = (tag.get("role") or "").lower()
         aria = (tag.get("aria-label") or "").lower()
@@ -57,10 +105,21 @@ def clean_html_to_text(html_or_summary: str | None) -> str | None:
         if tag.name in {"figure", "figcaption"} and _noise_re.search(attrs):
             tag.decompose()
 
-    # 3) 텍스트 추출
-    text = soup.get_text(separator=" ", strip=True)
-    text = _strip_inline_boiler(text)
+    # 3) 텍스트 추출 + 4) 공백 정리
+    return _finish(soup.get_text(separator=" ", strip=True))
 
-    # 4) 공백 정리
-    text = re.sub(r"\s+", " ", text).strip()
-    return text if text else None
+
+def clean_html_to_text(html_or_summary: str | None, backend: str | None = None) -> str | None:
+    """
+    HTML/요약 → 정제 텍스트
+    - backend: "bs4" | "lxml" (기본값 settings.HTML_CLEAN_BACKEND, lxml 미설치 시 bs4)
+    """
+    if not html_or_summary:
+        return None
+    backend = (backend or settings.HTML_CLEAN_BACKEND).lower()
+    if backend == "lxml" and lxml is not None:
+        try:
+            return _clean_lxml(html_or_summary)
+        except (etree.ParserError, ValueError):
+            pass  # 빈 문서/인코딩 선언 문자열 등 → bs4 경로로
+    return _clean_bs4(html_or_summary)
@@ -2,6 +2,11 @@ import re
 import hashlib
 from typing import Iterable
 
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 → 배치 API는 순수 파이썬으로 fallback
+    np = None
+
 _TOKEN_RX = re.compile(r"[A-Za-z0-9가-힣]+")
 
 def _tokens(s: str) -> list[str]:
@@ -44,8 +49,86 @@ def simhash64(text: str, title: str | None = None) -> int:
             v |= (1 << i)
     return v
 
+# 배치 simhash: 한 번에 (특징 수 × 64) 행렬로 처리할 최대 특징 수 (메모리 상한)
+# 2**15 → (n, 64) int64 배열 하나가 16 MB, 중간 배열(shift/bits/votes)까지 최고 ~64 MB
+# (한 문서가 이보다 크면 그 문서 하나만으로 한 청크)
+_BATCH_MAX_FEATURES = 1 << 15
+
+def _doc_features(text: str, title: str | None) -> tuple[list[int], list[int]] | None:
+    """simhash64와 동일한 특징/가중치 (3-gram shingle 1, 제목 토큰 2)"""
+    tokens = _tokens(text)
+    if not tokens:
+        return None
+    feats = [_feature_hash(g) for g in _shingles(tokens, k=3)]
+    weights = [1] * len(feats)
+    if title:
+        tf = [_feature_hash(tk) for tk in _tokens(title)]
+        feats += tf
+        weights += [2] * len(tf)
+    return feats, weights
+
+def _vote_chunk(docs: list[tuple[int, list[int], list[int]]], out: list[int]):
+    # docs: [(원래 위치, 특징 해시들, 가중치들)] → 문서별 64비트 투표 합을 한 번에 계산
+    hashes = np.fromiter((h for _, f, _ in docs for h in f), dtype=np.uint64)
+    weights = np.fromiter((w for _, _, ws in docs for w in ws), dtype=np.int64)
+    starts = np.cumsum([0] + [len(f) for _, f, _ in docs[:-1]])
+
+    shifts = np.arange(64, dtype=np.uint64)
+    bits = ((hashes[:, None] >> shifts) & np.uint64(1)).astype(np.int64)   # (n, 64)
+    votes = (2 * bits - 1) * weights[:, None]                                 # +w / -w
+    sums = np.add.reduceat(votes, starts, axis=0)                             # (docs, 64)
+
+    packed = ((sums >= 0).astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+    for (pos, _, _), v in zip(docs, packed.tolist()):
+        out[pos] = int(v)
+
+def simhash64_batch(docs: list[tuple[str, str | None]]) -> list[int]:
+    """
+    여러 문서의 simhash64를 한 번에 계산 [(text, title)] → [hash]
+    - shingle 해시는 문서별로, 비트 투표 누적은 NumPy 행렬 연산으로 배치 처리
+    - 결과는 simhash64(text, title)와 비트 단위로 동일
+    """
+    if np is None:
+        return [simhash64(text, title=title) for text, title in docs]
+
+    out = [0] * len(docs)
+    chunk, n_feats = [], 0
+    for pos, (text, title) in enumerate(docs):
+        fw = _doc_features(text, title)
+        if fw is None:
+            continue  # 토큰 없음 → 0 (simhash64와 동일)
+        chunk.append((pos, fw[0], fw[1]))
+        n_feats += len(fw[0])
+        if n_feats >= _BATCH_MAX_FEATURES:
+            _vote_chunk(chunk, out)
+            chunk, n_feats = [], 0
+    if chunk:
+        _vote_chunk(chunk, out)
+    return out
+
+_WS_RX = re.compile(r"\s+")
+
+def content_hash(raw: str | None) -> str | None:
+    """
+    원문(HTML 포함) 완전 일치 판별용 해시: 공백만 정규화한 뒤 blake2b-128 hex
+    - 통신사 기사처럼 여러 소스에 같은 본문이 그대로 실린 경우를 정제/simhash 전에 거름
+    """
+    t = _WS_RX.sub(" ", raw or "").strip()
+    if not t:
+        return None
+    return hashlib.blake2b(t.encode("utf-8"), digest_size=16).hexdigest()
+
+def to_signed64(v: int) -> int:
+    """부호 없는 64비트 → signed BIGINT 컬럼 저장값 (비트 패턴 동일)"""
+    return v - (1 << 64) if v >= (1 << 63) else v
+
+def to_unsigned64(v: int) -> int:
+    """signed BIGINT 컬럼 값 → simhash64()와 같은 부호 없는 값"""
+    return v + (1 << 64) if v < 0 else v
+
 def hamming_distance64(a: int, b: int) -> int:
-    return (a ^ b).bit_count()
+    # signed/unsigned 어느 표현이 섞여도 하위 64비트만 비교
+    return ((a ^ b) & 0xFFFFFFFFFFFFFFFF).bit_count()
 
 def _adaptive_threshold(char_len: int) -> int:
     # 길수록 임계값 경감(더 빡빡)
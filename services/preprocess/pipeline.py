@@ -1,97 +1,312 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy import func, update
+
 from shared.db import db
+from shared.settings import settings
 from apps.api.models import Article
-from services.preprocess.clean import clean_html_to_text
-from services.preprocess.boilerplate import looks_like_boilerplate, strip_boiler_leading_trailing
-from services.preprocess.dedup import simhash64, is_near_duplicate
-
-def preprocess_new_articles(batch_size: int = 100) -> dict:
-    q = (Article.query
-         .filter(Article.content_clean.is_(None))
-         .order_by(Article.id.desc())
-         .limit(batch_size))
-    items = q.all()
-    if not items:
-        return {"processed": 0, "duplicates": 0, "dropped_low_quality": 0}
-
-    # 최근 캐시(소스별 + 글로벌)
-    recent = (Article.query
-              .filter(Article.simhash64.isnot(None))
-              .order_by(Article.id.desc())
-              .limit(1500)
-              .all())
-
-    recent_by_source: dict[str, list[Article]] = {}
-    for r in recent:
-        recent_by_source.setdefault(r.source or "", []).append(r)
-
-    processed = 0
-    duplicates = 0
-    dropped_low_quality = 0
-
-    for a in items:
-        # 1) Raw 선택
-        raw = a.content_raw or a.summary_raw or a.title
-
-        # 2) HTML -> 텍스트
-        cleaned = clean_html_to_text(raw) or ""
-
-        # 3) 보일러 앞/뒤 제거
-        cleaned, _ = strip_boiler_leading_trailing(cleaned)
-
-        # 4) 품질 가드레일(너무 짧거나 티저/페이월 등)
-        if looks_like_boilerplate(cleaned):
-            # 품질이 낮으면 요약/발송 파이프라인에서 제외(필요 시 상태 필드 사용)
-            a.content_clean = cleaned
-            a.is_duplicate = False
-            a.duplicate_of_id = None
-            if hasattr(a, "quality_flags"):
-                a.quality_flags = "low_quality/boilerplate"
-            dropped_low_quality += 1
-            processed += 1
+from services.preprocess.dedup import content_hash, to_signed64, to_unsigned64
+from services.preprocess.simindex import get_index, save_index, sql_find_duplicate, sql_lookup_supported
+from services.preprocess.worker import prepare_chunk
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """전처리 워커 풀 (프로세스 공용, 워커 수가 바뀌면 재생성)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # 스케줄러 스레드가 도는 프로세스에서 fork하면 잠금 상태가 복제될 수 있어 spawn 사용
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+def _chunks(rows: list, size: int):
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _write_chunk(prepared: list[tuple[int, str, bool, int]], sources: dict[int, str],
+                 hashes: dict[int, str | None], index, stats: dict, done: dict[int, dict]):
+    """워커 결과 → 중복 판정 + UPDATE (커밋은 호출자), 쓴 값은 done[id]에 보관"""
+    params = []
+    for aid, cleaned, low, sh in prepared:
+        p = {"id": aid, "content_clean": cleaned, "content_hash": hashes.get(aid),
+             "is_duplicate": False, "duplicate_of_id": None, "simhash64": None}
+        done[aid] = p
+        stats["processed"] += 1
+
+        # 2) 품질이 낮으면 요약/발송 파이프라인에서 제외
+        if low:
+            if hasattr(Article, "quality_flags"):
+                p["quality_flags"] = "low_quality/boilerplate"
+            stats["dropped_low_quality"] += 1
+            params.append(p)
             continue
 
-        a.content_clean = cleaned
-        if hasattr(a, "content_clean_len"):
-            a.content_clean_len = len(cleaned)
-
-        # 5) simhash(제목 가중)
-        sh = simhash64(cleaned, title=(a.title or ""))
-        a.simhash64 = str(sh) if sh else None
-
-        # 6) 근접 중복 판정(동일 소스 우선, 없으면 글로벌)
-        dup_target = None
-        pools = []
-        if (a.source or "") in recent_by_source:
-            pools.append(recent_by_source[a.source or ""])
-        pools.append(recent)  # 글로벌 백업
-
-        for pool in pools:
-            for r in pool:
-                if not r.simhash64:
-                    continue
-                try:
-                    rh = int(r.simhash64)
-                except Exception:
-                    continue
-                if is_near_duplicate(sh, rh, char_len=len(cleaned), base_threshold=None):
-                    dup_target = r
-                    break
-            if dup_target:
-                break
+        if hasattr(Article, "content_clean_len"):
+            p["content_clean_len"] = len(cleaned)
+        p["simhash64"] = to_signed64(sh) if sh else None
+
+        # 3) 근접 중복 판정(동일 소스 우선, 없으면 글로벌)
+        source = sources.get(aid)
+        if index is None:
+            dup_id = sql_find_duplicate(sh, source=source, char_len=len(cleaned), exclude_id=aid)
+        else:
+            dup_id = index.find_duplicate(sh, source=source, char_len=len(cleaned), exclude_id=aid)
+        if dup_id:
+            p["is_duplicate"] = True
+            p["duplicate_of_id"] = dup_id
+            stats["duplicates"] += 1
 
-        if dup_target:
-            a.is_duplicate = True
-            a.duplicate_of_id = dup_target.id
-            duplicates += 1
+        # 같은 배치 안의 후속 기사도 비교 대상이 되도록
+        if index is not None:
+            index.add(aid, sh, source)
+            params.append(p)
         else:
-            a.is_duplicate = False
-            a.duplicate_of_id = None
+            db.session.execute(update(Article), [p])  # SQL 조회 모드: 바로 반영(같은 트랜잭션)
+
+    if params:
+        db.session.execute(update(Article), params)
+
+
+_PENDING_COLS = (Article.id, Article.content_raw, Article.summary_raw, Article.title, Article.source)
+
+
+def _known_hashes(hs: set[str]) -> dict[str, dict]:
+    """이미 전처리된 기사 중 같은 content_hash → 가장 오래된 기사의 결과"""
+    out: dict[str, dict] = {}
+    if not hs:
+        return out
+    rows = (db.session.query(Article.content_hash, Article.id, Article.content_clean,
+                             Article.simhash64, Article.duplicate_of_id)
+            .filter(Article.content_hash.in_(hs))
+            .filter(Article.content_clean.isnot(None))
+            .order_by(Article.id)
+            .all())
+    for h, aid, cleaned, sh, dup_of in rows:
+        if h not in out:
+            out[h] = {"id": aid, "content_clean": cleaned, "simhash64": sh, "duplicate_of_id": dup_of}
+    return out
+
+
+def _write_exact_duplicates(exact: list[tuple[int, str]], known: dict[str, dict], batch: dict[str, dict],
+                            sources: dict[int, str], index, stats: dict):
+    """완전 일치 사본: 원본의 정제 결과를 복사하고 원본(원본이 중복이면 그 대상)을 가리킴"""
+    params = []
+    for aid, h in exact:
+        orig = known.get(h) or batch.get(h)
+        if orig is None:
+            continue
+        sh = orig["simhash64"]
+        params.append({
+            "id": aid, "content_hash": h, "content_clean": orig["content_clean"], "simhash64": sh,
+            "is_duplicate": True, "duplicate_of_id": orig["duplicate_of_id"] or orig["id"],
+        })
+        if index is not None and sh:
+            index.add(aid, to_unsigned64(sh), sources.get(aid))
+        stats["processed"] += 1
+        stats["duplicates"] += 1
+        stats["exact_duplicates"] += 1
+    if params:
+        db.session.execute(update(Article), params)
+
 
-        processed += 1
+def _process_rows(rows: list, workers: int, index=None) -> dict:
+    """
+    (id, content_raw, summary_raw, title, source) 행 묶음 전처리
+    - 원문 해시가 이미 본 기사와 같으면 정제/simhash 없이 바로 중복 처리
+    - 정제/보일러 검사/simhash는 청크 단위로 워커 프로세스에서(workers > 1)
+    - 중복 판정과 DB 쓰기는 현재 프로세스에서 청크 순서대로, 청크마다 커밋
+    """
+    chunk_size = max(1, settings.PREPROCESS_CHUNK_SIZE)
+    # 배치 안에서는 오래된 기사부터 → 중복은 먼저 들어온 기사를 가리키도록
+    rows = sorted(rows, key=lambda r: r[0])
+    sources = {r[0]: r[4] for r in rows}
+
+    # 1) Raw 선택 (본문 → 요약 → 제목)
+    payloads = [(aid, content or summary or title, title) for aid, content, summary, title, _ in rows]
+
+    # 2) 완전 일치 fast path: 이전 기사 또는 배치 안 앞선 기사와 원문 해시가 같으면 건너뜀
+    hashes = {aid: content_hash(raw) for aid, raw, _ in payloads}
+    known = _known_hashes({h for h in hashes.values() if h})
+    first: dict[str, int] = {}
+    exact: list[tuple[int, str]] = []
+    todo = []
+    for pl in payloads:
+        h = hashes[pl[0]]
+        if h and (h in known or h in first):
+            exact.append((pl[0], h))
+            continue
+        if h:
+            first[h] = pl[0]
+        todo.append(pl)
+
+    chunks = list(_chunks(todo, chunk_size))
+    if workers > 1 and len(chunks) > 1:
+        results = _get_pool(workers).map(prepare_chunk, chunks)
+    else:
+        results = map(prepare_chunk, chunks)
+
+    stats = {"processed": 0, "duplicates": 0, "exact_duplicates": 0, "dropped_low_quality": 0}
+    done: dict[int, dict] = {}
+    uncommitted: list[int] = []  # 인덱스에는 들어갔지만 아직 커밋 안 된 기사 id
+    try:
+        for prepared in results:
+            uncommitted = [aid for aid, *_ in prepared]
+            _write_chunk(prepared, sources, hashes, index, stats, done)
+            # 청크 단위 커밋: 중간에 실패해도 앞 청크 결과는 보존
+            db.session.commit()
+            uncommitted = []
+
+        if exact:
+            uncommitted = [aid for aid, _ in exact]
+            by_hash = {h: done[aid] for h, aid in first.items() if aid in done}
+            _write_exact_duplicates(exact, known, by_hash, sources, index, stats)
+            db.session.commit()
+    except Exception as e:
+        # 롤백된 행은 인덱스에서도 빼기 → 호출자의 save_index()가 DB에 없는 결과를 영속화하지 않음
+        # (체크포인트는 호출자가 성공한 페이지 뒤에만 기록 → 실패 페이지는 다음 실행에서 content_clean IS NULL로 다시 잡힘)
+        db.session.rollback()
+        if index is not None:
+            for aid in uncommitted:
+                index.remove(aid)
+        if isinstance(e, BrokenProcessPool):
+            shutdown_pool()  # 다음 호출에서 새 풀 생성
+        raise
+    return stats
+
+
+def _dup_index():
+    # 밴드 simhash 인덱스 (전체 이력, 버킷 후보만 비교)
+    # SIMHASH_LOOKUP=sql 이고 DB가 bit_count를 지원하면 후보 검색을 SQL에서 수행(None)
+    if settings.SIMHASH_LOOKUP == "sql" and sql_lookup_supported():
+        return None
+    return get_index()
+
+
+def preprocess_new_articles(batch_size: int = 100, workers: int | None = None) -> dict:
+    """전처리 대상(content_clean 없음) 중 최신 batch_size건 (폴링 직후 등 신규 기사용)"""
+    workers = settings.PREPROCESS_WORKERS if workers is None else workers
+
+    # ORM 객체 대신 필요한 컬럼만 (청크 커밋 후 객체 만료/재조회 방지)
+    rows = (db.session.query(*_PENDING_COLS)
+            .filter(Article.content_clean.is_(None))
+            .order_by(Article.id.desc())
+            .limit(batch_size)
+            .all())
+    if not rows:
+        return {"processed": 0, "duplicates": 0, "exact_duplicates": 0, "dropped_low_quality": 0}
+
+    index = _dup_index()
+    t0 = time.perf_counter()
+    stats = _process_rows(rows, workers, index)
+    if index is not None:
+        save_index()
+    elapsed = time.perf_counter() - t0
+    print(f"[preprocess] {stats['processed']} rows in {elapsed:.1f}s (workers={max(1, workers)})")
+    return stats
+
+
+# ---- 적체 처리: id 기준 keyset 페이지네이션 + 체크포인트 ----
+def _load_checkpoint() -> int:
+    try:
+        with open(settings.PREPROCESS_CHECKPOINT_PATH, encoding="utf-8") as f:
+            return int(json.load(f).get("last_id") or 0)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def _save_checkpoint(last_id: int, processed: int):
+    path = settings.PREPROCESS_CHECKPOINT_PATH
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"last_id": last_id, "processed": processed,
+                       "updated_at": datetime.utcnow().isoformat()}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[preprocess] ⚠️ checkpoint save error: {e}")
+
+
+def iter_pending_batches(batch_size: int, after_id: int = 0):
+    """
+    전처리 대상 기사를 id 오름차순 페이지로 순회 (OFFSET 없이 WHERE id > 마지막 id)
+    - 각 페이지는 (id, content_raw, summary_raw, title, source) 튜플 리스트
+    """
+    last_id = after_id
+    while True:
+        rows = (db.session.query(*_PENDING_COLS)
+                .filter(Article.content_clean.is_(None))
+                .filter(Article.id > last_id)
+                .order_by(Article.id)
+                .limit(batch_size)
+                .all())
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def preprocess_backlog(batch_size: int = 500, workers: int | None = None, resume: bool = True,
+                       max_batches: int | None = None) -> dict:
+    """
+    적체된 전처리 대상 전체를 오래된 것부터 스트리밍 처리
+    - 페이지마다 커밋 후 체크포인트(마지막 id) 기록 → 중단돼도 이어서 진행
+    - resume=False면 처음(id 0)부터 다시 훑음 (체크포인트 이전에 남은 행 회수용)
+    """
+    workers = settings.PREPROCESS_WORKERS if workers is None else workers
+    start_id = _load_checkpoint() if resume else 0
+    pending = (db.session.query(func.count(Article.id))
+               .filter(Article.content_clean.is_(None))
+               .filter(Article.id > start_id)
+               .scalar()) or 0
+    total = {"processed": 0, "duplicates": 0, "exact_duplicates": 0, "dropped_low_quality": 0}
+    if not pending:
+        return {**total, "last_id": start_id, "remaining": 0}
+
+    index = _dup_index()
+    last_id = start_id
+    t0 = time.perf_counter()
+    try:
+        for n, rows in enumerate(iter_pending_batches(batch_size, after_id=start_id), 1):
+            stats = _process_rows(rows, workers, index)
+            for k, v in stats.items():
+                total[k] += v
+            last_id = rows[-1][0]
+            _save_checkpoint(last_id, total["processed"])
+
+            elapsed = time.perf_counter() - t0
+            rate = total["processed"] / elapsed if elapsed > 0 else 0.0
+            print(f"[preprocess] backlog {total['processed']}/{pending} "
+                  f"(last id {last_id}, {rate:.0f} rows/s)")
+            if max_batches and n >= max_batches:
+                break
+    finally:
+        if index is not None:
+            save_index()
 
-    db.session.commit()
-    return {
-        "processed": processed,
-        "duplicates": duplicates,
-        "dropped_low_quality": dropped_low_quality
-    }
+    remaining = max(0, pending - total["processed"])
+    return {**total, "last_id": last_id, "remaining": remaining}
@@ -0,0 +1,247 @@
+import os
+import pickle
+import threading
+from itertools import combinations
+
+from sqlalchemy import cast, func
+from sqlalchemy.dialects.postgresql import BIT
+
+from shared.settings import settings
+from shared.db import db
+from apps.api.models import Article
+from services.preprocess.dedup import is_near_duplicate, to_signed64, to_unsigned64, _adaptive_threshold
+
+_FORMAT_VERSION = 2
+
+
+def _probe_masks(width: int, radius: int) -> list[int]:
+    """밴드 안에서 최대 radius 비트까지 뒤집어 볼 XOR 마스크 (0 = 정확히 일치)"""
+    masks = [0]
+    for r in range(1, radius + 1):
+        for bits in combinations(range(width), r):
+            m = 0
+            for b in bits:
+                m |= 1 << b
+            masks.append(m)
+    return masks
+
+
+def _band_layout(bands: int) -> list[tuple[int, int]]:
+    """64비트를 bands개 구간으로 분할 → [(shift, mask)]"""
+    bands = max(1, min(64, bands))
+    base, extra = divmod(64, bands)
+    out, shift = [], 0
+    for i in range(bands):
+        width = base + (1 if i < extra else 0)
+        out.append((shift, (1 << width) - 1))
+        shift += width
+    return out
+
+
+class SimHashIndex:
+    """
+    밴드(LSH) 기반 simhash 근접 중복 인덱스.
+    - 64비트를 b개 밴드로 나누고 밴드 값별 버킷에 기사 id 저장
+    - 조회 시 각 밴드에서 r비트 이내로 다른 버킷까지 탐색(multi-probe)
+    - 해밍 거리 d <= b*(r+1)-1 이면 누락 없음(비둘기집): 기본 b=4, r=2 → d<=11 완전 (임계값 최대 8 포함)
+    - 후보는 버킷에 든 것만 검사 → 전체 선형 탐색 대비 후보 수 ~ N * probes / 2^(64/b)
+    """
+
+    def __init__(self, bands: int | None = None, probe_radius: int | None = None):
+        self.bands = bands or settings.SIMHASH_BANDS
+        self.probe_radius = settings.SIMHASH_PROBE_RADIUS if probe_radius is None else probe_radius
+        self._layout = _band_layout(self.bands)
+        self._probes = [_probe_masks(mask.bit_length(), self.probe_radius) for _, mask in self._layout]
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in self._layout]
+        self._meta: dict[int, tuple[int, str]] = {}   # id → (hash, source)
+        self.max_id = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._meta)
+
+    def __getstate__(self):
+        st = self.__dict__.copy()
+        st.pop("_lock", None)
+        return st
+
+    def __setstate__(self, st):
+        self.__dict__.update(st)
+        self._lock = threading.RLock()
+
+    def _keys(self, h: int):
+        for i, (shift, mask) in enumerate(self._layout):
+            yield i, (h >> shift) & mask
+
+    def add(self, article_id: int, h: int, source: str | None = None):
+        if not h:
+            return
+        with self._lock:
+            if article_id in self._meta:
+                self.remove(article_id)
+            self._meta[article_id] = (h, source or "")
+            for i, key in self._keys(h):
+                self._buckets[i].setdefault(key, []).append(article_id)
+            if article_id > self.max_id:
+                self.max_id = article_id
+
+    def remove(self, article_id: int):
+        with self._lock:
+            meta = self._meta.pop(article_id, None)
+            if not meta:
+                return
+            for i, key in self._keys(meta[0]):
+                ids = self._buckets[i].get(key)
+                if ids:
+                    try:
+                        ids.remove(article_id)
+                    except ValueError:
+                        pass
+                    if not ids:
+                        del self._buckets[i][key]
+
+    def candidates(self, h: int) -> set[int]:
+        out: set[int] = set()
+        with self._lock:
+            for i, key in self._keys(h):
+                bucket = self._buckets[i]
+                for m in self._probes[i]:
+                    ids = bucket.get(key ^ m)
+                    if ids:
+                        out.update(ids)
+        return out
+
+    def find_duplicate(self, h: int, source: str | None = None, char_len: int | None = None,
+                       exclude_id: int | None = None) -> int | None:
+        """
+        근접 중복 대상 id (없으면 None)
+        - 기존 선형 탐색과 같은 우선순위: 같은 소스 → 글로벌, 각각 최신(id 큰) 순
+        """
+        if not h:
+            return None
+        src = source or ""
+        best_same, best_any = None, None
+        with self._lock:
+            for cid in self.candidates(h):
+                if cid == exclude_id:
+                    continue
+                ch, csrc = self._meta[cid]
+                if not is_near_duplicate(h, ch, char_len=char_len, base_threshold=None):
+                    continue
+                if csrc == src and (best_same is None or cid > best_same):
+                    best_same = cid
+                if best_any is None or cid > best_any:
+                    best_any = cid
+        return best_same if best_same is not None else best_any
+
+    # ---- 영속화 ----
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with self._lock:
+            with open(tmp, "wb") as f:
+                pickle.dump((_FORMAT_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, bands: int | None = None, probe_radius: int | None = None) -> "SimHashIndex | None":
+        try:
+            with open(path, "rb") as f:
+                ver, idx = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return None
+        if ver != _FORMAT_VERSION or not isinstance(idx, cls):
+            return None
+        if idx.bands != (bands or settings.SIMHASH_BANDS):
+            return None  # 밴드 설정이 바뀌면 재구성
+        radius = settings.SIMHASH_PROBE_RADIUS if probe_radius is None else probe_radius
+        if idx.probe_radius != radius:
+            idx.probe_radius = radius
+            idx._probes = [_probe_masks(mask.bit_length(), radius) for _, mask in idx._layout]
+        return idx
+
+    # ---- DB 동기화 ----
+    def _load_rows(self, q) -> int:
+        n = 0
+        for aid, sh, src in q.yield_per(5000):
+            self.add(aid, to_unsigned64(sh), src)
+            n += 1
+        return n
+
+    def sync(self) -> int:
+        """
+        DB와 동기화: 새 id만 증분 로드, 개수가 여전히 다르면 전체 재구성.
+        (ORM 객체 대신 (id, simhash64, source) 튜플만 조회)
+        """
+        base = (db.session.query(Article.id, Article.simhash64, Article.source)
+                .filter(Article.simhash64.isnot(None)))
+        total = base.count()
+        if total == len(self):
+            return 0
+        with self._lock:
+            n = self._load_rows(base.filter(Article.id > self.max_id).order_by(Article.id))
+            if total != len(self):
+                self._buckets = [{} for _ in self._layout]
+                self._meta.clear()
+                self.max_id = 0
+                n = self._load_rows(base.order_by(Article.id))
+        return n
+
+
+_index: SimHashIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> SimHashIndex:
+    """프로세스 공용 인덱스: 디스크 스냅샷 로드 → DB와 증분 동기화 (앱 컨텍스트 필요)"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SimHashIndex.load(settings.SIMHASH_INDEX_PATH) or SimHashIndex()
+        n = _index.sync()
+        if n:
+            print(f"[dedup] simhash index synced (+{n}, total {len(_index)})")
+        return _index
+
+
+def save_index():
+    if _index is None:
+        return
+    try:
+        _index.save(settings.SIMHASH_INDEX_PATH)
+    except OSError as e:
+        print(f"[dedup] ⚠️ simhash index save error: {e}")
+
+
+# ---- SQL 후보 검색 (bit_count 지원 DB) ----
+def sql_lookup_supported() -> bool:
+    return db.session.get_bind().dialect.name in ("postgresql", "mysql", "mariadb")
+
+
+def _hamming_expr(dialect: str, h: int):
+    if dialect == "postgresql":
+        # bigint XOR(#) → bit(64) → bit_count (PostgreSQL 14+)
+        return func.bit_count(cast(Article.simhash64.op("#")(h), BIT(64)))
+    return func.bit_count(Article.simhash64.op("^")(h))
+
+
+def sql_find_duplicate(h: int, source: str | None = None, char_len: int | None = None,
+                       exclude_id: int | None = None) -> int | None:
+    """find_duplicate와 같은 판정/우선순위를 DB에서 수행 (SQLite 등 미지원 DB에선 쓰지 않음)"""
+    if not h:
+        return None
+    dialect = db.session.get_bind().dialect.name
+    thr = _adaptive_threshold(char_len or 0)
+    q = (db.session.query(Article.id)
+         .filter(Article.simhash64.isnot(None))
+         .filter(Article.simhash64 != 0)
+         .filter(_hamming_expr(dialect, to_signed64(h)) <= thr))
+    if exclude_id is not None:
+        q = q.filter(Article.id != exclude_id)
+    # 같은 소스 우선: 인메모리 인덱스처럼 NULL 소스는 ""로 취급 (None ↔ NULL 소스끼리도 같은 소스)
+    # coalesce 덕분에 비교 결과가 NULL이 될 수 없어 DB별 NULL 정렬 순서와 무관
+    same_source = (func.coalesce(Article.source, "") == (source or "")).desc()
+    row = (q.order_by(same_source, Article.id.desc())
+           .limit(1)
+           .first())
+    return row[0] if row else None
@@ -0,0 +1,28 @@
+from services.preprocess.clean import clean_html_to_text
+from services.preprocess.boilerplate import looks_like_boilerplate, strip_boiler_leading_trailing
+from services.preprocess.dedup import simhash64_batch
+
+# 프로세스 풀에서 실행되는 순수 CPU 구간 (DB/앱 컨텍스트 없이 동작해야 함)
+# 입력/출력은 피클 가능한 기본 타입 튜플만 사용
+
+
+def prepare_text(raw: str | None) -> tuple[str, bool]:
+    """원문 → (정제 텍스트, 저품질 여부)"""
+    # 1) HTML -> 텍스트
+    cleaned = clean_html_to_text(raw) or ""
+    # 2) 보일러 앞/뒤 제거
+    cleaned, _ = strip_boiler_leading_trailing(cleaned)
+    # 3) 품질 가드레일(너무 짧거나 티저/페이월 등)
+    return cleaned, looks_like_boilerplate(cleaned)
+
+
+def prepare_chunk(rows: list[tuple[int, str | None, str | None]]) -> list[tuple[int, str, bool, int]]:
+    """
+    [(id, raw, title)] → [(id, cleaned, low_quality, simhash)]
+    - simhash(제목 가중)는 저품질이 아닌 기사만, 청크 단위로 한 번에 계산 (저품질은 0)
+    """
+    prepared = [(aid, title) + prepare_text(raw) for aid, raw, title in rows]
+    good = [(cleaned, title or "") for _, title, cleaned, low in prepared if not low]
+    hashes = iter(simhash64_batch(good))
+    return [(aid, cleaned, low, 0 if low else next(hashes))
+            for aid, title, cleaned, low in prepared]
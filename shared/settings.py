@@ -9,7 +9,83 @@ class Settings:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     TIMEZONE = os.getenv("TIMEZONE", "Asia/Seoul")
     FEEDS = [u.strip() for u in os.getenv("FEEDS", "").split(",") if u.strip()]
+
+    # 피드 동시 수집
+    FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "16"))
+    FETCH_PER_HOST = int(os.getenv("FETCH_PER_HOST", "2"))
+    FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "15"))
+    FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "30"))   # 피드 1개 전체 다운로드 상한(초)
+
+    # 실패 피드 circuit breaker
+    FEED_FAILURE_THRESHOLD = int(os.getenv("FEED_FAILURE_THRESHOLD", "2"))
+    FEED_BACKOFF_BASE_SEC = int(os.getenv("FEED_BACKOFF_BASE_SEC", "900"))
+    FEED_BACKOFF_MAX_SEC = int(os.getenv("FEED_BACKOFF_MAX_SEC", str(7 * 86400)))
+
+    # 수집 모드: adaptive(피드별 적응형 폴링) | daily(매일 07:30 일괄)
+    POLL_MODE = os.getenv("POLL_MODE", "adaptive").lower()
+    POLL_TICK_SEC = int(os.getenv("POLL_TICK_SEC", "60"))
+    POLL_MIN_SEC = int(os.getenv("POLL_MIN_SEC", "300"))
+    POLL_MAX_SEC = int(os.getenv("POLL_MAX_SEC", "86400"))
+    POLL_DEFAULT_SEC = int(os.getenv("POLL_DEFAULT_SEC", "3600"))
+    POLL_JITTER = float(os.getenv("POLL_JITTER", "0.1"))
+    POLL_MAX_FEEDS_PER_TICK = int(os.getenv("POLL_MAX_FEEDS_PER_TICK", "50"))
+
+    # 기사 본문 크롤러
+    CRAWL_ENABLED = os.getenv("CRAWL_ENABLED", "true").lower() in ("1", "true", "yes")
+    CRAWL_MAX_WORKERS = int(os.getenv("CRAWL_MAX_WORKERS", "8"))
+    CRAWL_DOMAIN_DELAY = float(os.getenv("CRAWL_DOMAIN_DELAY", "1.0"))
+    CRAWL_TIMEOUT = float(os.getenv("CRAWL_TIMEOUT", "15"))
+    CRAWL_MAX_BYTES = int(os.getenv("CRAWL_MAX_BYTES", str(2 * 1024 * 1024)))
+    CRAWL_BATCH_SIZE = int(os.getenv("CRAWL_BATCH_SIZE", "200"))
+
+    # HTML 정제 백엔드: bs4(html.parser, 기준) | lxml(빠름)
+    # lxml은 check_clean_golden.py(골든 코퍼스 동등성) + bench_clean.py 통과를 확인하고 켤 것
+    HTML_CLEAN_BACKEND = os.getenv("HTML_CLEAN_BACKEND", "bs4").lower()
+
+    # 전처리 병렬화: 워커 프로세스 수(1 = 현재 프로세스에서 실행), 청크 크기(= 커밋 단위)
+    PREPROCESS_WORKERS = int(os.getenv("PREPROCESS_WORKERS", "1"))
+    PREPROCESS_CHUNK_SIZE = int(os.getenv("PREPROCESS_CHUNK_SIZE", "50"))
+
+    # 파이프라인 상태 파일(Bloom filter 등) 저장 위치
+    STATE_DIR = os.getenv("STATE_DIR", "state")
+    SEEN_URL_BLOOM_PATH = os.getenv("SEEN_URL_BLOOM_PATH", os.path.join(STATE_DIR, "seen_urls.bloom"))
+    SEEN_URL_BLOOM_CAPACITY = int(os.getenv("SEEN_URL_BLOOM_CAPACITY", "1000000"))
+    SEEN_URL_BLOOM_ERROR = float(os.getenv("SEEN_URL_BLOOM_ERROR", "1e-6"))
+
+    # 근접 중복 simhash 밴드 인덱스 (밴드 b, 밴드 내 탐색 반경 r → 해밍 거리 b*(r+1)-1까지 누락 없음)
+    SIMHASH_BANDS = int(os.getenv("SIMHASH_BANDS", "4"))
+    SIMHASH_PROBE_RADIUS = int(os.getenv("SIMHASH_PROBE_RADIUS", "2"))  # b=4, r=2 → d<=11 (짧은 문서 임계값 8 포함)
+    SIMHASH_LOOKUP = os.getenv("SIMHASH_LOOKUP", "index").lower()   # index | sql(Postgres 14+/MySQL)
+    SIMHASH_INDEX_PATH = os.getenv("SIMHASH_INDEX_PATH", os.path.join(STATE_DIR, "simhash.index"))
+
+    # 적체 전처리 체크포인트(마지막 처리 id)
+    PREPROCESS_CHECKPOINT_PATH = os.getenv("PREPROCESS_CHECKPOINT_PATH",
+                                           os.path.join(STATE_DIR, "preprocess.checkpoint.json"))
     
+    # 요약/감성 모델 CPU 추론 백엔드: fp32 | int8(동적 양자화) | onnx(ONNX Runtime, optimum 필요)
+    INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "fp32").lower()
+    SUMMARY_BACKEND = os.getenv("SUMMARY_BACKEND", INFERENCE_BACKEND).lower()
+    SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", INFERENCE_BACKEND).lower()
+    ONNX_CACHE_DIR = os.getenv("ONNX_CACHE_DIR", os.path.join(STATE_DIR, "onnx"))
+    # 분석 실행 방식: thread(요약은 부모에서 배치, 번역/기자는 스레드) | process(워커 프로세스마다 모델 1회 로드)
+    ANALYZER_EXECUTOR = os.getenv("ANALYZER_EXECUTOR", "thread").lower()
+    ANALYZER_WORKERS = int(os.getenv("ANALYZER_WORKERS", "4"))
+    ANALYZER_TORCH_THREADS = int(os.getenv("ANALYZER_TORCH_THREADS", "0"))  # 0 = 코어 수 / 워커 수
+
+    # 토픽 모델: 온라인 LDA(partial_fit) 상태를 디스크에 유지, 토픽 id는 버전 간 매칭으로 안정화
+    TOPIC_NUM = int(os.getenv("TOPIC_NUM", "5"))
+    TOPIC_HASH_FEATURES = int(os.getenv("TOPIC_HASH_FEATURES", str(2 ** 16)))
+    TOPIC_MATCH_MIN_SIM = float(os.getenv("TOPIC_MATCH_MIN_SIM", "0.5"))  # 이보다 달라지면 새 토픽 id
+    TOPIC_STATE_PATH = os.getenv("TOPIC_STATE_PATH", os.path.join(STATE_DIR, "topics.pkl"))
+    # 앱 시작 시 미리 로드할 모델: summarizer,sentiment,keybert,spacy_en | all | (비우면 안 함)
+    MODEL_WARMUP = [m.strip().lower() for m in os.getenv("MODEL_WARMUP", "").split(",") if m.strip()]
+
+    # 요약 티어: 짧은 기사/지정 소스(통신사 등)는 추출 요약, 생성 요약(mBART)은 실행당 시간 예산 안에서만
+    SUMMARY_EXTRACTIVE_MAX_WORDS = int(os.getenv("SUMMARY_EXTRACTIVE_MAX_WORDS", "150"))
+    SUMMARY_EXTRACTIVE_SOURCES = [s.strip().lower() for s in os.getenv("SUMMARY_EXTRACTIVE_SOURCES", "").split(",")
+                                  if s.strip()]
+    SUMMARY_TIME_BUDGET_SEC = float(os.getenv("SUMMARY_TIME_BUDGET_SEC", "900"))  # 0 이하 = 무제한
+
     USER_PREFERENCES = [p.strip().lower() for p in os.getenv("USER_PREFERENCES", "").split(",") if p.strip()]
 
 settings = Settings()
@@ -0,0 +1,65 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from flask import Flask
+
+from shared.db import db
+
+
+@pytest.fixture
+def app():
+    """인메모리 SQLite 앱 (모델 테이블 생성, 앱 컨텍스트 안에서 테스트)"""
+    app = Flask("tests")
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    import apps.api.models  # noqa: F401  모델 등록
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def serve():
+    """
+    로컬 픽스처 HTTP 서버: serve({"/path": handler(req)}) → base URL
+    - handler(req)는 BaseHTTPRequestHandler를 받아 직접 응답을 씀, 없는 경로는 404
+    """
+    servers = []
+
+    def start(routes: dict):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fn = routes.get(self.path.split("?")[0])
+                if fn is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                fn(self)
+
+            def log_message(self, *args):
+                pass
+
+        srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        srv.daemon_threads = True
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return f"http://127.0.0.1:{srv.server_address[1]}"
+
+    yield start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
+def respond(req, body: bytes, content_type: str = "text/html", status: int = 200, headers: dict | None = None):
+    req.send_response(status)
+    if content_type:
+        req.send_header("Content-Type", content_type)
+    for k, v in (headers or {}).items():
+        req.send_header(k, v)
+    req.send_header("Content-Length", str(len(body)))
+    req.end_headers()
+    req.wfile.write(body)
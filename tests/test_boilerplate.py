@@ -0,0 +1,28 @@
+from services.preprocess.boilerplate import BoilerplateMatcher, matcher
+
+
+def test_scan_returns_overlapping_hits_from_every_rule():
+    text = "Markets rose. Read more about it. 자세히 보기"
+    hits = matcher.scan(text)
+    rules = [h.rule for h in hits]
+    # "Read more" 한 구간에 strip/flag/tail 규칙이 모두 걸림
+    assert {"strip_cta", "read_more", "tail_cta"} <= set(rules)
+    assert {"strip_ko", "see_more_ko", "tail_cta"} <= set(rules)
+    assert [h.start for h in hits] == sorted(h.start for h in hits)
+    assert all(text[h.start:h.end] == h.text for h in hits)
+
+
+def test_scan_kind_filter_and_search_agree():
+    text = "Here's what to know about the vote. Subscribe now"
+    assert {h.kind for h in matcher.scan(text, kinds=("flag",))} == {"flag"}
+    first = matcher.search(text, kinds=("flag",))
+    assert first is not None and first.start == 0
+
+
+def test_pattern_cache_is_bounded():
+    m = BoilerplateMatcher()
+    for i in range(len(m.rules)):
+        for j in range(i + 1, len(m.rules)):
+            m._pattern((i, j))
+    info = m._pattern.cache_info()
+    assert info.currsize <= info.maxsize
@@ -0,0 +1,46 @@
+from services.collector.crawler import Crawler, _extract_article_html
+from tests.conftest import respond
+
+KO_TEXT = "정부는 18일 올해 경제 성장률 전망치를 2.2%로 낮췄다고 밝혔다."
+
+
+def _page(meta: str = "") -> bytes:
+    return (f"<html><head>{meta}<title>기사</title></head><body><nav>메뉴</nav>"
+            f"<article><p>{KO_TEXT}</p></article></body></html>").encode("utf-8")
+
+
+def _fetch(base: str, path: str) -> str | None:
+    with Crawler(domain_delay=0, timeout=5) as c:
+        return c.fetch(base + path)
+
+
+def test_utf8_page_without_header_charset_uses_meta(serve):
+    base = serve({"/ko": lambda r: respond(r, _page('<meta charset="utf-8">'), "text/html")})
+    html = _fetch(base, "/ko")
+    assert KO_TEXT in html
+
+
+def test_utf8_page_without_any_declared_charset(serve):
+    base = serve({"/ko": lambda r: respond(r, _page(), "text/html")})
+    assert KO_TEXT in _fetch(base, "/ko")
+
+
+def test_header_charset_wins(serve):
+    body = _page('<meta charset="utf-8">').decode("utf-8").encode("euc-kr")
+    base = serve({"/ko": lambda r: respond(r, body, "text/html; charset=EUC-KR")})
+    assert KO_TEXT in _fetch(base, "/ko")
+
+
+def test_unknown_meta_charset_falls_back_to_utf8(serve):
+    base = serve({"/ko": lambda r: respond(r, _page('<meta charset="x-no-such">'), "text/html")})
+    assert KO_TEXT in _fetch(base, "/ko")
+
+
+def test_non_html_is_skipped(serve):
+    base = serve({"/f.pdf": lambda r: respond(r, b"%PDF-1.4", "application/pdf")})
+    assert _fetch(base, "/f.pdf") is None
+
+
+def test_extract_first_article_only():
+    html = "<nav>x</nav><article>first</article><aside>ads</aside><article>second</article><footer/>"
+    assert _extract_article_html(html) == "<article>first</article>"
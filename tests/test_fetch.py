@@ -0,0 +1,51 @@
+import gzip
+import time
+
+from services.collector.fetch import fetch_feeds
+from shared.settings import settings
+from tests.conftest import respond
+
+RSS = (b'<?xml version="1.0"?><rss version="2.0"><channel><title>F</title>'
+       b"<item><title>A</title><link>http://example.com/a</link></item>"
+       b"<item><title>B</title><link>http://example.com/b</link></item></channel></rss>")
+
+
+def _drip(chunked: bool):
+    def handler(req):
+        req.send_response(200)
+        req.send_header("Content-Type", "application/rss+xml")
+        if chunked:
+            req.send_header("Transfer-Encoding", "chunked")
+        else:
+            req.send_header("Content-Length", str(len(RSS)))
+        req.end_headers()
+        try:
+            for b in RSS:  # 0.1초마다 1바이트
+                piece = bytes([b])
+                req.wfile.write(b"1\r\n" + piece + b"\r\n" if chunked else piece)
+                req.wfile.flush()
+                time.sleep(0.1)
+            if chunked:
+                req.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            pass  # 클라이언트가 마감으로 끊음
+    return handler
+
+
+def test_fetch_parses_feed(serve):
+    base = serve({"/plain": lambda r: respond(r, RSS, "application/rss+xml"),
+                  "/gz": lambda r: respond(r, gzip.compress(RSS), "application/rss+xml",
+                                           headers={"Content-Encoding": "gzip"})})
+    res = fetch_feeds([base + "/plain", base + "/gz"])
+    assert [len(r.parsed.entries) for r in res] == [2, 2]
+
+
+def test_slow_drip_is_cut_at_deadline(serve, monkeypatch):
+    monkeypatch.setattr(settings, "FETCH_DEADLINE", 1.0)
+    base = serve({"/len": _drip(chunked=False), "/chunked": _drip(chunked=True)})
+    for path in ("/len", "/chunked"):
+        t0 = time.perf_counter()
+        [r] = fetch_feeds([base + path], timeout=5)
+        elapsed = time.perf_counter() - t0
+        assert r.error and "deadline" in r.error
+        assert elapsed < 2.0, f"{path}: held the worker for {elapsed:.1f}s"
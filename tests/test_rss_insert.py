@@ -0,0 +1,19 @@
+from apps.api.models import Article
+from services.collector.rss import _insert_articles
+from shared.db import db
+
+
+def _row(url: str) -> dict:
+    return {"url": url, "url_canonical": url, "title": "t", "source": "s", "lang": "auto"}
+
+
+def test_insert_count_excludes_conflicting_rows(app):
+    assert _insert_articles([_row("https://example.com/a")]) == 1
+    db.session.commit()
+    # a는 이미 있음 (동시 수집이 먼저 넣은 경우) → 건너뛴 행은 세지 않음
+    n = _insert_articles([_row("https://example.com/a"), _row("https://example.com/b"),
+                          _row("https://example.com/c")])
+    db.session.commit()
+    assert n == 2
+    assert Article.query.count() == 3
+    assert _insert_articles([]) == 0
@@ -0,0 +1,62 @@
+import pytest
+
+from apps.api.models import Article
+from services.collector import rss
+from shared.db import db
+from shared.settings import settings
+
+
+@pytest.fixture
+def seen_state(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SEEN_URL_BLOOM_PATH", str(tmp_path / "seen.bloom"))
+    monkeypatch.setattr(rss, "_seen", None)
+    monkeypatch.setattr(rss, "_seen_dirty", False)
+
+    def restart():
+        # 프로세스 재시작 흉내: 메모리의 필터를 버리고 파일에서 다시 로드
+        rss._persist_seen()
+        rss._seen = None
+        return rss._seen_urls()
+    return restart
+
+
+def _add(url: str):
+    db.session.add(Article(url=url, url_canonical=url, title="t"))
+    db.session.commit()
+
+
+def test_filter_file_reused_when_db_matches(seen_state):
+    _add("https://example.com/a")
+    rss._mark_seen(["https://example.com/only-in-filter"])
+    bf = seen_state()
+    # 재구성됐다면 DB에 없는 키는 사라짐 → 남아 있으면 파일을 그대로 쓴 것
+    assert "https://example.com/only-in-filter" in bf
+    assert "https://example.com/a" in bf
+
+
+def test_filter_rebuilt_after_db_reset(seen_state):
+    _add("https://example.com/a")
+    _add("https://example.com/b")
+    assert "https://example.com/a" in rss._seen_urls()
+    rss._persist_seen()
+
+    # DB 초기화 후 다른 기사 하나 → 상태 파일은 그대로
+    Article.query.delete()
+    db.session.commit()
+    _add("https://example.com/c")
+    rss._seen = None
+    bf = rss._seen_urls()
+    assert "https://example.com/a" not in bf
+    assert "https://example.com/c" in bf
+
+
+def test_filter_rebuilt_after_prune(seen_state):
+    _add("https://example.com/a")
+    _add("https://example.com/b")
+    rss._seen_urls()
+    rss._persist_seen()
+
+    Article.query.filter_by(url="https://example.com/a").delete()
+    db.session.commit()
+    rss._seen = None
+    assert "https://example.com/a" not in rss._seen_urls()
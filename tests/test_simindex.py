@@ -0,0 +1,33 @@
+import random
+
+from services.preprocess.dedup import hamming_distance64
+from services.preprocess.simindex import SimHashIndex
+
+
+def _flip(h: int, bits) -> int:
+    for b in bits:
+        h ^= 1 << b
+    return h
+
+
+def test_default_index_finds_every_pair_at_distance_8():
+    # 짧은 문서 임계값(8)까지는 선형 탐색과 같이 전부 찾아야 함 (밴드 경계에 몰린 비트 포함)
+    rng = random.Random(7)
+    idx = SimHashIndex()
+    base = [rng.getrandbits(64) for _ in range(2000)]
+    for i, h in enumerate(base, 1):
+        idx.add(i, h, "s")
+    for _ in range(2000):
+        j = rng.randrange(len(base))
+        q = _flip(base[j], rng.sample(range(64), 8))
+        assert hamming_distance64(q, base[j]) == 8
+        assert idx.find_duplicate(q, "s", char_len=0) == j + 1
+
+
+def test_distance_8_concentrated_in_one_band():
+    idx = SimHashIndex()
+    idx.add(1, 0x0123456789ABCDEF, "s")
+    q = _flip(0x0123456789ABCDEF, range(8))   # 8비트 모두 가장 아래 밴드 안
+    assert idx.find_duplicate(q, "s", char_len=0) == 1
+    q = _flip(0x0123456789ABCDEF, range(9))   # 9비트 → 짧은 문서 임계값 초과
+    assert idx.find_duplicate(q, "s", char_len=0) is None
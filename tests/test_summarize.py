@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("transformers")
+
+import services.analyzer.summarize as S  # noqa: E402
+
+
+class RecordingPipe:
+    """생성 인자를 기록하고, 결과 문장에 인자를 박아 넣는 스텁 (인자가 다르면 요약도 달라짐)"""
+
+    class tokenizer:
+        def __call__(self, xs, add_special_tokens=False):
+            return {"input_ids": [x.split() for x in xs]}
+
+    tokenizer = tokenizer()
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, x, batch_size=None, **kw):
+        xs = x if isinstance(x, list) else [x]
+        for t in xs:
+            self.calls.append((t, kw["max_new_tokens"], kw["min_length"]))
+        return [{"summary_text": f"{' '.join(t.split()[:3])} max {kw['max_new_tokens']} "
+                                 f"min {kw['min_length']}. Second. Third."} for t in xs]
+
+
+def _article(n_words: int, tag: str) -> str:
+    return " ".join(f"{tag}{i}." if i % 15 == 14 else f"{tag}{i}" for i in range(n_words))
+
+
+def test_summarize_many_matches_summarize(monkeypatch):
+    # 길이가 제각각인 기사 → 기사마다 max_new_tokens/min_length가 다름
+    texts = ["", "too short", _article(90, "a"), _article(120, "b"), _article(300, "c"),
+             _article(310, "d"), _article(650, "e"), _article(1500, "f")]
+    pipe = RecordingPipe()
+    monkeypatch.setattr(S, "get_summarizer", lambda: pipe)
+
+    single = [S.summarize(t) for t in texts]
+    single_kwargs = {(t, mx, mn) for t, mx, mn in pipe.calls}
+    pipe.calls.clear()
+
+    many = S.summarize_many(texts, batch_size=4, pipe=pipe)
+    assert many == single
+    assert {(t, mx, mn) for t, mx, mn in pipe.calls} == single_kwargs